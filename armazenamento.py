@@ -0,0 +1,208 @@
+"""
+Armazenamento em disco das tabelas pré-calculadas (distâncias, bancos de padrões).
+
+As tabelas são gravadas com um cabeçalho versionado e abertas com mmap:
+nada é lido ou convertido em objetos Python na importação, e os processos
+que abrem o mesmo arquivo compartilham as páginas do cache do sistema.
+
+Formato do arquivo (inteiros little-endian):
+    - cabeçalho fixo: mágico, versão, largura, altura, tamanho dos
+      metadados, tamanho dos dados e CRC32 dos dados
+    - estado objetivo (um byte por posição)
+    - metadados livres do tipo de tabela
+    - preenchimento até múltiplo de 8 bytes
+    - dados (um byte por entrada)
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from typing import Dict, List, Optional
+
+MAGICO = b"JOGOOITO"
+VERSAO_FORMATO = 1
+
+# mágico, versão, largura, altura, tamanho dos metadados, tamanho dos dados, crc32
+_FORMATO_CABECALHO = "<8sHBBHQI"
+_TAMANHO_CABECALHO = struct.calcsize(_FORMATO_CABECALHO)
+
+# Tabelas já abertas neste processo, por caminho absoluto
+_tabelas_abertas: Dict[str, "TabelaMapeada"] = {}
+
+
+def _calcular_inicio_dados(tamanho_objetivo: int, tamanho_metadados: int) -> int:
+    """Posição dos dados no arquivo, alinhada a 8 bytes."""
+    fim_cabecalho = _TAMANHO_CABECALHO + tamanho_objetivo + tamanho_metadados
+    return (fim_cabecalho + 7) // 8 * 8
+
+
+def escrever_tabela(
+    caminho_arquivo: str,
+    dados: bytes,
+    largura: int,
+    altura: int,
+    objetivo: List[int],
+    metadados: bytes = b"",
+):
+    """
+    Grava uma tabela com cabeçalho versionado.
+
+    O arquivo é escrito em um temporário e renomeado no final, então quem
+    estiver lendo a versão anterior nunca vê um arquivo pela metade.
+
+    Args:
+        caminho_arquivo: Arquivo de destino
+        dados: Conteúdo da tabela (um byte por entrada)
+        largura: Número de colunas do tabuleiro
+        altura: Número de linhas do tabuleiro
+        objetivo: Estado objetivo para o qual a tabela foi gerada
+        metadados: Informações extras do tipo de tabela
+    """
+    cabecalho = struct.pack(
+        _FORMATO_CABECALHO,
+        MAGICO,
+        VERSAO_FORMATO,
+        largura,
+        altura,
+        len(metadados),
+        len(dados),
+        zlib.crc32(dados),
+    )
+    inicio_dados = _calcular_inicio_dados(len(objetivo), len(metadados))
+    preenchimento = inicio_dados - _TAMANHO_CABECALHO - len(objetivo) - len(metadados)
+
+    diretorio = os.path.dirname(os.path.abspath(caminho_arquivo))
+    os.makedirs(diretorio, exist_ok=True)
+    caminho_temporario = f"{caminho_arquivo}.tmp{os.getpid()}"
+    with open(caminho_temporario, "wb") as arquivo:
+        arquivo.write(cabecalho)
+        arquivo.write(bytes(objetivo))
+        arquivo.write(metadados)
+        arquivo.write(b"\0" * preenchimento)
+        arquivo.write(dados)
+    os.replace(caminho_temporario, caminho_arquivo)
+
+
+class TabelaMapeada:
+    """
+    Tabela gravada por escrever_tabela e mapeada em memória somente leitura.
+
+    O acesso por índice lê direto das páginas mapeadas, sem copiar a tabela.
+    """
+
+    def __init__(self, caminho_arquivo: str, verificar: bool = True):
+        """
+        Abre e valida o arquivo da tabela.
+
+        Args:
+            caminho_arquivo: Arquivo gravado por escrever_tabela
+            verificar: Confere o CRC32 dos dados (lê o arquivo inteiro uma vez)
+
+        Raises:
+            ValueError: Se o arquivo não é uma tabela válida desta versão
+        """
+        self.caminho_arquivo = caminho_arquivo
+        with open(caminho_arquivo, "rb") as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mapa) < _TAMANHO_CABECALHO:
+            self.fechar()
+            raise ValueError(f"Arquivo de tabela truncado: {caminho_arquivo}")
+
+        (
+            magico,
+            versao,
+            self.largura,
+            self.altura,
+            tamanho_metadados,
+            tamanho_dados,
+            crc,
+        ) = struct.unpack_from(_FORMATO_CABECALHO, self._mapa, 0)
+
+        if magico != MAGICO or versao != VERSAO_FORMATO:
+            self.fechar()
+            raise ValueError(
+                f"Arquivo de tabela inválido ou de outra versão: {caminho_arquivo}"
+            )
+
+        tamanho_objetivo = self.largura * self.altura
+        inicio_metadados = _TAMANHO_CABECALHO + tamanho_objetivo
+        self.objetivo = list(self._mapa[_TAMANHO_CABECALHO:inicio_metadados])
+        self.metadados = self._mapa[
+            inicio_metadados : inicio_metadados + tamanho_metadados
+        ]
+
+        inicio_dados = _calcular_inicio_dados(tamanho_objetivo, tamanho_metadados)
+        if len(self._mapa) < inicio_dados + tamanho_dados:
+            self.fechar()
+            raise ValueError(f"Arquivo de tabela truncado: {caminho_arquivo}")
+
+        self._dados = memoryview(self._mapa)[inicio_dados : inicio_dados + tamanho_dados]
+
+        if verificar and zlib.crc32(self._dados) != crc:
+            self.fechar()
+            raise ValueError(f"Checksum inválido na tabela: {caminho_arquivo}")
+
+    def __getitem__(self, indice: int) -> int:
+        """Valor da entrada no índice informado."""
+        return self._dados[indice]
+
+    def __len__(self) -> int:
+        """Número de entradas da tabela."""
+        return len(self._dados)
+
+    def fechar(self):
+        """Libera o mapeamento do arquivo."""
+        dados = getattr(self, "_dados", None)
+        if dados is not None:
+            dados.release()
+            self._dados = None
+        self._mapa.close()
+
+
+def abrir_tabela(
+    caminho_arquivo: str,
+    largura: int,
+    altura: int,
+    objetivo: List[int],
+    verificar: bool = True,
+) -> Optional[TabelaMapeada]:
+    """
+    Abre uma tabela do disco, reaproveitando o mapeamento já aberto no processo.
+
+    Args:
+        caminho_arquivo: Arquivo gravado por escrever_tabela
+        largura: Número de colunas esperado
+        altura: Número de linhas esperado
+        objetivo: Estado objetivo esperado
+        verificar: Confere o CRC32 dos dados na primeira abertura
+
+    Returns:
+        A tabela mapeada, ou None se o arquivo não existe
+
+    Raises:
+        ValueError: Se o arquivo é inválido ou foi gerado para outro tabuleiro
+    """
+    chave = os.path.abspath(caminho_arquivo)
+    tabela = _tabelas_abertas.get(chave)
+
+    if tabela is None:
+        if not os.path.exists(chave):
+            return None
+        tabela = TabelaMapeada(chave, verificar=verificar)
+        _tabelas_abertas[chave] = tabela
+
+    mesmo_tamanho = (tabela.largura, tabela.altura) == (largura, altura)
+    if not mesmo_tamanho or tabela.objetivo != list(objetivo):
+        raise ValueError(
+            f"Tabela {caminho_arquivo} foi gerada para outro tabuleiro ou objetivo"
+        )
+    return tabela
+
+
+def fechar_tabelas():
+    """Fecha todas as tabelas abertas neste processo."""
+    for tabela in _tabelas_abertas.values():
+        tabela.fechar()
+    _tabelas_abertas.clear()
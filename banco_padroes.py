@@ -0,0 +1,237 @@
+"""
+Bancos de padrões aditivos (pattern databases) para tabuleiros maiores.
+
+As peças são divididas em grupos disjuntos. Para cada grupo, uma busca no
+espaço abstrato (só as peças do grupo e o espaço vazio são distinguíveis)
+calcula o número mínimo de movimentos DAS PEÇAS DO GRUPO para levá-las ao
+objetivo. Como cada movimento do tabuleiro move uma única peça, a soma dos
+valores dos grupos nunca superestima a distância real: a heurística é
+admissível e muito mais informada que a distância de Manhattan.
+
+As tabelas são geradas offline (scripts/gerar_tabelas.py) e abertas com
+mmap por armazenamento.py.
+"""
+
+import os
+import zlib
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+from especificacao import EspecificacaoPuzzle, ESPECIFICACAO_PADRAO, objetivo_padrao
+from permutacao import contar_arranjos, ranquear_arranjo
+from armazenamento import abrir_tabela, escrever_tabela
+
+# Valor das entradas ainda não alcançadas
+_NAO_ALCANCADO = 255
+
+# Partições padrão das peças por tamanho de tabuleiro (largura, altura)
+PARTICOES_PADRAO: Dict[Tuple[int, int], Tuple[Tuple[int, ...], ...]] = {
+    (3, 3): ((1, 2, 3, 4), (5, 6, 7, 8)),
+    (4, 4): ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4)),
+    (5, 5): (
+        (1, 2, 5, 6, 7, 12),
+        (3, 4, 8, 9, 13, 14),
+        (10, 11, 15, 16, 20, 21),
+        (17, 18, 19, 22, 23, 24),
+    ),
+}
+
+# Espaços abstratos até este tamanho são gerados na hora se o arquivo faltar
+LIMITE_GERACAO_IMEDIATA = 1_000_000
+
+DIRETORIO_DADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dados")
+
+
+def gerar_banco_padroes(
+    padrao: Sequence[int], especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO
+) -> bytearray:
+    """
+    Calcula o banco de padrões de um grupo de peças.
+
+    A busca é feita sobre as posições das peças do grupo mais a do espaço
+    vazio. Trocar o vazio com uma peça fora do grupo custa 0 e com uma peça
+    do grupo custa 1 (busca em amplitude 0-1). O valor guardado para cada
+    posição das peças do grupo é o mínimo entre todas as posições do vazio.
+
+    Args:
+        padrao: Peças do grupo
+        especificacao: Dimensões e objetivo do tabuleiro
+
+    Returns:
+        Tabela indexada por ranquear_arranjo(posições das peças do grupo)
+    """
+    n = especificacao.tamanho
+    k = len(padrao)
+    vizinhos = especificacao.vizinhos
+    posicoes_objetivo = especificacao.posicoes_objetivo
+
+    distancias = bytearray([_NAO_ALCANCADO]) * contar_arranjos(n, k + 1)
+    tabela = bytearray([_NAO_ALCANCADO]) * contar_arranjos(n, k)
+
+    inicial = tuple(posicoes_objetivo[peca] for peca in padrao) + (
+        especificacao.indice_vazio_objetivo,
+    )
+    distancias[ranquear_arranjo(inicial, n)] = 0
+    fila = deque([(inicial, 0)])
+
+    while fila:
+        posicoes, custo = fila.popleft()
+        if custo > distancias[ranquear_arranjo(posicoes, n)]:
+            continue  # Entrada superada por um caminho mais barato
+
+        indice_padrao = ranquear_arranjo(posicoes[:k], n)
+        if custo < tabela[indice_padrao]:
+            tabela[indice_padrao] = custo
+
+        indice_vazio = posicoes[k]
+        for _, indice_troca in vizinhos[indice_vazio]:
+            novas_posicoes = list(posicoes)
+            novas_posicoes[k] = indice_troca
+            if indice_troca in posicoes:
+                # Move uma peça do grupo para onde estava o vazio
+                novas_posicoes[posicoes.index(indice_troca)] = indice_vazio
+                novo_custo = custo + 1
+            else:
+                novo_custo = custo
+
+            novas_posicoes = tuple(novas_posicoes)
+            indice = ranquear_arranjo(novas_posicoes, n)
+            if novo_custo < distancias[indice]:
+                distancias[indice] = novo_custo
+                if novo_custo == custo:
+                    fila.appendleft((novas_posicoes, novo_custo))
+                else:
+                    fila.append((novas_posicoes, novo_custo))
+
+    return tabela
+
+
+def caminho_banco_padroes(
+    padrao: Sequence[int], especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO
+) -> str:
+    """
+    Arquivo padrão do banco de padrões de um grupo de peças.
+
+    Objetivos diferentes do padrão recebem um sufixo próprio no nome, para
+    não sobrescreverem o banco do objetivo padrão.
+    """
+    largura, altura = especificacao.largura, especificacao.altura
+    nome = "-".join(str(peca) for peca in padrao)
+    if tuple(especificacao.objetivo) != objetivo_padrao(largura, altura):
+        nome += f"_{zlib.crc32(bytes(especificacao.objetivo)):08x}"
+    return os.path.join(DIRETORIO_DADOS, f"padroes_{largura}x{altura}_{nome}.bin")
+
+
+def salvar_banco_padroes(
+    tabela: bytearray,
+    padrao: Sequence[int],
+    especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO,
+    caminho_arquivo: Optional[str] = None,
+):
+    """
+    Grava o banco de padrões em disco; as peças do grupo vão nos metadados.
+
+    Args:
+        tabela: Tabela gerada por gerar_banco_padroes
+        padrao: Peças do grupo
+        especificacao: Dimensões e objetivo do tabuleiro
+        caminho_arquivo: Arquivo de destino (usa o caminho padrão se omitido)
+    """
+    if caminho_arquivo is None:
+        caminho_arquivo = caminho_banco_padroes(padrao, especificacao)
+    escrever_tabela(
+        caminho_arquivo,
+        tabela,
+        especificacao.largura,
+        especificacao.altura,
+        especificacao.objetivo,
+        bytes(padrao),
+    )
+
+
+class HeuristicaPadroes:
+    """Soma dos bancos de padrões de grupos disjuntos de peças."""
+
+    def __init__(self, padroes: Sequence[Sequence[int]], tabelas: Sequence, n: int):
+        """
+        Inicializa a heurística.
+
+        Args:
+            padroes: Grupos disjuntos de peças
+            tabelas: Tabela de cada grupo (bytearray ou TabelaMapeada)
+            n: Número de posições do tabuleiro
+        """
+        self.padroes = [tuple(padrao) for padrao in padroes]
+        self.tabelas = list(tabelas)
+        self.n = n
+
+    def __call__(self, tabuleiro: List[int]) -> int:
+        """
+        Calcula a heurística para o tabuleiro.
+
+        Args:
+            tabuleiro: Lista representando o tabuleiro atual
+
+        Returns:
+            Soma dos valores de cada grupo
+        """
+        posicoes = [0] * self.n
+        for indice, valor in enumerate(tabuleiro):
+            posicoes[valor] = indice
+
+        total = 0
+        for padrao, tabela in zip(self.padroes, self.tabelas):
+            total += tabela[ranquear_arranjo([posicoes[peca] for peca in padrao], self.n)]
+        return total
+
+
+# Heurísticas já carregadas neste processo, por especificação
+_heuristicas_carregadas: Dict[EspecificacaoPuzzle, HeuristicaPadroes] = {}
+
+
+def obter_heuristica_padroes(
+    especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO,
+) -> HeuristicaPadroes:
+    """
+    Carrega os bancos de padrões da partição padrão do tabuleiro.
+
+    Cada grupo é aberto do disco com mmap. Se o arquivo não existir e o
+    espaço abstrato for pequeno, o banco é gerado em memória.
+
+    Args:
+        especificacao: Dimensões e objetivo do tabuleiro
+
+    Returns:
+        Heurística pronta para uso
+
+    Raises:
+        ValueError: Se não há partição padrão para o tamanho do tabuleiro
+        FileNotFoundError: Se um banco grande não foi gerado offline
+    """
+    heuristica = _heuristicas_carregadas.get(especificacao)
+    if heuristica is not None:
+        return heuristica
+
+    largura, altura = especificacao.largura, especificacao.altura
+    padroes = PARTICOES_PADRAO.get((largura, altura))
+    if padroes is None:
+        raise ValueError(f"Sem partição de bancos de padrões para {largura}x{altura}")
+
+    n = especificacao.tamanho
+    tabelas = []
+    for padrao in padroes:
+        caminho_arquivo = caminho_banco_padroes(padrao, especificacao)
+        tabela = abrir_tabela(
+            caminho_arquivo, largura, altura, especificacao.objetivo
+        )
+        if tabela is None:
+            if contar_arranjos(n, len(padrao) + 1) > LIMITE_GERACAO_IMEDIATA:
+                raise FileNotFoundError(
+                    f"Banco de padrões ausente: {caminho_arquivo}. "
+                    "Gere-o com: python scripts/gerar_tabelas.py"
+                )
+            tabela = gerar_banco_padroes(padrao, especificacao)
+        tabelas.append(tabela)
+
+    heuristica = HeuristicaPadroes(padroes, tabelas, n)
+    _heuristicas_carregadas[especificacao] = heuristica
+    return heuristica
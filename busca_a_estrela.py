@@ -4,16 +4,43 @@ Método de busca informado que usa heurística.
 """
 
 import time
-import heapq
-from typing import List
-from estado_puzzle import EstadoPuzzle
+from typing import Dict, List, Optional
+from especificacao import EspecificacaoPuzzle
+from estado_puzzle import EstadoCompacto
 from jogo_oito import JogoOito
 from heuristica import calcular_heuristica
+from instrumentacao import MedicaoBusca, ObservadorBusca
+from conjunto_visitados import TabelaPais, criar_tabela_pais, medidor_memoria
+from fila_prioridade import FILA_BALDES, FILA_HEAP, criar_fila
+from tabela_pais import (
+    BITS_MOVIMENTO,
+    CODIGOS_MOVIMENTO,
+    MASCARA_MOVIMENTO,
+    NOMES_MOVIMENTO,
+    SEM_MOVIMENTO,
+    reconstruir_caminho,
+)
+from limites import (
+    PARADA_ESGOTADA,
+    PARADA_INSOLUVEL,
+    PARADA_SOLUCAO,
+    ControleParada,
+    FuncaoProgresso,
+    LimitesBusca,
+)
 from busca_amplitude import ResultadoBusca, imprimir_resultado
 
 
 def buscar_solucao_a_estrela(
-    estado_inicial: List[int], metodo_heuristica: str = "manhattan"
+    estado_inicial: List[int],
+    metodo_heuristica: str = "manhattan",
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+    progresso: Optional[FuncaoProgresso] = None,
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+    visitados: Optional[str] = None,
+    fila: Optional[str] = None,
+    peso: float = 1,
 ) -> ResultadoBusca:
     """
     Realiza busca A* para encontrar solução do Jogo dos Oito.
@@ -21,40 +48,108 @@ def buscar_solucao_a_estrela(
     O algoritmo A* combina o custo real (g) com uma heurística (h)
     usando f(n) = g(n) + h(n) para escolher o próximo nó a expandir.
 
+    O menor g conhecido de cada estado fica guardado: um estado alcançado de
+    novo por um caminho mais curto é reaberto, e o objetivo só é aceito ao
+    sair da fila. Assim a solução é ótima com qualquer heurística admissível,
+    mesmo inconsistente.
+
+    Com peso w > 1 a busca usa f(n) = g(n) + w·h(n) (A* ponderado): expande
+    bem menos nós, e a solução custa no máximo w vezes a ótima.
+
     Args:
         estado_inicial: Estado inicial do tabuleiro
-        metodo_heuristica: Método de heurística ('manhattan' ou 'pecas_fora')
+        metodo_heuristica: Método de heurística (veja heuristica.FUNCOES_HEURISTICA)
+        especificacao: Dimensões e objetivo do tabuleiro (deduzida do
+            tamanho do tabuleiro se omitida)
+        progresso: Função chamada a cada limites.INTERVALO_VERIFICACAO nós
+            expandidos com (nós expandidos, tamanho da fronteira, profundidade
+            atual); se devolver False a busca é cancelada
+        limites: Limites de nós, memória e tempo e token de cancelamento;
+            ao atingir um deles a busca para com o resultado parcial
+        observador: Recebe amostras periódicas da busca (veja instrumentacao.py)
+        visitados: Estrutura da tabela de estados visitados, um de
+            conjunto_visitados.TIPOS_VISITADOS (padrão: dicionário); as
+            compactas usam bem menos memória, mas deixam a busca mais lenta
+            e limitam o custo do caminho a 8191 (veja
+            conjunto_visitados.VALOR_MAXIMO_PADRAO)
+        fila: Estrutura da fronteira, um de fila_prioridade.TIPOS_FILA
+            (padrão: baldes, que desempata pelo maior g; heap se o peso não
+            for inteiro)
+        peso: Peso da heurística, pelo menos 1
 
     Returns:
         ResultadoBusca com informações da busca
+
+    Raises:
+        ValueError: Se o peso é menor que 1, ou não é inteiro com fila de
+            baldes, se o tabuleiro não é uma permutação de 0..n-1, ou se
+            um custo passa do limite da tabela de visitados compacta
     """
+    if peso < 1:
+        raise ValueError(f"O peso da heurística deve ser pelo menos 1: {peso}")
+    if float(peso).is_integer():
+        # Peso inteiro mantém f inteiro, como a fila de baldes exige
+        peso = int(peso)
+    elif fila is None:
+        fila = FILA_HEAP
+    elif fila == FILA_BALDES:
+        raise ValueError(f"A fila de baldes exige peso inteiro: {peso}")
+
     resultado = ResultadoBusca()
     inicio_tempo = time.time()
 
-    jogo = JogoOito(estado_inicial)
-    estado_inicial_puzzle = EstadoPuzzle(tabuleiro=estado_inicial)
-
-    # Calcula heurística inicial
-    estado_inicial_puzzle.heuristica = calcular_heuristica(
-        estado_inicial_puzzle, metodo_heuristica
-    )
-    estado_inicial_puzzle.f = (
-        estado_inicial_puzzle.custo + estado_inicial_puzzle.heuristica
+    jogo = JogoOito(estado_inicial, especificacao)
+    jogo.exigir_estado_valido(estado_inicial)
+    estado_inicial_compacto = EstadoCompacto.de_tabuleiro(
+        estado_inicial, jogo.especificacao
     )
 
+    # Rejeita estados insolúveis antes de qualquer expansão
+    if not jogo.eh_soluvel(estado_inicial):
+        resultado.soluvel = False
+        resultado.motivo_parada = PARADA_INSOLUVEL
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
+
     # Verifica se já é o estado objetivo
-    if estado_inicial_puzzle.eh_objetivo():
+    if estado_inicial_compacto.eh_objetivo():
         resultado.solucao_encontrada = True
         resultado.profundidade_solucao = 0
+        resultado.motivo_parada = PARADA_SOLUCAO
         resultado.tempo_execucao = time.time() - inicio_tempo
         return resultado
 
-    # Fila de prioridade (heap) para A*
-    # Usa (f, contador, estado) para garantir ordenação estável
-    contador = 0
-    fila_prioridade = [(estado_inicial_puzzle.f, contador, estado_inicial_puzzle)]
-    estados_visitados = set()
-    estados_visitados.add(estado_inicial_puzzle._chave)
+    # Calcula heurística inicial (g = 0)
+    f_inicial = peso * calcular_heuristica(estado_inicial_compacto, metodo_heuristica)
+
+    # Fila de prioridade por f (veja fila_prioridade.py)
+    fila_prioridade = criar_fila(fila)
+    fila_prioridade.inserir(f_inicial, 0, estado_inicial_compacto)
+
+    # Tabela de pais com o menor custo conhecido de cada estado:
+    # código -> (g << BITS_MOVIMENTO) | código do movimento (veja tabela_pais.py).
+    # Um estado alcançado de novo com g menor tem o pai e o custo trocados e
+    # volta à fila, mesmo que já tenha sido expandido (reabertura); a entrada
+    # antiga continua na fila e é descartada quando sai (remoção preguiçosa).
+    pais: TabelaPais = criar_tabela_pais(jogo.especificacao, visitados)
+    pais[estado_inicial_compacto.codigo] = SEM_MOVIMENTO
+    # As tabelas compactas informam a memória que ocupam de fato
+    memoria_pais = medidor_memoria(pais)
+    controle = ControleParada(
+        limites,
+        progresso,
+        observador.intervalo if observador is not None else None,
+        memoria_pais,
+    )
+    proxima_verificacao = controle.proxima_verificacao
+
+    # Instrumentação: só mede tempos e conta os valores de f na fronteira
+    # quando há um observador
+    medicao = MedicaoBusca(observador, memoria_pais) if observador is not None else None
+    duplicados = 0
+    tempo_heuristica = 0.0
+    tempo_geracao = 0.0
+    contagem_f: Dict[int, int] = {f_inicial: 1}
 
     while fila_prioridade:
         # Atualiza tamanho máximo da fronteira
@@ -62,60 +157,108 @@ def buscar_solucao_a_estrela(
             resultado.tamanho_maximo_fronteira = len(fila_prioridade)
 
         # Remove o estado com menor f (prioridade)
-        _, _, estado_atual = heapq.heappop(fila_prioridade)
+        f_atual, custo, estado_atual = fila_prioridade.retirar()
+        if medicao is not None:
+            contagem_f[f_atual] -= 1
+
+        # Entrada obsoleta: o estado foi alcançado depois com custo menor
+        entrada = pais[estado_atual.codigo]
+        if custo > entrada >> BITS_MOVIMENTO:
+            continue
+
+        # O objetivo é testado ao sair da fila: com heurística admissível,
+        # nenhum nó que ainda está na fila leva a um caminho mais curto
+        if estado_atual.eh_objetivo():
+            resultado.solucao_encontrada = True
+            resultado.profundidade_solucao = custo
+
+            # Reconstrói o caminho
+            resultado.caminho = reconstruir_caminho(
+                pais, estado_atual.codigo, estado_atual.indice_vazio, jogo.especificacao
+            )
+            resultado.motivo_parada = PARADA_SOLUCAO
+            break
+
+        heuristica_atual = f_atual - custo
+        if peso != 1:
+            heuristica_atual = round(heuristica_atual / peso)
         resultado.nos_expandidos += 1
 
         # Atualiza profundidade máxima
-        if estado_atual.profundidade > resultado.profundidade_maxima:
-            resultado.profundidade_maxima = estado_atual.profundidade
-
-        # Gera filhos
-        filhos = jogo.gerar_filhos(estado_atual)
-
-        for filho in filhos:
-            # Verifica se é o objetivo
-            if filho.eh_objetivo():
-                resultado.solucao_encontrada = True
-                resultado.profundidade_solucao = filho.profundidade
-
-                # Reconstrói o caminho
-                resultado.caminho = _reconstruir_caminho(filho)
-                resultado.tempo_execucao = time.time() - inicio_tempo
-                return resultado
-
-            # Calcula heurística para o filho
-            filho.heuristica = calcular_heuristica(filho, metodo_heuristica)
-            filho.f = filho.custo + filho.heuristica
-
-            # Adiciona à fila se não foi visitado
-            if filho._chave not in estados_visitados:
-                estados_visitados.add(filho._chave)
-                contador += 1
-                heapq.heappush(fila_prioridade, (filho.f, contador, filho))
-
-    # Não encontrou solução (não deveria acontecer para o Jogo dos Oito)
-    resultado.tempo_execucao = time.time() - inicio_tempo
-    return resultado
+        if custo > resultado.profundidade_maxima:
+            resultado.profundidade_maxima = custo
 
+        if resultado.nos_expandidos >= proxima_verificacao:
+            if medicao is not None:
+                medicao.amostrar(
+                    resultado.nos_expandidos,
+                    len(pais),
+                    len(fila_prioridade),
+                    custo,
+                    duplicados,
+                    tempo_heuristica,
+                    tempo_geracao,
+                    {f: n for f, n in contagem_f.items() if n},
+                )
+            motivo = controle.verificar(
+                resultado.nos_expandidos, len(pais), len(fila_prioridade), custo
+            )
+            proxima_verificacao = controle.proxima_verificacao
+            if motivo is not None:
+                resultado.motivo_parada = motivo
+                break
 
-def _reconstruir_caminho(estado_final: EstadoPuzzle) -> List[str]:
-    """
-    Reconstrói o caminho do estado inicial até o estado final.
+        # Gera filhos (sem desfazer o movimento que gerou o estado)
+        movimento_anterior = NOMES_MOVIMENTO[entrada & MASCARA_MOVIMENTO]
+        if medicao is not None:
+            inicio_geracao = time.perf_counter()
+            filhos = jogo.gerar_filhos_compactos(estado_atual, movimento_anterior)
+            tempo_geracao += time.perf_counter() - inicio_geracao
+        else:
+            filhos = jogo.gerar_filhos_compactos(estado_atual, movimento_anterior)
 
-    Args:
-        estado_final: Estado objetivo encontrado
+        custo_filho = custo + 1
+        for movimento, filho in filhos:
+            # Descarta o filho se ele já foi alcançado com custo menor ou igual
+            entrada_filho = pais.get(filho.codigo)
+            if entrada_filho is not None and entrada_filho >> BITS_MOVIMENTO <= custo_filho:
+                duplicados += 1
+                continue
+            pais[filho.codigo] = (custo_filho << BITS_MOVIMENTO) | CODIGOS_MOVIMENTO[
+                movimento
+            ]
 
-    Returns:
-        Lista de movimentos do estado inicial ao final
-    """
-    caminho = []
-    estado_atual = estado_final
-
-    while estado_atual.estado_pai is not None:
-        caminho.insert(0, estado_atual.movimento)
-        estado_atual = estado_atual.estado_pai
+            # Calcula heurística para o filho a partir da heurística do pai
+            if medicao is not None:
+                inicio_heuristica = time.perf_counter()
+                f_filho = custo_filho + peso * calcular_heuristica(
+                    filho, metodo_heuristica, heuristica_atual, estado_atual.indice_vazio
+                )
+                tempo_heuristica += time.perf_counter() - inicio_heuristica
+                contagem_f[f_filho] = contagem_f.get(f_filho, 0) + 1
+            else:
+                f_filho = custo_filho + peso * calcular_heuristica(
+                    filho, metodo_heuristica, heuristica_atual, estado_atual.indice_vazio
+                )
+            fila_prioridade.inserir(f_filho, custo_filho, filho)
+    else:
+        # Não encontrou solução (não deveria acontecer para estados solúveis)
+        resultado.motivo_parada = PARADA_ESGOTADA
 
-    return caminho
+    resultado.tempo_execucao = time.time() - inicio_tempo
+    if medicao is not None:
+        medicao.amostrar(
+            resultado.nos_expandidos,
+            len(pais),
+            len(fila_prioridade),
+            resultado.profundidade_maxima,
+            duplicados,
+            tempo_heuristica,
+            tempo_geracao,
+            {f: n for f, n in contagem_f.items() if n},
+            resultado,
+        )
+    return resultado
 
 
 def imprimir_resultado_a_estrela(
@@ -131,6 +274,10 @@ def imprimir_resultado_a_estrela(
         print(f"✓ Solução encontrada!")
         print(f"Caminho: {resultado.caminho}")
         print(f"Número de movimentos: {len(resultado.caminho)}")
+    elif not resultado.soluvel:
+        print("✗ Estado insolúvel (paridade de inversões diferente do objetivo)")
+    elif resultado.motivo_parada not in (None, PARADA_ESGOTADA):
+        print(f"✗ Busca interrompida ({resultado.motivo_parada})")
     else:
         print("✗ Solução não encontrada")
 
@@ -5,9 +5,21 @@ Método de busca cego/não informado.
 
 import time
 from collections import deque
-from typing import List, Optional, Tuple
-from estado_puzzle import EstadoPuzzle
+from typing import List, Optional
+from especificacao import EspecificacaoPuzzle
+from estado_puzzle import EstadoCompacto
 from jogo_oito import JogoOito
+from instrumentacao import MedicaoBusca, ObservadorBusca
+from conjunto_visitados import TabelaPais, criar_tabela_pais, medidor_memoria
+from tabela_pais import CODIGOS_MOVIMENTO, NOMES_MOVIMENTO, SEM_MOVIMENTO, reconstruir_caminho
+from limites import (
+    PARADA_ESGOTADA,
+    PARADA_INSOLUVEL,
+    PARADA_SOLUCAO,
+    ControleParada,
+    FuncaoProgresso,
+    LimitesBusca,
+)
 
 
 class ResultadoBusca:
@@ -15,6 +27,9 @@ class ResultadoBusca:
 
     def __init__(self):
         self.solucao_encontrada = False
+        self.soluvel = True
+        # Por que a busca parou (uma das constantes PARADA_* de limites.py)
+        self.motivo_parada: Optional[str] = None
         self.caminho = []
         self.nos_expandidos = 0
         self.profundidade_solucao = 0
@@ -23,7 +38,14 @@ class ResultadoBusca:
         self.tempo_execucao = 0.0
 
 
-def buscar_solucao_amplitude(estado_inicial: List[int]) -> ResultadoBusca:
+def buscar_solucao_amplitude(
+    estado_inicial: List[int],
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+    progresso: Optional[FuncaoProgresso] = None,
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+    visitados: Optional[str] = None,
+) -> ResultadoBusca:
     """
     Realiza busca em amplitude (BFS) para encontrar solução do Jogo dos Oito.
 
@@ -32,85 +54,164 @@ def buscar_solucao_amplitude(estado_inicial: List[int]) -> ResultadoBusca:
 
     Args:
         estado_inicial: Estado inicial do tabuleiro
+        especificacao: Dimensões e objetivo do tabuleiro (deduzida do
+            tamanho do tabuleiro se omitida)
+        progresso: Função chamada a cada limites.INTERVALO_VERIFICACAO nós
+            expandidos com (nós expandidos, tamanho da fronteira, profundidade
+            atual); se devolver False a busca é cancelada
+        limites: Limites de nós, memória e tempo e token de cancelamento;
+            ao atingir um deles a busca para com o resultado parcial
+        observador: Recebe amostras periódicas da busca (veja instrumentacao.py)
+        visitados: Estrutura da tabela de estados visitados, um de
+            conjunto_visitados.TIPOS_VISITADOS (padrão: dicionário); as
+            compactas usam bem menos memória, mas deixam a busca mais lenta
 
     Returns:
         ResultadoBusca com informações da busca
+
+    Raises:
+        ValueError: Se o tabuleiro não é uma permutação de 0..n-1
     """
     resultado = ResultadoBusca()
     inicio_tempo = time.time()
 
-    jogo = JogoOito(estado_inicial)
-    estado_inicial_puzzle = EstadoPuzzle(tabuleiro=estado_inicial)
+    jogo = JogoOito(estado_inicial, especificacao)
+    jogo.exigir_estado_valido(estado_inicial)
+    estado_inicial_compacto = EstadoCompacto.de_tabuleiro(
+        estado_inicial, jogo.especificacao
+    )
+
+    # Rejeita estados insolúveis antes de qualquer expansão
+    if not jogo.eh_soluvel(estado_inicial):
+        resultado.soluvel = False
+        resultado.motivo_parada = PARADA_INSOLUVEL
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
 
     # Verifica se já é o estado objetivo
-    if estado_inicial_puzzle.eh_objetivo():
+    if estado_inicial_compacto.eh_objetivo():
         resultado.solucao_encontrada = True
         resultado.profundidade_solucao = 0
+        resultado.motivo_parada = PARADA_SOLUCAO
         resultado.tempo_execucao = time.time() - inicio_tempo
         return resultado
 
     # Fila para BFS (FIFO)
-    fila = deque([estado_inicial_puzzle])
-    estados_visitados = set()
-    estados_visitados.add(estado_inicial_puzzle._chave)
+    fila = deque([estado_inicial_compacto])
+
+    # Tabela de pais: código do estado -> código do movimento que o gerou
+    # (veja tabela_pais.py). Também serve como conjunto de estados visitados.
+    pais: TabelaPais = criar_tabela_pais(jogo.especificacao, visitados, SEM_MOVIMENTO)
+    pais[estado_inicial_compacto.codigo] = SEM_MOVIMENTO
+
+    # A fila é processada nível a nível, então a profundidade de cada nó
+    # é a do nível atual e não precisa ser guardada no próprio nó.
+    profundidade = 0
+    # As tabelas compactas informam a memória que ocupam de fato
+    memoria_pais = medidor_memoria(pais)
+    controle = ControleParada(
+        limites,
+        progresso,
+        observador.intervalo if observador is not None else None,
+        memoria_pais,
+    )
+    proxima_verificacao = controle.proxima_verificacao
+
+    # Instrumentação: só mede tempos quando há um observador
+    medicao = MedicaoBusca(observador, memoria_pais) if observador is not None else None
+    duplicados = 0
+    tempo_geracao = 0.0
 
     while fila:
-        # Atualiza tamanho máximo da fronteira
-        if len(fila) > resultado.tamanho_maximo_fronteira:
-            resultado.tamanho_maximo_fronteira = len(fila)
-
-        # Remove o primeiro da fila (FIFO)
-        estado_atual = fila.popleft()
-        resultado.nos_expandidos += 1
-
-        # Atualiza profundidade máxima
-        if estado_atual.profundidade > resultado.profundidade_maxima:
-            resultado.profundidade_maxima = estado_atual.profundidade
-
-        # Gera filhos
-        filhos = jogo.gerar_filhos(estado_atual)
-
-        for filho in filhos:
-            # Verifica se é o objetivo
-            if filho.eh_objetivo():
-                resultado.solucao_encontrada = True
-                resultado.profundidade_solucao = filho.profundidade
-
-                # Reconstrói o caminho
-                resultado.caminho = _reconstruir_caminho(filho)
-                resultado.tempo_execucao = time.time() - inicio_tempo
-                return resultado
-
-            # Adiciona à fila se não foi visitado
-            if filho._chave not in estados_visitados:
-                estados_visitados.add(filho._chave)
+        resultado.profundidade_maxima = profundidade
+
+        tamanho_nivel = len(fila)
+        for posicao in range(tamanho_nivel):
+            # Atualiza tamanho máximo da fronteira
+            if len(fila) > resultado.tamanho_maximo_fronteira:
+                resultado.tamanho_maximo_fronteira = len(fila)
+
+            # Remove o primeiro da fila (FIFO)
+            estado_atual = fila.popleft()
+            resultado.nos_expandidos += 1
+
+            if resultado.nos_expandidos >= proxima_verificacao:
+                if medicao is not None:
+                    # Sem heurística, f = g: o resto do nível e o próximo
+                    restantes = tamanho_nivel - posicao - 1
+                    medicao.amostrar(
+                        resultado.nos_expandidos,
+                        len(pais),
+                        len(fila),
+                        profundidade,
+                        duplicados,
+                        0.0,
+                        tempo_geracao,
+                        {profundidade: restantes, profundidade + 1: len(fila) - restantes},
+                    )
+                motivo = controle.verificar(
+                    resultado.nos_expandidos, len(pais), len(fila), profundidade
+                )
+                proxima_verificacao = controle.proxima_verificacao
+                if motivo is not None:
+                    resultado.motivo_parada = motivo
+                    resultado.tempo_execucao = time.time() - inicio_tempo
+                    if medicao is not None:
+                        medicao.amostrar(
+                            resultado.nos_expandidos, len(pais), len(fila), profundidade,
+                            duplicados, 0.0, tempo_geracao, resultado=resultado,
+                        )
+                    return resultado
+
+            # Gera filhos (sem desfazer o movimento que gerou o estado)
+            movimento_anterior = NOMES_MOVIMENTO[pais[estado_atual.codigo]]
+            if medicao is not None:
+                inicio_geracao = time.perf_counter()
+                filhos = jogo.gerar_filhos_compactos(estado_atual, movimento_anterior)
+                tempo_geracao += time.perf_counter() - inicio_geracao
+            else:
+                filhos = jogo.gerar_filhos_compactos(estado_atual, movimento_anterior)
+
+            for movimento, filho in filhos:
+                # Adiciona à fila se não foi visitado
+                if filho.codigo in pais:
+                    duplicados += 1
+                    continue
+                pais[filho.codigo] = CODIGOS_MOVIMENTO[movimento]
+
+                # Verifica se é o objetivo
+                if filho.eh_objetivo():
+                    resultado.solucao_encontrada = True
+                    resultado.profundidade_solucao = profundidade + 1
+
+                    # Reconstrói o caminho
+                    resultado.caminho = reconstruir_caminho(
+                        pais, filho.codigo, filho.indice_vazio, jogo.especificacao
+                    )
+                    resultado.motivo_parada = PARADA_SOLUCAO
+                    resultado.tempo_execucao = time.time() - inicio_tempo
+                    if medicao is not None:
+                        medicao.amostrar(
+                            resultado.nos_expandidos, len(pais), len(fila), profundidade,
+                            duplicados, 0.0, tempo_geracao, resultado=resultado,
+                        )
+                    return resultado
+
                 fila.append(filho)
 
-    # Não encontrou solução (não deveria acontecer para o Jogo dos Oito)
+        profundidade += 1
+
+    # Não encontrou solução (não deveria acontecer para estados solúveis)
+    resultado.motivo_parada = PARADA_ESGOTADA
     resultado.tempo_execucao = time.time() - inicio_tempo
+    if medicao is not None:
+        medicao.amostrar(
+            resultado.nos_expandidos, len(pais), 0, profundidade,
+            duplicados, 0.0, tempo_geracao, resultado=resultado,
+        )
     return resultado
 
 
-def _reconstruir_caminho(estado_final: EstadoPuzzle) -> List[str]:
-    """
-    Reconstrói o caminho do estado inicial até o estado final.
-
-    Args:
-        estado_final: Estado objetivo encontrado
-
-    Returns:
-        Lista de movimentos do estado inicial ao final
-    """
-    caminho = []
-    estado_atual = estado_final
-
-    while estado_atual.estado_pai is not None:
-        caminho.insert(0, estado_atual.movimento)
-        estado_atual = estado_atual.estado_pai
-
-    return caminho
-
-
 def imprimir_resultado(resultado: ResultadoBusca):
     """Imprime os resultados da busca de forma formatada."""
     print("=" * 50)
@@ -121,6 +222,10 @@ def imprimir_resultado(resultado: ResultadoBusca):
         print(f"✓ Solução encontrada!")
         print(f"Caminho: {resultado.caminho}")
         print(f"Número de movimentos: {len(resultado.caminho)}")
+    elif not resultado.soluvel:
+        print("✗ Estado insolúvel (paridade de inversões diferente do objetivo)")
+    elif resultado.motivo_parada not in (None, PARADA_ESGOTADA):
+        print(f"✗ Busca interrompida ({resultado.motivo_parada})")
     else:
         print("✗ Solução não encontrada")
 
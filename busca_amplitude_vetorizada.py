@@ -0,0 +1,276 @@
+"""
+Busca em amplitude vetorizada com NumPy, expandindo um nível inteiro por vez.
+
+Cada tabuleiro é identificado pela sua posição lexicográfica (código de
+Lehmer, veja permutacao.py). Uma tabela de transições, calculada uma vez por
+tamanho de tabuleiro, dá a posição do filho para cada posição e movimento;
+com ela a fronteira inteira é expandida com algumas operações sobre vetores,
+sem criar um objeto por estado. Os estados visitados ficam num vetor de
+bytes com uma entrada por permutação, que guarda o código do movimento que
+gerou cada estado (veja tabela_pais.py) para reconstruir o caminho.
+
+NumPy é opcional: sem ele, ou em tabuleiros com mais de LIMITE_POSICOES
+posições (cujos vetores não caberiam na memória), é usada a busca em
+amplitude comum.
+"""
+
+import itertools
+import time
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+from especificacao import MOVIMENTOS_OPOSTOS, EspecificacaoPuzzle, construir_tabela_vizinhos
+from jogo_oito import JogoOito
+from permutacao import FATORIAIS, ranquear_lote, ranquear_permutacao
+from instrumentacao import MedicaoBusca, ObservadorBusca
+from tabela_pais import CODIGOS_MOVIMENTO, MOVIMENTOS_POR_CODIGO, SEM_MOVIMENTO
+from limites import (
+    PARADA_ESGOTADA,
+    PARADA_INSOLUVEL,
+    PARADA_SOLUCAO,
+    ControleParada,
+    FuncaoProgresso,
+    LimitesBusca,
+)
+from busca_amplitude import ResultadoBusca, buscar_solucao_amplitude
+
+NUMPY_DISPONIVEL = np is not None
+
+# Maior tabuleiro indexado densamente: 9! posições (3x3 e 2x4)
+LIMITE_POSICOES = 9
+
+# Valor do vetor de pais para estados ainda não alcançados
+NAO_VISITADO = 255
+
+# Código do movimento que desfaz cada código de movimento
+CODIGOS_OPOSTOS = tuple(
+    CODIGOS_MOVIMENTO[MOVIMENTOS_OPOSTOS[movimento]]
+    for movimento in MOVIMENTOS_POR_CODIGO
+)
+
+
+@lru_cache(maxsize=None)
+def construir_tabela_transicoes(largura: int, altura: int) -> "np.ndarray":
+    """
+    Pré-calcula a posição do filho de cada permutação para cada movimento.
+
+    A tabela depende só das dimensões, não do objetivo, e é construída uma
+    única vez por tamanho de tabuleiro (cerca de 6 MB no 3x3).
+
+    Args:
+        largura: Número de colunas do tabuleiro
+        altura: Número de linhas do tabuleiro
+
+    Returns:
+        Matriz int32 (código do movimento x posição) com a posição do filho,
+        ou -1 onde o movimento sai do tabuleiro
+    """
+    tamanho = largura * altura
+    total = FATORIAIS[tamanho]
+
+    # Todas as permutações, em ordem lexicográfica (a linha é a posição)
+    permutacoes = np.fromiter(
+        itertools.chain.from_iterable(itertools.permutations(range(tamanho))),
+        dtype=np.int8,
+        count=total * tamanho,
+    ).reshape(total, tamanho)
+    indices_vazio = np.argmin(permutacoes, axis=1)
+
+    vizinhos = construir_tabela_vizinhos(largura, altura)
+    transicoes = np.full((len(MOVIMENTOS_POR_CODIGO), total), -1, dtype=np.int32)
+    for codigo, movimento in enumerate(MOVIMENTOS_POR_CODIGO):
+        # Posição trocada com o vazio, para cada posição do vazio (-1 se inválido)
+        trocas = np.full(tamanho, -1, dtype=np.int64)
+        for indice_vazio, pares in enumerate(vizinhos):
+            for nome, indice_troca in pares:
+                if nome == movimento:
+                    trocas[indice_vazio] = indice_troca
+
+        destinos = trocas[indices_vazio]
+        (validas,) = np.nonzero(destinos >= 0)
+        filhos = permutacoes[validas]
+        linhas = np.arange(len(validas))
+        filhos[linhas, indices_vazio[validas]] = filhos[linhas, destinos[validas]]
+        filhos[linhas, destinos[validas]] = 0
+        transicoes[codigo, validas] = ranquear_lote(filhos)
+
+    return transicoes
+
+
+def _reconstruir_caminho(
+    pais: "np.ndarray", transicoes: "np.ndarray", posicao: int
+) -> List[str]:
+    """Caminho até a posição, desfazendo os movimentos gravados no vetor de pais."""
+    caminho = []
+    codigo_movimento = int(pais[posicao])
+    while codigo_movimento != SEM_MOVIMENTO:
+        caminho.append(MOVIMENTOS_POR_CODIGO[codigo_movimento])
+        posicao = int(transicoes[CODIGOS_OPOSTOS[codigo_movimento], posicao])
+        codigo_movimento = int(pais[posicao])
+    caminho.reverse()
+    return caminho
+
+
+def buscar_solucao_amplitude_vetorizada(
+    estado_inicial: List[int],
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+    progresso: Optional[FuncaoProgresso] = None,
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+) -> ResultadoBusca:
+    """
+    Realiza busca em amplitude expandindo cada nível com operações vetoriais.
+
+    Encontra o mesmo número de movimentos da busca em amplitude comum. Como
+    os níveis são expandidos inteiros, nos_expandidos conta todos os estados
+    dos níveis expandidos, inclusive os do nível em que o objetivo aparece,
+    e os limites, o progresso e o observador são consultados entre um nível e
+    outro.
+
+    Args:
+        estado_inicial: Estado inicial do tabuleiro
+        especificacao: Dimensões e objetivo do tabuleiro (deduzida do
+            tamanho do tabuleiro se omitida)
+        progresso: Função chamada entre os níveis, quando passam
+            limites.INTERVALO_VERIFICACAO nós, com (nós expandidos, tamanho da
+            fronteira, profundidade); se devolver False a busca é cancelada
+        limites: Limites de nós, memória e tempo e token de cancelamento
+        observador: Recebe amostras periódicas da busca (veja instrumentacao.py)
+
+    Returns:
+        ResultadoBusca com informações da busca
+
+    Raises:
+        ValueError: Se o tabuleiro não é uma permutação de 0..n-1
+    """
+    jogo = JogoOito(estado_inicial, especificacao)
+    # Um tabuleiro com peças repetidas teria a posição de outra permutação
+    jogo.exigir_estado_valido(estado_inicial)
+    especificacao = jogo.especificacao
+    if np is None or especificacao.tamanho > LIMITE_POSICOES:
+        return buscar_solucao_amplitude(
+            estado_inicial, especificacao, progresso, limites, observador
+        )
+
+    resultado = ResultadoBusca()
+    inicio_tempo = time.time()
+
+    # Rejeita estados insolúveis antes de qualquer expansão
+    if not jogo.eh_soluvel(estado_inicial):
+        resultado.soluvel = False
+        resultado.motivo_parada = PARADA_INSOLUVEL
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
+
+    posicao_inicial = ranquear_permutacao(estado_inicial)
+    posicao_objetivo = ranquear_permutacao(especificacao.objetivo)
+
+    # Verifica se já é o estado objetivo
+    if posicao_inicial == posicao_objetivo:
+        resultado.solucao_encontrada = True
+        resultado.profundidade_solucao = 0
+        resultado.motivo_parada = PARADA_SOLUCAO
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
+
+    transicoes = construir_tabela_transicoes(especificacao.largura, especificacao.altura)
+
+    # Vetor de pais indexado pela posição: código do movimento que gerou o
+    # estado, ou NAO_VISITADO. Também serve como conjunto de estados visitados.
+    pais = np.full(FATORIAIS[especificacao.tamanho], NAO_VISITADO, dtype=np.uint8)
+    pais[posicao_inicial] = SEM_MOVIMENTO
+    fronteira = np.array([posicao_inicial], dtype=np.int32)
+    estados_guardados = 1
+
+    profundidade = 0
+    controle = ControleParada(
+        limites, progresso, observador.intervalo if observador is not None else None
+    )
+    proxima_verificacao = controle.proxima_verificacao
+
+    # Instrumentação: só mede tempos quando há um observador
+    medicao = MedicaoBusca(observador) if observador is not None else None
+    duplicados = 0
+    tempo_geracao = 0.0
+
+    while fronteira.size:
+        resultado.profundidade_maxima = profundidade
+        if fronteira.size > resultado.tamanho_maximo_fronteira:
+            resultado.tamanho_maximo_fronteira = int(fronteira.size)
+
+        # Os limites usam a mesma estimativa de memória das outras buscas,
+        # que fica acima do que o vetor de pais ocupa de fato
+        if resultado.nos_expandidos >= proxima_verificacao:
+            if medicao is not None:
+                medicao.amostrar(
+                    resultado.nos_expandidos,
+                    estados_guardados,
+                    int(fronteira.size),
+                    profundidade,
+                    duplicados,
+                    0.0,
+                    tempo_geracao,
+                    {profundidade: int(fronteira.size)},
+                )
+            motivo = controle.verificar(
+                resultado.nos_expandidos,
+                estados_guardados,
+                int(fronteira.size),
+                profundidade,
+            )
+            proxima_verificacao = controle.proxima_verificacao
+            if motivo is not None:
+                resultado.motivo_parada = motivo
+                break
+
+        if medicao is not None:
+            inicio_geracao = time.perf_counter()
+
+        # Expande o nível inteiro, um movimento por vez; um estado alcançado
+        # por dois movimentos fica com o primeiro, como na busca comum
+        resultado.nos_expandidos += int(fronteira.size)
+        novos = []
+        for codigo_movimento in range(len(MOVIMENTOS_POR_CODIGO)):
+            filhos = transicoes[codigo_movimento][fronteira]
+            filhos = filhos[filhos >= 0]
+            ineditos = filhos[pais[filhos] == NAO_VISITADO]
+            duplicados += int(filhos.size - ineditos.size)
+            pais[ineditos] = codigo_movimento
+            novos.append(ineditos)
+        fronteira = np.concatenate(novos)
+        estados_guardados += int(fronteira.size)
+
+        if medicao is not None:
+            tempo_geracao += time.perf_counter() - inicio_geracao
+
+        # Verifica se o objetivo foi alcançado neste nível
+        if pais[posicao_objetivo] != NAO_VISITADO:
+            resultado.solucao_encontrada = True
+            resultado.profundidade_solucao = profundidade + 1
+            resultado.caminho = _reconstruir_caminho(pais, transicoes, posicao_objetivo)
+            resultado.motivo_parada = PARADA_SOLUCAO
+            break
+
+        profundidade += 1
+    else:
+        # Não encontrou solução (não deveria acontecer para estados solúveis)
+        resultado.motivo_parada = PARADA_ESGOTADA
+
+    resultado.tempo_execucao = time.time() - inicio_tempo
+    if medicao is not None:
+        medicao.amostrar(
+            resultado.nos_expandidos,
+            estados_guardados,
+            int(fronteira.size),
+            profundidade,
+            duplicados,
+            0.0,
+            tempo_geracao,
+            resultado=resultado,
+        )
+    return resultado
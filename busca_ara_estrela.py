@@ -0,0 +1,378 @@
+"""
+Implementação do ARA* (Anytime Repairing A*).
+
+Começa com um A* ponderado de peso alto, que acha uma solução rapidamente, e
+vai baixando o peso até 1. Cada rodada reaproveita a busca anterior: só os
+estados cujo custo melhorou desde a última expansão voltam à fronteira. A
+cada rodada a solução pode melhorar e o limite de subotimalidade (custo da
+solução dividido pelo custo ótimo, no pior caso) diminui.
+
+A busca para quando prova que a solução é ótima ou quando um dos limites
+(em geral o prazo, veja limites.py) é atingido; nesse caso devolve a melhor
+solução encontrada até ali.
+"""
+
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from especificacao import EspecificacaoPuzzle
+from estado_puzzle import EstadoCompacto
+from jogo_oito import JogoOito
+from heuristica import calcular_heuristica
+from instrumentacao import MedicaoBusca, ObservadorBusca
+from tabela_pais import (
+    BITS_MOVIMENTO,
+    CODIGOS_MOVIMENTO,
+    MASCARA_MOVIMENTO,
+    NOMES_MOVIMENTO,
+    SEM_MOVIMENTO,
+    reconstruir_caminho,
+)
+from limites import (
+    PARADA_ESGOTADA,
+    PARADA_INSOLUVEL,
+    PARADA_SOLUCAO,
+    ControleParada,
+    FuncaoProgresso,
+    LimitesBusca,
+)
+from busca_amplitude import ResultadoBusca
+
+# Peso da primeira rodada e quanto ele diminui a cada rodada
+PESO_INICIAL_PADRAO = 3.0
+DECREMENTO_PADRAO = 0.5
+
+
+class MelhoriaSolucao:
+    """Solução encontrada por uma rodada do ARA*."""
+
+    def __init__(
+        self,
+        caminho: List[str],
+        peso: float,
+        limite_subotimalidade: float,
+        nos_expandidos: int,
+        tempo_decorrido: float,
+    ):
+        self.caminho = caminho
+        self.peso = peso
+        # A solução custa no máximo limite_subotimalidade vezes a ótima
+        self.limite_subotimalidade = limite_subotimalidade
+        self.nos_expandidos = nos_expandidos
+        self.tempo_decorrido = tempo_decorrido
+
+
+class ResultadoAnytime(ResultadoBusca):
+    """Resultado do ARA*, com a sequência de soluções encontradas."""
+
+    def __init__(self):
+        super().__init__()
+        # Cada solução melhor que a anterior, na ordem em que foram achadas
+        self.melhorias: List[MelhoriaSolucao] = []
+        # Garantia sobre a solução em caminho (1.0 quando ela é ótima)
+        self.limite_subotimalidade = float("inf")
+        # Peso da última rodada
+        self.peso_final = 0.0
+        # Limite que interrompeu o refinamento, se algum (PARADA_* de limites.py)
+        self.motivo_interrupcao: Optional[str] = None
+
+
+# Função chamada a cada solução melhor: recebe o resultado já atualizado
+FuncaoMelhoria = Callable[[ResultadoAnytime], None]
+
+
+def buscar_solucao_ara_estrela(
+    estado_inicial: List[int],
+    metodo_heuristica: str = "manhattan",
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+    progresso: Optional[FuncaoProgresso] = None,
+    peso_inicial: float = PESO_INICIAL_PADRAO,
+    decremento: float = DECREMENTO_PADRAO,
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+    ao_melhorar: Optional[FuncaoMelhoria] = None,
+) -> ResultadoAnytime:
+    """
+    Realiza busca ARA*: uma solução rápida, melhorada até o prazo.
+
+    Quando um limite é atingido depois que o objetivo foi alcançado, mesmo
+    no meio da primeira rodada, o resultado traz a melhor solução
+    (motivo_parada = PARADA_SOLUCAO) e o limite atingido fica em
+    motivo_interrupcao; limite_subotimalidade diz quão longe da ótima ela
+    pode estar.
+
+    Args:
+        estado_inicial: Estado inicial do tabuleiro
+        metodo_heuristica: Método de heurística (veja heuristica.FUNCOES_HEURISTICA)
+        especificacao: Dimensões e objetivo do tabuleiro (deduzida do
+            tamanho do tabuleiro se omitida)
+        progresso: Função chamada a cada limites.INTERVALO_VERIFICACAO nós
+            expandidos com (nós expandidos, tamanho da fronteira, profundidade
+            atual); se devolver False a busca é cancelada
+        peso_inicial: Peso da heurística na primeira rodada
+        decremento: Quanto o peso diminui a cada rodada
+        limites: Limites de nós, memória e tempo e token de cancelamento
+        observador: Recebe amostras periódicas da busca (veja instrumentacao.py)
+        ao_melhorar: Função chamada com o resultado a cada solução melhor
+
+    Returns:
+        ResultadoAnytime com a melhor solução e as melhorias encontradas
+
+    Raises:
+        ValueError: Se o peso inicial é menor que 1, o decremento não é
+            positivo ou o tabuleiro não é uma permutação de 0..n-1
+    """
+    if peso_inicial < 1:
+        raise ValueError(f"O peso inicial deve ser pelo menos 1: {peso_inicial}")
+    if decremento <= 0:
+        raise ValueError(f"O decremento do peso deve ser positivo: {decremento}")
+
+    resultado = ResultadoAnytime()
+    inicio_tempo = time.time()
+
+    jogo = JogoOito(estado_inicial, especificacao)
+    jogo.exigir_estado_valido(estado_inicial)
+    estado_inicial_compacto = EstadoCompacto.de_tabuleiro(
+        estado_inicial, jogo.especificacao
+    )
+
+    # Rejeita estados insolúveis antes de qualquer expansão
+    if not jogo.eh_soluvel(estado_inicial):
+        resultado.soluvel = False
+        resultado.motivo_parada = PARADA_INSOLUVEL
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
+
+    # Verifica se já é o estado objetivo
+    if estado_inicial_compacto.eh_objetivo():
+        resultado.solucao_encontrada = True
+        resultado.limite_subotimalidade = 1.0
+        resultado.motivo_parada = PARADA_SOLUCAO
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
+
+    codigo_objetivo = jogo.especificacao.codigo_objetivo
+
+    # Tabela de pais com o menor custo conhecido de cada estado:
+    # código -> (g << BITS_MOVIMENTO) | código do movimento (veja tabela_pais.py)
+    pais: Dict[int, int] = {estado_inicial_compacto.codigo: SEM_MOVIMENTO}
+
+    # Estados na fronteira e estados que melhoraram depois de expandidos
+    # nesta rodada, com a heurística de cada um (a rodada seguinte recalcula
+    # as prioridades com o novo peso)
+    abertos: Dict[int, Tuple[EstadoCompacto, int]] = {
+        estado_inicial_compacto.codigo: (
+            estado_inicial_compacto,
+            calcular_heuristica(estado_inicial_compacto, metodo_heuristica),
+        )
+    }
+    inconsistentes: Dict[int, Tuple[EstadoCompacto, int]] = {}
+    fechados: Set[int] = set()
+    custo_objetivo = float("inf")
+
+    controle = ControleParada(
+        limites, progresso, observador.intervalo if observador is not None else None
+    )
+    proxima_verificacao = controle.proxima_verificacao
+    medicao = MedicaoBusca(observador) if observador is not None else None
+    inicio_medida = time.perf_counter()
+
+    peso = peso_inicial
+    contador = 0
+    motivo = None
+    while True:
+        # Monta a fronteira da rodada com o peso atual: f = g + peso·h.
+        # Entradas com g maior que o da tabela de pais são obsoletas e
+        # descartadas ao sair (remoção preguiçosa).
+        abertos.update(inconsistentes)
+        inconsistentes.clear()
+        fechados.clear()
+        fila_prioridade = []
+        for codigo, (estado, heuristica) in abertos.items():
+            custo = pais[codigo] >> BITS_MOVIMENTO
+            contador += 1
+            fila_prioridade.append(
+                (custo + peso * heuristica, contador, custo, heuristica, estado)
+            )
+        heapq.heapify(fila_prioridade)
+
+        # Expande enquanto algum estado pode levar a uma solução melhor que a
+        # atual com o peso desta rodada
+        while fila_prioridade:
+            f_atual, _, custo, heuristica_atual, estado_atual = fila_prioridade[0]
+            codigo = estado_atual.codigo
+            if custo > pais[codigo] >> BITS_MOVIMENTO or codigo in fechados:
+                heapq.heappop(fila_prioridade)
+                continue
+            if custo_objetivo <= f_atual:
+                break
+
+            heapq.heappop(fila_prioridade)
+            del abertos[codigo]
+            fechados.add(codigo)
+            resultado.nos_expandidos += 1
+            if custo > resultado.profundidade_maxima:
+                resultado.profundidade_maxima = custo
+            if len(fila_prioridade) > resultado.tamanho_maximo_fronteira:
+                resultado.tamanho_maximo_fronteira = len(fila_prioridade)
+
+            if resultado.nos_expandidos >= proxima_verificacao:
+                if medicao is not None:
+                    medicao.amostrar(
+                        resultado.nos_expandidos, len(pais), len(fila_prioridade), custo
+                    )
+                motivo = controle.verificar(
+                    resultado.nos_expandidos, len(pais), len(fila_prioridade), custo
+                )
+                proxima_verificacao = controle.proxima_verificacao
+                if motivo is not None:
+                    # O estado não chegou a ser expandido: volta à fronteira
+                    # para entrar no limite de subotimalidade
+                    abertos[codigo] = (estado_atual, heuristica_atual)
+                    break
+
+            movimento_anterior = NOMES_MOVIMENTO[pais[codigo] & MASCARA_MOVIMENTO]
+            custo_filho = custo + 1
+            for movimento, filho in jogo.gerar_filhos_compactos(
+                estado_atual, movimento_anterior
+            ):
+                entrada_filho = pais.get(filho.codigo)
+                if entrada_filho is not None and entrada_filho >> BITS_MOVIMENTO <= custo_filho:
+                    continue
+                pais[filho.codigo] = (custo_filho << BITS_MOVIMENTO) | CODIGOS_MOVIMENTO[
+                    movimento
+                ]
+                heuristica_filho = calcular_heuristica(
+                    filho, metodo_heuristica, heuristica_atual, estado_atual.indice_vazio
+                )
+                if filho.codigo == codigo_objetivo:
+                    custo_objetivo = custo_filho
+
+                # Um estado já expandido nesta rodada só volta na próxima
+                if filho.codigo in fechados:
+                    inconsistentes[filho.codigo] = (filho, heuristica_filho)
+                else:
+                    abertos[filho.codigo] = (filho, heuristica_filho)
+                    contador += 1
+                    heapq.heappush(
+                        fila_prioridade,
+                        (
+                            custo_filho + peso * heuristica_filho,
+                            contador,
+                            custo_filho,
+                            heuristica_filho,
+                            filho,
+                        ),
+                    )
+
+        if custo_objetivo == float("inf"):
+            # Interrompida antes de alcançar o objetivo (ou fronteira esgotada)
+            break
+
+        # Os ancestrais do objetivo podem ter melhorado depois que o objetivo
+        # entrou na tabela de pais, então o caminho reconstruído pode ser mais
+        # curto que custo_objetivo; o custo passa a ser o do caminho.
+        caminho = reconstruir_caminho(
+            pais,
+            codigo_objetivo,
+            jogo.especificacao.indice_vazio_objetivo,
+            jogo.especificacao,
+        )
+        if len(caminho) < custo_objetivo:
+            custo_objetivo = len(caminho)
+            pais[codigo_objetivo] = (custo_objetivo << BITS_MOVIMENTO) | (
+                pais[codigo_objetivo] & MASCARA_MOVIMENTO
+            )
+
+        # Garantia da solução: nenhum caminho ainda não explorado custa menos
+        # que o menor g + h da fronteira. O peso só vale como garantia quando
+        # a rodada termina; o custo do objetivo nunca aumenta, então a
+        # garantia anterior continua valendo.
+        menor_estimativa = min(
+            (
+                (pais[codigo] >> BITS_MOVIMENTO) + heuristica
+                for codigo, (_, heuristica) in itertools.chain(
+                    abertos.items(), inconsistentes.items()
+                )
+            ),
+            default=custo_objetivo,
+        )
+        limite = min(resultado.limite_subotimalidade, custo_objetivo / menor_estimativa)
+        if motivo is None:
+            limite = min(limite, peso)
+        resultado.peso_final = peso
+        resultado.limite_subotimalidade = limite
+
+        if not resultado.solucao_encontrada or len(caminho) < resultado.profundidade_solucao:
+            resultado.solucao_encontrada = True
+            resultado.motivo_parada = PARADA_SOLUCAO
+            resultado.caminho = caminho
+            resultado.profundidade_solucao = len(caminho)
+            resultado.melhorias.append(
+                MelhoriaSolucao(
+                    caminho,
+                    peso,
+                    limite,
+                    resultado.nos_expandidos,
+                    time.perf_counter() - inicio_medida,
+                )
+            )
+            if ao_melhorar is not None:
+                resultado.tempo_execucao = time.time() - inicio_tempo
+                ao_melhorar(resultado)
+
+        if motivo is not None:
+            break
+        if limite <= 1 or peso <= 1:
+            resultado.limite_subotimalidade = 1.0
+            break
+        peso = max(1.0, peso - decremento)
+
+    if resultado.solucao_encontrada:
+        resultado.motivo_parada = PARADA_SOLUCAO
+        resultado.motivo_interrupcao = motivo
+    else:
+        resultado.motivo_parada = motivo or PARADA_ESGOTADA
+
+    resultado.tempo_execucao = time.time() - inicio_tempo
+    if medicao is not None:
+        medicao.amostrar(
+            resultado.nos_expandidos,
+            len(pais),
+            len(abertos),
+            resultado.profundidade_maxima,
+            resultado=resultado,
+        )
+    return resultado
+
+
+def imprimir_resultado_ara_estrela(resultado: ResultadoAnytime):
+    """Imprime os resultados do ARA*, com cada solução encontrada."""
+    print("=" * 50)
+    print("ARA* (A-ESTRELA ANYTIME)")
+    print("=" * 50)
+
+    if resultado.solucao_encontrada:
+        print("✓ Solução encontrada!")
+        print(f"Caminho: {resultado.caminho}")
+        print(f"Número de movimentos: {len(resultado.caminho)}")
+        print(f"Limite de subotimalidade: {resultado.limite_subotimalidade:.3f}")
+        if resultado.motivo_interrupcao is not None:
+            print(f"Refinamento interrompido ({resultado.motivo_interrupcao})")
+        for melhoria in resultado.melhorias:
+            print(
+                f"  peso {melhoria.peso:.2f}: {len(melhoria.caminho)} movimentos "
+                f"(≤ {melhoria.limite_subotimalidade:.3f}× ótimo) após "
+                f"{melhoria.nos_expandidos} nós, {melhoria.tempo_decorrido:.4f} s"
+            )
+    elif not resultado.soluvel:
+        print("✗ Estado insolúvel (paridade de inversões diferente do objetivo)")
+    else:
+        print(f"✗ Busca interrompida ({resultado.motivo_parada})")
+
+    print(f"Nós expandidos: {resultado.nos_expandidos}")
+    print(f"Profundidade máxima explorada: {resultado.profundidade_maxima}")
+    print(f"Tamanho máximo da fronteira: {resultado.tamanho_maximo_fronteira}")
+    print(f"Tempo de execução: {resultado.tempo_execucao:.8f} segundos")
+    print("=" * 50)
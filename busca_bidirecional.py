@@ -0,0 +1,264 @@
+"""
+Implementação da Busca em Amplitude Bidirecional.
+Método de busca cego/não informado que cresce a partir do início e do objetivo.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+from especificacao import EspecificacaoPuzzle
+from estado_puzzle import EstadoCompacto
+from jogo_oito import JogoOito
+from instrumentacao import MedicaoBusca, ObservadorBusca
+from tabela_pais import (
+    CODIGOS_MOVIMENTO,
+    NOMES_MOVIMENTO,
+    SEM_MOVIMENTO,
+    reconstruir_caminho,
+    reconstruir_caminho_ate_raiz,
+)
+from limites import (
+    PARADA_ESGOTADA,
+    PARADA_INSOLUVEL,
+    PARADA_SOLUCAO,
+    ControleParada,
+    FuncaoProgresso,
+    LimitesBusca,
+)
+from busca_amplitude import ResultadoBusca
+
+
+def buscar_solucao_bidirecional(
+    estado_inicial: List[int],
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+    progresso: Optional[FuncaoProgresso] = None,
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+) -> ResultadoBusca:
+    """
+    Realiza busca em amplitude bidirecional para o Jogo dos Oito.
+
+    Duas buscas em amplitude crescem ao mesmo tempo: uma a partir do estado
+    inicial e outra a partir do estado objetivo. A cada passo é expandido um
+    nível inteiro do lado com a menor fronteira. Como os níveis são expandidos
+    por completo, o primeiro encontro entre os dois lados fecha um caminho de
+    tamanho mínimo, então a solução continua ótima.
+
+    Args:
+        estado_inicial: Estado inicial do tabuleiro
+        especificacao: Dimensões e objetivo do tabuleiro (deduzida do
+            tamanho do tabuleiro se omitida)
+        progresso: Função chamada a cada limites.INTERVALO_VERIFICACAO nós
+            expandidos com (nós expandidos, tamanho da fronteira, soma das
+            profundidades dos dois lados); se devolver False a busca é cancelada
+        limites: Limites de nós, memória e tempo e token de cancelamento;
+            ao atingir um deles a busca para com o resultado parcial
+        observador: Recebe amostras periódicas da busca (veja instrumentacao.py)
+
+    Returns:
+        ResultadoBusca com informações da busca
+
+    Raises:
+        ValueError: Se o tabuleiro não é uma permutação de 0..n-1
+    """
+    resultado = ResultadoBusca()
+    inicio_tempo = time.time()
+
+    jogo = JogoOito(estado_inicial, especificacao)
+    jogo.exigir_estado_valido(estado_inicial)
+    especificacao = jogo.especificacao
+
+    # Rejeita estados insolúveis antes de qualquer expansão
+    if not jogo.eh_soluvel(estado_inicial):
+        resultado.soluvel = False
+        resultado.motivo_parada = PARADA_INSOLUVEL
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
+
+    estado_inicial_compacto = EstadoCompacto.de_tabuleiro(estado_inicial, especificacao)
+    estado_objetivo_compacto = EstadoCompacto(
+        especificacao.codigo_objetivo,
+        especificacao.indice_vazio_objetivo,
+        especificacao,
+    )
+
+    # Verifica se já é o estado objetivo
+    if estado_inicial_compacto.eh_objetivo():
+        resultado.solucao_encontrada = True
+        resultado.profundidade_solucao = 0
+        resultado.motivo_parada = PARADA_SOLUCAO
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
+
+    # Tabelas de pais de cada lado: código -> código do movimento que gerou
+    # o estado (veja tabela_pais.py). No lado do objetivo o movimento leva do
+    # pai ao filho, ou seja, no sentido contrário ao da solução.
+    pais_frente: Dict[int, int] = {estado_inicial_compacto.codigo: SEM_MOVIMENTO}
+    pais_tras: Dict[int, int] = {estado_objetivo_compacto.codigo: SEM_MOVIMENTO}
+    fronteira_frente = [estado_inicial_compacto]
+    fronteira_tras = [estado_objetivo_compacto]
+    profundidade_frente = 0
+    profundidade_tras = 0
+    controle = ControleParada(
+        limites, progresso, observador.intervalo if observador is not None else None
+    )
+    medicao = MedicaoBusca(observador) if observador is not None else None
+
+    while fronteira_frente and fronteira_tras:
+        tamanho_fronteira = len(fronteira_frente) + len(fronteira_tras)
+        if tamanho_fronteira > resultado.tamanho_maximo_fronteira:
+            resultado.tamanho_maximo_fronteira = tamanho_fronteira
+
+        # Expande o lado com a menor fronteira
+        profundidade = profundidade_frente + profundidade_tras
+        if len(fronteira_frente) <= len(fronteira_tras):
+            fronteira_frente, encontro, motivo = _expandir_nivel(
+                jogo, fronteira_frente, pais_frente, pais_tras, resultado,
+                controle, medicao, profundidade,
+            )
+            profundidade_frente += 1
+        else:
+            fronteira_tras, encontro, motivo = _expandir_nivel(
+                jogo, fronteira_tras, pais_tras, pais_frente, resultado,
+                controle, medicao, profundidade,
+            )
+            profundidade_tras += 1
+
+        resultado.profundidade_maxima = max(profundidade_frente, profundidade_tras)
+
+        if encontro is not None:
+            resultado.solucao_encontrada = True
+            resultado.caminho = reconstruir_caminho(
+                pais_frente, encontro.codigo, encontro.indice_vazio, especificacao
+            ) + reconstruir_caminho_ate_raiz(
+                pais_tras, encontro.codigo, encontro.indice_vazio, especificacao
+            )
+            resultado.profundidade_solucao = len(resultado.caminho)
+            resultado.motivo_parada = PARADA_SOLUCAO
+            break
+
+        if motivo is not None:
+            resultado.motivo_parada = motivo
+            break
+    else:
+        # Não encontrou solução (não deveria acontecer para estados solúveis)
+        resultado.motivo_parada = PARADA_ESGOTADA
+
+    resultado.tempo_execucao = time.time() - inicio_tempo
+    if medicao is not None:
+        medicao.amostrar(
+            resultado.nos_expandidos,
+            len(pais_frente) + len(pais_tras),
+            len(fronteira_frente) + len(fronteira_tras),
+            profundidade_frente + profundidade_tras,
+            medicao.duplicados,
+            0.0,
+            medicao.tempo_geracao,
+            resultado=resultado,
+        )
+    return resultado
+
+
+def _expandir_nivel(
+    jogo: JogoOito,
+    fronteira: List[EstadoCompacto],
+    pais: Dict[int, int],
+    pais_outro_lado: Dict[int, int],
+    resultado: ResultadoBusca,
+    controle: ControleParada,
+    medicao: Optional[MedicaoBusca],
+    profundidade: int,
+) -> Tuple[List[EstadoCompacto], Optional[EstadoCompacto], Optional[str]]:
+    """
+    Expande um nível inteiro de um dos lados da busca.
+
+    O nível é interrompido se o controle indicar que um limite foi atingido.
+
+    Args:
+        jogo: Instância do jogo usada para gerar os filhos
+        fronteira: Estados do nível atual deste lado
+        pais: Tabela de pais deste lado (atualizada com os novos estados)
+        pais_outro_lado: Tabela de pais do lado oposto
+        resultado: Resultado da busca (contagem de nós expandidos)
+        controle: Controle de limites e progresso da busca
+        medicao: Medição da busca, se houver um observador
+        profundidade: Soma das profundidades dos dois lados
+
+    Returns:
+        Tupla (próximo nível, estado de encontro ou None, motivo da parada
+        ou None)
+    """
+    proxima_fronteira = []
+
+    for estado_atual in fronteira:
+        resultado.nos_expandidos += 1
+
+        if resultado.nos_expandidos >= controle.proxima_verificacao:
+            estados_guardados = len(pais) + len(pais_outro_lado)
+            tamanho_fronteira = len(fronteira) + len(proxima_fronteira)
+            if medicao is not None:
+                medicao.amostrar(
+                    resultado.nos_expandidos,
+                    estados_guardados,
+                    tamanho_fronteira,
+                    profundidade,
+                    medicao.duplicados,
+                    0.0,
+                    medicao.tempo_geracao,
+                )
+            motivo = controle.verificar(
+                resultado.nos_expandidos,
+                estados_guardados,
+                tamanho_fronteira,
+                profundidade,
+            )
+            if motivo is not None:
+                return proxima_fronteira, None, motivo
+
+        # Gera filhos (sem desfazer o movimento que gerou o estado)
+        movimento_anterior = NOMES_MOVIMENTO[pais[estado_atual.codigo]]
+        if medicao is not None:
+            inicio_geracao = time.perf_counter()
+            filhos = jogo.gerar_filhos_compactos(estado_atual, movimento_anterior)
+            medicao.tempo_geracao += time.perf_counter() - inicio_geracao
+        else:
+            filhos = jogo.gerar_filhos_compactos(estado_atual, movimento_anterior)
+
+        for movimento, filho in filhos:
+            if filho.codigo in pais:
+                if medicao is not None:
+                    medicao.duplicados += 1
+                continue
+            pais[filho.codigo] = CODIGOS_MOVIMENTO[movimento]
+
+            # Os dois lados se encontraram
+            if filho.codigo in pais_outro_lado:
+                return proxima_fronteira, filho, None
+
+            proxima_fronteira.append(filho)
+
+    return proxima_fronteira, None, None
+
+
+def imprimir_resultado_bidirecional(resultado: ResultadoBusca):
+    """Imprime os resultados da busca bidirecional de forma formatada."""
+    print("=" * 50)
+    print("BUSCA EM AMPLITUDE BIDIRECIONAL")
+    print("=" * 50)
+
+    if resultado.solucao_encontrada:
+        print(f"✓ Solução encontrada!")
+        print(f"Caminho: {resultado.caminho}")
+        print(f"Número de movimentos: {len(resultado.caminho)}")
+    elif not resultado.soluvel:
+        print("✗ Estado insolúvel (paridade de inversões diferente do objetivo)")
+    elif resultado.motivo_parada not in (None, PARADA_ESGOTADA):
+        print(f"✗ Busca interrompida ({resultado.motivo_parada})")
+    else:
+        print("✗ Solução não encontrada")
+
+    print(f"Nós expandidos: {resultado.nos_expandidos}")
+    print(f"Profundidade da solução: {resultado.profundidade_solucao}")
+    print(f"Profundidade máxima explorada: {resultado.profundidade_maxima}")
+    print(f"Tamanho máximo da fronteira: {resultado.tamanho_maximo_fronteira}")
+    print(f"Tempo de execução: {resultado.tempo_execucao:.8f} segundos")
+    print("=" * 50)
@@ -0,0 +1,213 @@
+"""
+Implementação do algoritmo IDA* (A-estrela com aprofundamento iterativo).
+Método de busca informado que usa heurística com memória proporcional à profundidade.
+"""
+
+import time
+from typing import List, Optional
+from especificacao import EspecificacaoPuzzle
+from jogo_oito import JogoOito, MOVIMENTOS_OPOSTOS
+from heuristica import VARIACOES_HEURISTICA, obter_funcao_heuristica, obter_tabela_delta
+from instrumentacao import MedicaoBusca, ObservadorBusca
+from limites import (
+    PARADA_ESGOTADA,
+    PARADA_INSOLUVEL,
+    PARADA_SOLUCAO,
+    ControleParada,
+    FuncaoProgresso,
+    LimitesBusca,
+)
+from busca_amplitude import ResultadoBusca
+
+# Valor retornado pela busca em profundidade quando encontra o objetivo
+_ENCONTRADO = -1
+
+# Valor retornado pela busca em profundidade quando um limite é atingido
+_INTERROMPIDO = -2
+
+
+def buscar_solucao_ida_estrela(
+    estado_inicial: List[int],
+    metodo_heuristica: str = "manhattan",
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+    progresso: Optional[FuncaoProgresso] = None,
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+) -> ResultadoBusca:
+    """
+    Realiza busca IDA* para encontrar solução do Jogo dos Oito.
+
+    Faz buscas em profundidade sucessivas, cortando os nós com
+    f(n) = g(n) + h(n) acima de um limite. A cada iteração o limite passa a
+    ser o menor f que ultrapassou o limite anterior. Os movimentos são
+    aplicados e desfeitos em um único tabuleiro mutável, então a memória
+    usada é O(profundidade).
+
+    Args:
+        estado_inicial: Estado inicial do tabuleiro
+        metodo_heuristica: Método de heurística (veja heuristica.FUNCOES_HEURISTICA)
+        especificacao: Dimensões e objetivo do tabuleiro (deduzida do
+            tamanho do tabuleiro se omitida)
+        progresso: Função chamada a cada limites.INTERVALO_VERIFICACAO nós
+            expandidos com (nós expandidos, tamanho da pilha, profundidade
+            atual); se devolver False a busca é cancelada
+        limites: Limites de nós, memória e tempo e token de cancelamento;
+            ao atingir um deles a busca para com o resultado parcial
+        observador: Recebe amostras periódicas da busca (veja instrumentacao.py);
+            o IDA* não guarda estados nem ordena uma fronteira, então as
+            amostras não trazem repetidos, tempos nem distribuição de f
+
+    Returns:
+        ResultadoBusca com informações da busca
+
+    Raises:
+        ValueError: Se o tabuleiro não é uma permutação de 0..n-1
+    """
+    resultado = ResultadoBusca()
+    inicio_tempo = time.time()
+
+    jogo = JogoOito(estado_inicial, especificacao)
+    jogo.exigir_estado_valido(estado_inicial)
+    especificacao = jogo.especificacao
+    funcao_heuristica = obter_funcao_heuristica(metodo_heuristica)
+    tabela_delta = obter_tabela_delta(metodo_heuristica, especificacao)
+    funcao_variacao = VARIACOES_HEURISTICA.get(metodo_heuristica)
+
+    # Rejeita estados insolúveis antes de qualquer expansão
+    if not jogo.eh_soluvel(estado_inicial):
+        resultado.soluvel = False
+        resultado.motivo_parada = PARADA_INSOLUVEL
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
+
+    tabuleiro = estado_inicial[:]
+    estado_objetivo = especificacao.objetivo
+    vizinhos = jogo.vizinhos
+    caminho: List[str] = []
+    controle = ControleParada(
+        limites, progresso, observador.intervalo if observador is not None else None
+    )
+    proxima_verificacao = controle.proxima_verificacao
+    medicao = MedicaoBusca(observador) if observador is not None else None
+
+    def buscar(indice_vazio: int, custo: int, heuristica: int, desfeito) -> float:
+        """Busca em profundidade limitada; retorna o menor f acima do limite."""
+        nonlocal proxima_verificacao
+        f = custo + heuristica
+        if f > limite:
+            return f
+        if tabuleiro == estado_objetivo:
+            return _ENCONTRADO
+
+        resultado.nos_expandidos += 1
+        if custo > resultado.profundidade_maxima:
+            resultado.profundidade_maxima = custo
+
+        if resultado.nos_expandidos >= proxima_verificacao:
+            # Só o caminho atual fica guardado; a pilha é a fronteira
+            if medicao is not None:
+                medicao.amostrar(resultado.nos_expandidos, 0, custo + 1, custo)
+            motivo = controle.verificar(resultado.nos_expandidos, 0, custo + 1, custo)
+            proxima_verificacao = controle.proxima_verificacao
+            if motivo is not None:
+                resultado.motivo_parada = motivo
+                return _INTERROMPIDO
+
+        proximo_limite = float("inf")
+        for movimento, indice_troca in vizinhos[indice_vazio]:
+            if movimento == desfeito:
+                continue
+
+            peca = tabuleiro[indice_troca]
+            if tabela_delta is not None:
+                heuristica_filho = (
+                    heuristica + tabela_delta[peca][indice_troca][indice_vazio]
+                )
+            elif funcao_variacao is not None:
+                heuristica_filho = heuristica + funcao_variacao(
+                    tabuleiro, especificacao, indice_troca, indice_vazio
+                )
+
+            # Aplica o movimento
+            tabuleiro[indice_vazio] = peca
+            tabuleiro[indice_troca] = 0
+            caminho.append(movimento)
+
+            if tabela_delta is None and funcao_variacao is None:
+                heuristica_filho = funcao_heuristica(tabuleiro, especificacao)
+
+            t = buscar(
+                indice_troca,
+                custo + 1,
+                heuristica_filho,
+                MOVIMENTOS_OPOSTOS[movimento],
+            )
+            if t == _ENCONTRADO or t == _INTERROMPIDO:
+                return t
+
+            # Desfaz o movimento
+            caminho.pop()
+            tabuleiro[indice_troca] = peca
+            tabuleiro[indice_vazio] = 0
+
+            if t < proximo_limite:
+                proximo_limite = t
+
+        return proximo_limite
+
+    heuristica_inicial = funcao_heuristica(tabuleiro, especificacao)
+    limite = heuristica_inicial
+    while True:
+        t = buscar(tabuleiro.index(0), 0, heuristica_inicial, None)
+
+        if t == _ENCONTRADO:
+            resultado.solucao_encontrada = True
+            resultado.caminho = caminho
+            resultado.profundidade_solucao = len(caminho)
+            resultado.motivo_parada = PARADA_SOLUCAO
+            break
+        if t == _INTERROMPIDO:
+            break
+        if t == float("inf"):
+            # Não encontrou solução (não deveria acontecer para estados solúveis)
+            resultado.motivo_parada = PARADA_ESGOTADA
+            break
+
+        limite = t
+
+    # Na busca em profundidade a fronteira é a pilha do caminho atual
+    resultado.tamanho_maximo_fronteira = resultado.profundidade_maxima + 1
+    resultado.tempo_execucao = time.time() - inicio_tempo
+    if medicao is not None:
+        medicao.amostrar(
+            resultado.nos_expandidos, 0, len(caminho) + 1, len(caminho), resultado=resultado
+        )
+    return resultado
+
+
+def imprimir_resultado_ida_estrela(
+    resultado: ResultadoBusca, metodo_heuristica: str = "manhattan"
+):
+    """Imprime os resultados da busca IDA* de forma formatada."""
+    print("=" * 50)
+    print("BUSCA IDA* (A-ESTRELA COM APROFUNDAMENTO ITERATIVO)")
+    print(f"Heurística: {metodo_heuristica.upper()}")
+    print("=" * 50)
+
+    if resultado.solucao_encontrada:
+        print(f"✓ Solução encontrada!")
+        print(f"Caminho: {resultado.caminho}")
+        print(f"Número de movimentos: {len(resultado.caminho)}")
+    elif not resultado.soluvel:
+        print("✗ Estado insolúvel (paridade de inversões diferente do objetivo)")
+    elif resultado.motivo_parada not in (None, PARADA_ESGOTADA):
+        print(f"✗ Busca interrompida ({resultado.motivo_parada})")
+    else:
+        print("✗ Solução não encontrada")
+
+    print(f"Nós expandidos: {resultado.nos_expandidos}")
+    print(f"Profundidade da solução: {resultado.profundidade_solucao}")
+    print(f"Profundidade máxima explorada: {resultado.profundidade_maxima}")
+    print(f"Tamanho máximo da fronteira: {resultado.tamanho_maximo_fronteira}")
+    print(f"Tempo de execução: {resultado.tempo_execucao:.8f} segundos")
+    print("=" * 50)
@@ -0,0 +1,117 @@
+"""
+Cache de soluções compartilhado entre buscas.
+
+Quando uma busca devolve um caminho ótimo, todos os estados desse caminho
+também ficam resolvidos: o trecho do caminho a partir de cada estado é uma
+solução ótima para ele. O cache guarda cada estado do caminho (pelo
+tabuleiro compactado) apontando para a mesma tupla de movimentos, com a
+posição onde o trecho começa, então o custo por estado é constante.
+
+A remoção é LRU, limitada por um orçamento de memória estimado.
+"""
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from especificacao import MOVIMENTOS, EspecificacaoPuzzle, ESPECIFICACAO_PADRAO
+from estado_puzzle import compactar_tabuleiro
+
+# Memória estimada por estado guardado: entrada do OrderedDict, chave inteira,
+# tupla do valor e a parte do estado na tupla de movimentos compartilhada
+BYTES_POR_ENTRADA = 240
+
+# Orçamento padrão de memória do cache (64 MiB)
+LIMITE_BYTES_PADRAO = 64 * 1024 * 1024
+
+
+class CacheSolucoes:
+    """Cache LRU de caminhos ótimos, indexado pelo tabuleiro compactado."""
+
+    def __init__(self, limite_bytes: int = LIMITE_BYTES_PADRAO):
+        """
+        Inicializa o cache.
+
+        Args:
+            limite_bytes: Orçamento de memória; define o número máximo de estados
+        """
+        self.limite_entradas = max(1, limite_bytes // BYTES_POR_ENTRADA)
+        # codigo -> (especificação, tupla de movimentos, início do trecho)
+        self._entradas: "OrderedDict[int, Tuple[EspecificacaoPuzzle, Tuple[str, ...], int]]" = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def __len__(self) -> int:
+        """Número de estados guardados."""
+        return len(self._entradas)
+
+    def buscar(
+        self,
+        tabuleiro: List[int],
+        especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO,
+    ) -> Optional[List[str]]:
+        """
+        Procura a solução ótima de um tabuleiro no cache.
+
+        Args:
+            tabuleiro: Lista representando o tabuleiro
+            especificacao: Dimensões e objetivo do tabuleiro
+
+        Returns:
+            Lista de movimentos até o objetivo, ou None se não está no cache
+        """
+        codigo = compactar_tabuleiro(tabuleiro, especificacao.bits_por_peca)
+        entrada = self._entradas.get(codigo)
+        # Tabuleiros de mesmo tamanho com objetivos diferentes têm o mesmo código
+        if entrada is None or entrada[0] != especificacao:
+            self.falhas += 1
+            return None
+
+        self._entradas.move_to_end(codigo)
+        self.acertos += 1
+        _, caminho, inicio = entrada
+        return list(caminho[inicio:])
+
+    def guardar(
+        self,
+        tabuleiro: List[int],
+        caminho: List[str],
+        especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO,
+    ):
+        """
+        Guarda um caminho ótimo e todos os estados por onde ele passa.
+
+        Só caminhos ótimos devem ser guardados: o trecho a partir de cada
+        estado é devolvido como a solução ótima daquele estado.
+
+        Args:
+            tabuleiro: Estado inicial do caminho
+            caminho: Movimentos do espaço vazio até o objetivo
+            especificacao: Dimensões e objetivo do tabuleiro
+        """
+        movimentos = tuple(caminho)
+        largura = especificacao.largura
+        bits_por_peca = especificacao.bits_por_peca
+        tabuleiro = tabuleiro[:]
+        indice_vazio = tabuleiro.index(0)
+
+        for inicio in range(len(movimentos) + 1):
+            codigo = compactar_tabuleiro(tabuleiro, bits_por_peca)
+            if codigo in self._entradas:
+                self._entradas.move_to_end(codigo)
+            else:
+                self._entradas[codigo] = (especificacao, movimentos, inicio)
+
+            if inicio < len(movimentos):
+                delta_linha, delta_coluna = MOVIMENTOS[movimentos[inicio]]
+                indice_troca = indice_vazio + delta_linha * largura + delta_coluna
+                tabuleiro[indice_vazio] = tabuleiro[indice_troca]
+                tabuleiro[indice_troca] = 0
+                indice_vazio = indice_troca
+
+        while len(self._entradas) > self.limite_entradas:
+            self._entradas.popitem(last=False)
+
+    def limpar(self):
+        """Remove todos os estados e zera as estatísticas."""
+        self._entradas.clear()
+        self.acertos = 0
+        self.falhas = 0
@@ -0,0 +1,398 @@
+"""
+Conjuntos de estados visitados e tabelas de pais compactos.
+
+Por padrão as buscas guardam os estados visitados num dicionário
+código -> código do movimento (veja tabela_pais.py), que custa cerca de 110
+bytes por estado. Este módulo oferece estruturas equivalentes com bem menos
+memória, escolhidas pelo nome (TIPOS_VISITADOS):
+
+- "denso": indexadas pela posição lexicográfica do tabuleiro (veja
+  permutacao.py). ConjuntoBits usa 1 bit por permutação (45 KB cobrem todo o
+  3x3; é o conjunto de visitados da geração da tabela de distâncias) e
+  TabelaDensa 1 ou 2 bytes. Só valem para tabuleiros cujas n! posições
+  cabem em LIMITE_BYTES_DENSO.
+- "enderecamento": endereçamento aberto com sondagem linear, para
+  tabuleiros maiores. Os códigos ficam num array de inteiros de 64 bits, que
+  dobra de tamanho ao passar de CARGA_MAXIMA.
+- "compacto": o denso quando cabe, senão o endereçamento aberto.
+
+As tabelas aceitam as mesmas operações que as buscas fazem no dicionário
+(in, [], get e len) e informam a memória que ocupam (veja medidor_memoria).
+Em troca da memória cada consulta roda em Python, então as buscas ficam
+mais lentas; o dicionário continua sendo o padrão.
+
+Os valores das tabelas têm tamanho fixo, dado por valor_maximo. O A* grava
+(g << BITS_MOVIMENTO) | movimento, então com VALOR_MAXIMO_PADRAO (2 bytes
+por valor) o custo g fica limitado a 8191; gravar um valor acima de
+valor_maximo levanta ValueError em vez de truncá-lo.
+"""
+
+from array import array
+from typing import Callable, Dict, Optional, Union
+from especificacao import EspecificacaoPuzzle
+from permutacao import FATORIAIS, ranquear_codigo
+
+# Estruturas disponíveis para os estados visitados
+TIPO_DICIONARIO = "dicionario"
+TIPO_DENSO = "denso"
+TIPO_ENDERECAMENTO = "enderecamento"
+TIPO_COMPACTO = "compacto"
+TIPOS_VISITADOS = (TIPO_DICIONARIO, TIPO_DENSO, TIPO_ENDERECAMENTO, TIPO_COMPACTO)
+
+# Maior vetor denso aceito (o 3x3 usa 362.880 bytes numa TabelaDensa)
+LIMITE_BYTES_DENSO = 16 * 1024 * 1024
+
+# Maior valor guardado por padrão nas tabelas de pais (2 bytes por valor)
+VALOR_MAXIMO_PADRAO = 0xFFFE
+
+# Ocupação a partir da qual o endereçamento aberto dobra de tamanho
+CARGA_MAXIMA = 0.6
+
+# Espalhamento de Fibonacci: multiplica pela razão áurea em 64 bits e usa os
+# bits altos, que dependem de todas as peças do código
+_MULTIPLICADOR_HASH = 0x9E3779B97F4A7C15
+_MASCARA_64 = (1 << 64) - 1
+_CAPACIDADE_INICIAL = 1024
+
+
+def _exigir_valor(valor: int, valor_maximo: int):
+    """Garante que o valor cabe na tabela."""
+    if valor > valor_maximo:
+        raise ValueError(f"Valor {valor} acima do máximo da tabela ({valor_maximo})")
+
+
+def _tipo_array(valor_maximo: int) -> str:
+    """Menor tipo de array sem sinal que guarda valores até valor_maximo + 1."""
+    for tipo in ("B", "H", "I", "Q"):
+        if valor_maximo + 1 < 1 << (8 * array(tipo).itemsize):
+            return tipo
+    raise ValueError(f"Valor máximo grande demais: {valor_maximo}")
+
+
+class ConjuntoBits:
+    """Conjunto de tabuleiros com 1 bit por permutação, indexado pela posição."""
+
+    def __init__(self, especificacao: EspecificacaoPuzzle):
+        """
+        Inicializa o conjunto vazio.
+
+        Args:
+            especificacao: Dimensões do tabuleiro
+        """
+        self.tamanho = especificacao.tamanho
+        self.bits_por_peca = especificacao.bits_por_peca
+        self._bits = bytearray((FATORIAIS[self.tamanho] + 7) // 8)
+        self._quantidade = 0
+
+    def adicionar(self, codigo: int) -> bool:
+        """
+        Adiciona um tabuleiro compactado.
+
+        Returns:
+            True se o tabuleiro ainda não estava no conjunto
+        """
+        return self.adicionar_posicao(
+            ranquear_codigo(codigo, self.tamanho, self.bits_por_peca)
+        )
+
+    def adicionar_posicao(self, posicao: int) -> bool:
+        """
+        Adiciona um tabuleiro pela sua posição, para quem já a calculou.
+
+        Returns:
+            True se o tabuleiro ainda não estava no conjunto
+        """
+        bit = 1 << (posicao & 7)
+        if self._bits[posicao >> 3] & bit:
+            return False
+        self._bits[posicao >> 3] |= bit
+        self._quantidade += 1
+        return True
+
+    def __contains__(self, codigo: int) -> bool:
+        posicao = ranquear_codigo(codigo, self.tamanho, self.bits_por_peca)
+        return bool(self._bits[posicao >> 3] & (1 << (posicao & 7)))
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    @property
+    def memoria(self) -> int:
+        """Bytes ocupados pelos dados."""
+        return len(self._bits)
+
+
+class TabelaDensa:
+    """
+    Tabela código -> inteiro pequeno com uma entrada por permutação.
+
+    Guarda valor + 1 num array indexado pela posição do tabuleiro; o zero
+    marca as posições ausentes.
+    """
+
+    def __init__(
+        self, especificacao: EspecificacaoPuzzle, valor_maximo: int = VALOR_MAXIMO_PADRAO
+    ):
+        """
+        Inicializa a tabela vazia.
+
+        Args:
+            especificacao: Dimensões do tabuleiro
+            valor_maximo: Maior valor guardado; define 1, 2, 4 ou 8 bytes por entrada
+        """
+        self.tamanho = especificacao.tamanho
+        self.bits_por_peca = especificacao.bits_por_peca
+        self.valor_maximo = valor_maximo
+        tipo = _tipo_array(valor_maximo)
+        self._valores = array(tipo, bytes(array(tipo).itemsize * FATORIAIS[self.tamanho]))
+        self._quantidade = 0
+        # A busca costuma consultar e em seguida gravar o mesmo código
+        self._ultimo_codigo = -1
+        self._ultima_posicao = 0
+
+    def _posicao(self, codigo: int) -> int:
+        if codigo != self._ultimo_codigo:
+            self._ultimo_codigo = codigo
+            self._ultima_posicao = ranquear_codigo(codigo, self.tamanho, self.bits_por_peca)
+        return self._ultima_posicao
+
+    def __contains__(self, codigo: int) -> bool:
+        return self._valores[self._posicao(codigo)] != 0
+
+    def __getitem__(self, codigo: int) -> int:
+        valor = self._valores[self._posicao(codigo)]
+        if valor == 0:
+            raise KeyError(codigo)
+        return valor - 1
+
+    def get(self, codigo: int, padrao: Optional[int] = None) -> Optional[int]:
+        """Valor do código, ou padrao se ele não está na tabela."""
+        valor = self._valores[self._posicao(codigo)]
+        return padrao if valor == 0 else valor - 1
+
+    def __setitem__(self, codigo: int, valor: int):
+        _exigir_valor(valor, self.valor_maximo)
+        posicao = self._posicao(codigo)
+        if self._valores[posicao] == 0:
+            self._quantidade += 1
+        self._valores[posicao] = valor + 1
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    @property
+    def memoria(self) -> int:
+        """Bytes ocupados pelos dados."""
+        return self._valores.itemsize * len(self._valores)
+
+
+class ConjuntoEnderecamentoAberto:
+    """Conjunto de códigos de até 64 bits com endereçamento aberto."""
+
+    def __init__(self, capacidade: int = _CAPACIDADE_INICIAL):
+        """
+        Inicializa o conjunto vazio.
+
+        Args:
+            capacidade: Número inicial de posições (arredondado para potência de 2)
+        """
+        self._quantidade = 0
+        self._alocar(max(8, 1 << (capacidade - 1).bit_length()))
+
+    def _alocar(self, capacidade: int):
+        """Cria as posições vazias; o código 0 (tabuleiro impossível) marca vazio."""
+        self._capacidade = capacidade
+        self._deslocamento = 64 - (capacidade.bit_length() - 1)
+        self._limite = int(capacidade * CARGA_MAXIMA)
+        self._chaves = array("Q", bytes(8 * capacidade))
+        self._ultimo_codigo = -1
+        self._ultimo_indice = 0
+
+    def _indice(self, codigo: int) -> int:
+        """Posição onde o código está, ou a posição vazia onde ele entraria."""
+        if codigo == self._ultimo_codigo:
+            return self._ultimo_indice
+        chaves = self._chaves
+        mascara = self._capacidade - 1
+        indice = ((codigo * _MULTIPLICADOR_HASH) & _MASCARA_64) >> self._deslocamento
+        chave = chaves[indice]
+        while chave != codigo and chave != 0:
+            indice = (indice + 1) & mascara
+            chave = chaves[indice]
+        self._ultimo_codigo = codigo
+        self._ultimo_indice = indice
+        return indice
+
+    def _inserir(self, indice: int, codigo: int):
+        """Ocupa a posição vazia devolvida por _indice; cresce se passar da carga."""
+        self._chaves[indice] = codigo
+        self._quantidade += 1
+        if self._quantidade > self._limite:
+            self._crescer()
+
+    def _crescer(self):
+        chaves = self._chaves
+        self._alocar(self._capacidade * 2)
+        for codigo in chaves:
+            if codigo:
+                self._chaves[self._indice(codigo)] = codigo
+
+    def adicionar(self, codigo: int) -> bool:
+        """
+        Adiciona um tabuleiro compactado.
+
+        Returns:
+            True se o tabuleiro ainda não estava no conjunto
+        """
+        indice = self._indice(codigo)
+        if self._chaves[indice]:
+            return False
+        self._inserir(indice, codigo)
+        return True
+
+    def __contains__(self, codigo: int) -> bool:
+        return self._chaves[self._indice(codigo)] != 0
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    @property
+    def memoria(self) -> int:
+        """Bytes ocupados pelos dados."""
+        return 8 * self._capacidade
+
+
+class TabelaEnderecamentoAberto(ConjuntoEnderecamentoAberto):
+    """Tabela código -> inteiro pequeno com endereçamento aberto."""
+
+    def __init__(
+        self, capacidade: int = _CAPACIDADE_INICIAL, valor_maximo: int = VALOR_MAXIMO_PADRAO
+    ):
+        """
+        Inicializa a tabela vazia.
+
+        Args:
+            capacidade: Número inicial de posições (arredondado para potência de 2)
+            valor_maximo: Maior valor guardado; define o tamanho de cada valor
+        """
+        self.valor_maximo = valor_maximo
+        self._tipo_valores = _tipo_array(valor_maximo)
+        super().__init__(capacidade)
+
+    def _alocar(self, capacidade: int):
+        super()._alocar(capacidade)
+        self._valores = array(
+            self._tipo_valores, bytes(array(self._tipo_valores).itemsize * capacidade)
+        )
+
+    def _crescer(self):
+        chaves = self._chaves
+        valores = self._valores
+        self._alocar(self._capacidade * 2)
+        for codigo, valor in zip(chaves, valores):
+            if codigo:
+                indice = self._indice(codigo)
+                self._chaves[indice] = codigo
+                self._valores[indice] = valor
+
+    def __getitem__(self, codigo: int) -> int:
+        indice = self._indice(codigo)
+        if not self._chaves[indice]:
+            raise KeyError(codigo)
+        return self._valores[indice]
+
+    def get(self, codigo: int, padrao: Optional[int] = None) -> Optional[int]:
+        """Valor do código, ou padrao se ele não está na tabela."""
+        indice = self._indice(codigo)
+        return self._valores[indice] if self._chaves[indice] else padrao
+
+    def __setitem__(self, codigo: int, valor: int):
+        _exigir_valor(valor, self.valor_maximo)
+        indice = self._indice(codigo)
+        # O valor é gravado antes, porque _inserir pode realocar os arrays
+        self._valores[indice] = valor
+        if not self._chaves[indice]:
+            self._inserir(indice, codigo)
+
+    @property
+    def memoria(self) -> int:
+        """Bytes ocupados pelos dados."""
+        return (8 + self._valores.itemsize) * self._capacidade
+
+
+# Tabela de pais aceita pelas buscas e por tabela_pais.reconstruir_caminho
+TabelaPais = Union[Dict[int, int], TabelaDensa, TabelaEnderecamentoAberto]
+
+
+def _resolver_tipo(tipo: str, especificacao: EspecificacaoPuzzle, bytes_por_estado: int) -> str:
+    """Traduz "compacto" e confere se os demais tipos servem para o tabuleiro."""
+    if tipo not in TIPOS_VISITADOS:
+        raise ValueError(f"Tipo de estados visitados desconhecido: {tipo}")
+    cabe_denso = FATORIAIS[especificacao.tamanho] * bytes_por_estado <= LIMITE_BYTES_DENSO
+    cabe_64_bits = especificacao.tamanho * especificacao.bits_por_peca <= 64
+    if tipo == TIPO_COMPACTO:
+        if cabe_denso:
+            return TIPO_DENSO
+        return TIPO_ENDERECAMENTO if cabe_64_bits else TIPO_DICIONARIO
+    if tipo == TIPO_DENSO and not cabe_denso:
+        raise ValueError(
+            f"Tabuleiro {especificacao.largura}x{especificacao.altura} grande demais "
+            "para uma tabela densa"
+        )
+    if tipo == TIPO_ENDERECAMENTO and not cabe_64_bits:
+        raise ValueError(
+            f"Códigos do tabuleiro {especificacao.largura}x{especificacao.altura} "
+            "não cabem em 64 bits"
+        )
+    return tipo
+
+
+def criar_tabela_pais(
+    especificacao: EspecificacaoPuzzle,
+    tipo: Optional[str] = None,
+    valor_maximo: int = VALOR_MAXIMO_PADRAO,
+) -> TabelaPais:
+    """
+    Cria a tabela de pais (e de estados visitados) de uma busca.
+
+    Args:
+        especificacao: Dimensões do tabuleiro
+        tipo: Um de TIPOS_VISITADOS (padrão: dicionário)
+        valor_maximo: Maior valor que a busca vai gravar
+
+    Returns:
+        Tabela vazia
+
+    Raises:
+        ValueError: Se o tipo não existe ou não serve para o tabuleiro
+    """
+    if tipo is None:
+        return {}
+    tipo = _resolver_tipo(
+        tipo, especificacao, array(_tipo_array(valor_maximo)).itemsize
+    )
+    if tipo == TIPO_DENSO:
+        return TabelaDensa(especificacao, valor_maximo)
+    if tipo == TIPO_ENDERECAMENTO:
+        return TabelaEnderecamentoAberto(valor_maximo=valor_maximo)
+    return {}
+
+
+def medidor_memoria(tabela: TabelaPais) -> Optional[Callable[[], int]]:
+    """
+    Função que mede a memória de uma tabela de pais compacta.
+
+    Os limites de memória (veja limites.py) estimam o dicionário pelo número
+    de estados; as tabelas compactas informam os bytes que ocupam de fato,
+    que no vetor denso não dependem de quantos estados foram guardados.
+
+    Args:
+        tabela: Tabela criada por criar_tabela_pais
+
+    Returns:
+        Função sem argumentos que devolve os bytes ocupados, ou None para o
+        dicionário
+    """
+    if isinstance(tabela, dict):
+        return None
+    return lambda: tabela.memoria
@@ -0,0 +1,190 @@
+"""
+Especificação do tabuleiro: dimensões e estado objetivo.
+
+Todo o restante do motor (estados, movimentos, heurísticas e buscas) recebe
+uma EspecificacaoPuzzle em vez de assumir o tabuleiro 3x3. As tabelas que
+dependem só do tabuleiro são calculadas uma vez por especificação.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+# Movimentos possíveis: direção -> (delta_linha, delta_coluna) do espaço vazio
+MOVIMENTOS = {
+    "Cima": (-1, 0),
+    "Baixo": (1, 0),
+    "Esquerda": (0, -1),
+    "Direita": (0, 1),
+}
+
+# Movimento que desfaz cada movimento
+MOVIMENTOS_OPOSTOS = {
+    "Cima": "Baixo",
+    "Baixo": "Cima",
+    "Esquerda": "Direita",
+    "Direita": "Esquerda",
+}
+
+# Estado objetivo clássico do Jogo dos Oito (espiral com o vazio no centro)
+OBJETIVO_PADRAO_3X3 = (1, 2, 3, 8, 0, 4, 7, 6, 5)
+
+
+@lru_cache(maxsize=None)
+def construir_tabela_vizinhos(
+    largura: int, altura: int
+) -> Tuple[Tuple[Tuple[str, int], ...], ...]:
+    """
+    Pré-calcula os movimentos válidos para cada posição do espaço vazio.
+
+    A tabela é construída uma única vez por tamanho de tabuleiro.
+
+    Args:
+        largura: Número de colunas do tabuleiro
+        altura: Número de linhas do tabuleiro
+
+    Returns:
+        Tabela indexada pelo índice do vazio, com pares (movimento, índice da troca)
+    """
+    tabela = []
+    for indice_vazio in range(largura * altura):
+        linha, coluna = divmod(indice_vazio, largura)
+        vizinhos = []
+        for movimento, (delta_linha, delta_coluna) in MOVIMENTOS.items():
+            nova_linha = linha + delta_linha
+            nova_coluna = coluna + delta_coluna
+            if 0 <= nova_linha < altura and 0 <= nova_coluna < largura:
+                vizinhos.append((movimento, nova_linha * largura + nova_coluna))
+        tabela.append(tuple(vizinhos))
+    return tuple(tabela)
+
+
+class EspecificacaoPuzzle:
+    """Dimensões e objetivo de um tabuleiro, com as tabelas derivadas."""
+
+    def __init__(self, largura: int, altura: int, objetivo: Sequence[int]):
+        """
+        Inicializa a especificação.
+
+        Prefira obter_especificacao, que reaproveita as instâncias já criadas.
+
+        Args:
+            largura: Número de colunas do tabuleiro
+            altura: Número de linhas do tabuleiro
+            objetivo: Estado objetivo (linha por linha, 0 é o vazio)
+
+        Raises:
+            ValueError: Se o objetivo não é uma permutação de 0..largura*altura-1
+        """
+        self.largura = largura
+        self.altura = altura
+        self.tamanho = largura * altura
+        self.objetivo: List[int] = list(objetivo)
+
+        if sorted(self.objetivo) != list(range(self.tamanho)):
+            raise ValueError(
+                f"Objetivo inválido para tabuleiro {largura}x{altura}: {self.objetivo}"
+            )
+
+        # Bits por peça no tabuleiro compactado (4 bits até o 4x4)
+        self.bits_por_peca = max(4, (self.tamanho - 1).bit_length())
+        self.mascara_peca = (1 << self.bits_por_peca) - 1
+
+        self.vizinhos = construir_tabela_vizinhos(largura, altura)
+
+        # Posição de cada peça no estado objetivo
+        self.posicoes_objetivo = [0] * self.tamanho
+        for indice, valor in enumerate(self.objetivo):
+            self.posicoes_objetivo[valor] = indice
+
+        self.indice_vazio_objetivo = self.posicoes_objetivo[0]
+
+        # Linha e coluna objetivo de cada peça
+        self.linhas_objetivo = [indice // largura for indice in self.posicoes_objetivo]
+        self.colunas_objetivo = [indice % largura for indice in self.posicoes_objetivo]
+
+        # Objetivo compactado (mesma codificação de estado_puzzle.compactar_tabuleiro)
+        self.codigo_objetivo = sum(
+            valor << (indice * self.bits_por_peca)
+            for indice, valor in enumerate(self.objetivo)
+        )
+
+        self._hash = hash((largura, altura, tuple(self.objetivo)))
+
+    def __eq__(self, other) -> bool:
+        """Duas especificações são iguais se têm as mesmas dimensões e objetivo."""
+        if not isinstance(other, EspecificacaoPuzzle):
+            return False
+        return (self.largura, self.altura, self.objetivo) == (
+            other.largura,
+            other.altura,
+            other.objetivo,
+        )
+
+    def __hash__(self) -> int:
+        """Permite usar a especificação como chave de caches."""
+        return self._hash
+
+    def __repr__(self) -> str:
+        """Representação para debug."""
+        return f"EspecificacaoPuzzle({self.largura}x{self.altura}, {self.objetivo})"
+
+    def linha_coluna(self, indice: int) -> Tuple[int, int]:
+        """Converte índice linear para posição (linha, coluna)."""
+        return divmod(indice, self.largura)
+
+
+def objetivo_padrao(largura: int, altura: int) -> Tuple[int, ...]:
+    """
+    Estado objetivo usado quando nenhum é informado.
+
+    O 3x3 mantém o objetivo clássico do projeto; os demais tamanhos usam as
+    peças em ordem com o vazio na última posição.
+    """
+    if (largura, altura) == (3, 3):
+        return OBJETIVO_PADRAO_3X3
+    return tuple(range(1, largura * altura)) + (0,)
+
+
+@lru_cache(maxsize=None)
+def obter_especificacao(
+    largura: int, altura: int, objetivo: Optional[Tuple[int, ...]] = None
+) -> EspecificacaoPuzzle:
+    """
+    Retorna a especificação de um tabuleiro, criando-a uma única vez.
+
+    Args:
+        largura: Número de colunas do tabuleiro
+        altura: Número de linhas do tabuleiro
+        objetivo: Estado objetivo como tupla (usa objetivo_padrao se omitido)
+
+    Returns:
+        Especificação compartilhada por todas as buscas do mesmo tabuleiro
+    """
+    if objetivo is None:
+        objetivo = objetivo_padrao(largura, altura)
+    return EspecificacaoPuzzle(largura, altura, objetivo)
+
+
+def inferir_especificacao(tabuleiro: Sequence[int]) -> EspecificacaoPuzzle:
+    """
+    Deduz a especificação de um tabuleiro quadrado pelo número de posições.
+
+    Args:
+        tabuleiro: Lista representando o tabuleiro
+
+    Returns:
+        Especificação do tabuleiro quadrado com o objetivo padrão
+
+    Raises:
+        ValueError: Se o número de posições não é um quadrado perfeito
+    """
+    lado = int(round(len(tabuleiro) ** 0.5))
+    if lado < 2 or lado * lado != len(tabuleiro):
+        raise ValueError(
+            f"Não é possível deduzir um tabuleiro quadrado com {len(tabuleiro)} posições"
+        )
+    return obter_especificacao(lado, lado)
+
+
+# Especificação do Jogo dos Oito clássico
+ESPECIFICACAO_PADRAO = obter_especificacao(3, 3)
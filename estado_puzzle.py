@@ -3,13 +3,68 @@ Classe para representar um estado do puzzle no Jogo dos Oito.
 """
 
 from typing import List, Optional, Tuple
+from especificacao import EspecificacaoPuzzle, ESPECIFICACAO_PADRAO
+
+
+def compactar_tabuleiro(tabuleiro: List[int], bits_por_peca: int = 4) -> int:
+    """
+    Compacta o tabuleiro em um único inteiro, um campo de bits por posição.
+
+    A posição 0 ocupa os bits menos significativos. Com 4 bits por peça o
+    tabuleiro 3x3 ocupa 36 bits e o 4x4 ocupa 64 bits.
+
+    Args:
+        tabuleiro: Lista representando o tabuleiro (linha por linha)
+        bits_por_peca: Largura de cada campo (veja EspecificacaoPuzzle)
+
+    Returns:
+        Inteiro com o tabuleiro compactado
+    """
+    codigo = 0
+    deslocamento = 0
+    for valor in tabuleiro:
+        codigo |= valor << deslocamento
+        deslocamento += bits_por_peca
+    return codigo
+
+
+def descompactar_tabuleiro(
+    codigo: int, tamanho: int = 9, bits_por_peca: int = 4
+) -> List[int]:
+    """
+    Reconstrói a lista do tabuleiro a partir do inteiro compactado.
+
+    Args:
+        codigo: Tabuleiro compactado por compactar_tabuleiro
+        tamanho: Número de posições do tabuleiro
+        bits_por_peca: Largura de cada campo usada na compactação
+
+    Returns:
+        Lista representando o tabuleiro
+    """
+    mascara = (1 << bits_por_peca) - 1
+    return [
+        (codigo >> (indice * bits_por_peca)) & mascara for indice in range(tamanho)
+    ]
 
 
 class EstadoPuzzle:
     """Representa um estado do tabuleiro do Jogo dos Oito."""
 
-    # Estado final desejado
-    ESTADO_FINAL = [1, 2, 3, 8, 0, 4, 7, 6, 5]
+    __slots__ = (
+        "tabuleiro",
+        "estado_pai",
+        "movimento",
+        "profundidade",
+        "custo",
+        "heuristica",
+        "f",
+        "especificacao",
+        "_chave",
+    )
+
+    # Estado final desejado (objetivo da especificação padrão 3x3)
+    ESTADO_FINAL = ESPECIFICACAO_PADRAO.objetivo
 
     def __init__(
         self,
@@ -19,17 +74,19 @@ class EstadoPuzzle:
         profundidade: int = 0,
         custo: int = 0,
         heuristica: int = 0,
+        especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO,
     ):
         """
         Inicializa um estado do puzzle.
 
         Args:
-            tabuleiro: Lista de 9 elementos representando o tabuleiro (linha por linha)
+            tabuleiro: Lista com as posições do tabuleiro (linha por linha)
             estado_pai: Estado que gerou este estado
             movimento: Direção do movimento ('Cima', 'Baixo', 'Esquerda', 'Direita')
             profundidade: Profundidade na árvore de busca
             custo: Custo acumulado até este estado
             heuristica: Valor da heurística para este estado
+            especificacao: Dimensões e objetivo do tabuleiro
         """
         self.tabuleiro = tabuleiro[:]  # Cópia para evitar referências
         self.estado_pai = estado_pai
@@ -38,9 +95,10 @@ class EstadoPuzzle:
         self.custo = custo
         self.heuristica = heuristica
         self.f = custo + heuristica  # f(n) = g(n) + h(n) para A*
+        self.especificacao = especificacao
 
-        # Representação única do estado como string
-        self._chave = "".join(str(e) for e in self.tabuleiro)
+        # Representação única do estado como inteiro compactado
+        self._chave = compactar_tabuleiro(self.tabuleiro, especificacao.bits_por_peca)
 
     def __eq__(self, other) -> bool:
         """Compara dois estados pela chave."""
@@ -58,10 +116,16 @@ class EstadoPuzzle:
 
     def __str__(self) -> str:
         """Representação em string do tabuleiro formatado."""
+        largura = self.especificacao.largura
+        largura_celula = len(str(self.especificacao.tamanho - 1))
         linhas = []
-        for i in range(0, 9, 3):
-            linha = self.tabuleiro[i : i + 3]
-            linhas.append(" ".join(str(x) if x != 0 else " " for x in linha))
+        for i in range(0, self.especificacao.tamanho, largura):
+            linha = self.tabuleiro[i : i + largura]
+            linhas.append(
+                " ".join(
+                    (str(x) if x != 0 else " ").rjust(largura_celula) for x in linha
+                )
+            )
         return "\n".join(linhas)
 
     def __repr__(self) -> str:
@@ -70,24 +134,87 @@ class EstadoPuzzle:
 
     def eh_objetivo(self) -> bool:
         """Verifica se este estado é o estado objetivo."""
-        return self.tabuleiro == self.ESTADO_FINAL
+        return self.tabuleiro == self.especificacao.objetivo
 
     def obter_posicao_vazia(self) -> Tuple[int, int]:
         """
         Retorna a posição (linha, coluna) do espaço vazio (0).
 
         Returns:
-            Tupla (linha, coluna) onde linha e coluna são de 0 a 2
+            Tupla (linha, coluna) do espaço vazio
         """
-        indice = self.tabuleiro.index(0)
-        linha = indice // 3
-        coluna = indice % 3
-        return (linha, coluna)
+        return self.especificacao.linha_coluna(self.tabuleiro.index(0))
 
     def obter_indice(self, linha: int, coluna: int) -> int:
         """Converte posição (linha, coluna) para índice linear."""
-        return linha * 3 + coluna
+        return linha * self.especificacao.largura + coluna
 
     def obter_posicao(self, indice: int) -> Tuple[int, int]:
         """Converte índice linear para posição (linha, coluna)."""
-        return (indice // 3, indice % 3)
+        return self.especificacao.linha_coluna(indice)
+
+
+class EstadoCompacto:
+    """
+    Estado do puzzle no modo compactado, usado no laço interno das buscas.
+
+    Guarda apenas o tabuleiro compactado em um inteiro, o índice do espaço
+    vazio e a especificação (compartilhada). Pai, movimento e profundidade
+    ficam em tabelas auxiliares mantidas pela própria busca, e não em cada nó.
+    """
+
+    __slots__ = ("codigo", "indice_vazio", "especificacao")
+
+    def __init__(
+        self,
+        codigo: int,
+        indice_vazio: int,
+        especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO,
+    ):
+        """
+        Inicializa um estado compactado.
+
+        Args:
+            codigo: Tabuleiro compactado
+            indice_vazio: Índice linear do espaço vazio (0)
+            especificacao: Dimensões e objetivo do tabuleiro
+        """
+        self.codigo = codigo
+        self.indice_vazio = indice_vazio
+        self.especificacao = especificacao
+
+    @classmethod
+    def de_tabuleiro(
+        cls,
+        tabuleiro: List[int],
+        especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO,
+    ) -> "EstadoCompacto":
+        """Cria um estado compactado a partir da lista do tabuleiro."""
+        codigo = compactar_tabuleiro(tabuleiro, especificacao.bits_por_peca)
+        return cls(codigo, tabuleiro.index(0), especificacao)
+
+    @property
+    def tabuleiro(self) -> List[int]:
+        """Tabuleiro descompactado como lista."""
+        return descompactar_tabuleiro(
+            self.codigo, self.especificacao.tamanho, self.especificacao.bits_por_peca
+        )
+
+    def __eq__(self, other) -> bool:
+        """Compara dois estados pelo código compactado."""
+        if not isinstance(other, EstadoCompacto):
+            return False
+        return self.codigo == other.codigo
+
+    def __hash__(self) -> int:
+        """Permite usar EstadoCompacto em sets e dicts."""
+        return hash(self.codigo)
+
+    def __repr__(self) -> str:
+        """Representação para debug."""
+        return f"EstadoCompacto({self.tabuleiro})"
+
+    def eh_objetivo(self) -> bool:
+        """Verifica se este estado é o estado objetivo."""
+        return self.codigo == self.especificacao.codigo_objetivo
+
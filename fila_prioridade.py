@@ -0,0 +1,151 @@
+"""
+Filas de prioridade da fronteira do A*.
+
+Os valores de f do quebra-cabeça são inteiros pequenos, então a fronteira
+pode ser um vetor de baldes indexado por f, com um ponteiro para o menor f
+ocupado (FilaBaldes): inserir e retirar custam O(1) e não criam uma tupla
+por nó. Dentro de um mesmo f os nós saem primeiro pelo maior g, que está
+mais perto do objetivo, e, no mesmo g, do último inserido para o primeiro.
+
+FilaHeap mantém o heap binário usado antes, para custos que não são
+inteiros (A* ponderado com peso fracionário).
+"""
+
+import heapq
+from typing import Any, List, Optional, Tuple, Union
+
+# Estruturas disponíveis para a fronteira
+FILA_BALDES = "baldes"
+FILA_HEAP = "heap"
+TIPOS_FILA = (FILA_BALDES, FILA_HEAP)
+
+
+class FilaBaldes:
+    """Fila de prioridade por baldes para valores de f inteiros e não negativos."""
+
+    def __init__(self):
+        # _baldes[f][g] é a pilha dos nós com esses valores de f e g
+        self._baldes: List[List[List[Any]]] = []
+        # Nós por valor de f e maior g possivelmente ocupado em cada f
+        self._quantidade_f: List[int] = []
+        self._maior_g: List[int] = []
+        self._menor_f = 0
+        self._quantidade = 0
+
+    def _crescer(self, f: int):
+        """Cria os baldes que faltam até f."""
+        while len(self._baldes) <= f:
+            self._baldes.append([])
+            self._quantidade_f.append(0)
+            self._maior_g.append(0)
+
+    def inserir(self, f: int, g: int, item: Any):
+        """
+        Insere um nó na fila.
+
+        Args:
+            f: Prioridade (custo estimado total)
+            g: Custo do caminho até o nó, usado no desempate
+            item: Nó guardado
+        """
+        if f >= len(self._baldes):
+            self._crescer(f)
+        balde = self._baldes[f]
+        if g >= len(balde):
+            balde.extend([] for _ in range(g + 1 - len(balde)))
+        balde[g].append(item)
+
+        self._quantidade_f[f] += 1
+        if g > self._maior_g[f]:
+            self._maior_g[f] = g
+        # Com heurística inconsistente f pode ficar abaixo do mínimo atual
+        if f < self._menor_f:
+            self._menor_f = f
+        self._quantidade += 1
+
+    def retirar(self) -> Tuple[int, int, Any]:
+        """
+        Retira o nó de menor f (e maior g entre os de mesmo f).
+
+        Returns:
+            Tupla (f, g, item)
+
+        Raises:
+            IndexError: Se a fila está vazia
+        """
+        if not self._quantidade:
+            raise IndexError("retirar de uma fila vazia")
+        f = self._menor_f
+        quantidade_f = self._quantidade_f
+        while not quantidade_f[f]:
+            f += 1
+        self._menor_f = f
+
+        balde = self._baldes[f]
+        g = self._maior_g[f]
+        while not balde[g]:
+            g -= 1
+        self._maior_g[f] = g
+
+        quantidade_f[f] -= 1
+        self._quantidade -= 1
+        return f, g, balde[g].pop()
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+
+class FilaHeap:
+    """Heap binário; no mesmo f os nós saem na ordem de inserção."""
+
+    def __init__(self):
+        self._heap: List[Tuple[Union[int, float], int, int, Any]] = []
+        self._contador = 0
+
+    def inserir(self, f: Union[int, float], g: int, item: Any):
+        """
+        Insere um nó na fila.
+
+        Args:
+            f: Prioridade (custo estimado total)
+            g: Custo do caminho até o nó
+            item: Nó guardado
+        """
+        self._contador += 1
+        heapq.heappush(self._heap, (f, self._contador, g, item))
+
+    def retirar(self) -> Tuple[Union[int, float], int, Any]:
+        """
+        Retira o nó de menor f.
+
+        Returns:
+            Tupla (f, g, item)
+
+        Raises:
+            IndexError: Se a fila está vazia
+        """
+        f, _, g, item = heapq.heappop(self._heap)
+        return f, g, item
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+def criar_fila(tipo: Optional[str] = None) -> Union[FilaBaldes, FilaHeap]:
+    """
+    Cria a fila da fronteira.
+
+    Args:
+        tipo: Um de TIPOS_FILA (padrão: baldes)
+
+    Returns:
+        Fila vazia
+
+    Raises:
+        ValueError: Se o tipo não existe
+    """
+    if tipo is None or tipo == FILA_BALDES:
+        return FilaBaldes()
+    if tipo == FILA_HEAP:
+        return FilaHeap()
+    raise ValueError(f"Tipo de fila desconhecido: {tipo}")
@@ -0,0 +1,340 @@
+"""
+Resolução em fluxo pela linha de comando, com entrada e saída em JSON lines.
+
+Cada linha da entrada é um tabuleiro, como lista JSON ou como objeto com as
+chaves "tabuleiro" e, opcionalmente, "id":
+    [2, 0, 3, 1, 7, 4, 6, 8, 5]
+    {"id": "caso-7", "tabuleiro": [2, 0, 3, 1, 7, 4, 6, 8, 5]}
+
+Cada linha da saída é o registro de um tabuleiro, na ordem de conclusão.
+A entrada é lida sob demanda (veja lote.resolver_lote), então a memória não
+depende do tamanho da entrada e a leitura para quando a saída não é consumida.
+
+Uso:
+    python main.py resolver --algoritmo ida_estrela < tabuleiros.jsonl > resultados.jsonl
+"""
+
+import argparse
+import json
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+from especificacao import EspecificacaoPuzzle, inferir_especificacao, obter_especificacao
+from lote import TAMANHO_BLOCO_PADRAO, ResultadoLote, resolver_lote
+from busca_ara_estrela import ResultadoAnytime
+from solucionador import ALGORITMOS
+from heuristica import FUNCOES_HEURISTICA
+
+
+def ler_tabuleiros(
+    entrada: TextIO,
+    registrar_erro: Callable[[int, str], None],
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+) -> Iterator[Tuple[int, object, List[int]]]:
+    """
+    Lê os tabuleiros da entrada, uma linha JSON por vez.
+
+    Linhas em branco são ignoradas. Linhas inválidas não são resolvidas: a
+    mensagem é entregue a registrar_erro assim que a linha é lida, então os
+    erros não se acumulam em memória e saem na ordem da entrada. Um tabuleiro só
+    é aceito se for uma permutação de 0..n-1 com o tamanho da especificação
+    (ou, sem especificação, com um número quadrado de posições), para que
+    nenhum tabuleiro malformado ocupe um processo trabalhador.
+
+    Args:
+        entrada: Arquivo de texto com uma linha JSON por tabuleiro
+        registrar_erro: Função chamada com (número da linha, mensagem) para
+            cada linha inválida
+        especificacao: Especificação comum aos tabuleiros (deduzida de cada
+            tabuleiro se omitida)
+
+    Yields:
+        Tuplas (número da linha, id informado ou None, tabuleiro)
+    """
+    for numero_linha, linha in enumerate(entrada, start=1):
+        linha = linha.strip()
+        if not linha:
+            continue
+        try:
+            dados = json.loads(linha)
+            identificador = None
+            if isinstance(dados, dict):
+                identificador = dados.get("id")
+                if "tabuleiro" not in dados:
+                    raise ValueError('falta a chave "tabuleiro"')
+                dados = dados["tabuleiro"]
+            if not _lista_de_inteiros(dados):
+                raise ValueError("o tabuleiro deve ser uma lista de inteiros")
+            _validar_tabuleiro(dados, especificacao)
+        except ValueError as erro:
+            registrar_erro(numero_linha, f"Linha inválida: {erro}")
+            continue
+        yield numero_linha, identificador, dados
+
+
+def _lista_de_inteiros(dados: object) -> bool:
+    """Se dados é uma lista de inteiros JSON (true e false não contam)."""
+    return isinstance(dados, list) and all(type(valor) is int for valor in dados)
+
+
+def _validar_tabuleiro(
+    tabuleiro: List[int], especificacao: Optional[EspecificacaoPuzzle]
+):
+    """
+    Confere o tamanho e as peças de um tabuleiro lido.
+
+    Raises:
+        ValueError: Se o tabuleiro não serve para a especificação
+    """
+    if especificacao is None:
+        especificacao = inferir_especificacao(tabuleiro)
+    elif len(tabuleiro) != especificacao.tamanho:
+        raise ValueError(
+            f"o tabuleiro tem {len(tabuleiro)} posições, e o "
+            f"{especificacao.largura}x{especificacao.altura} tem {especificacao.tamanho}"
+        )
+    if sorted(tabuleiro) != list(range(especificacao.tamanho)):
+        raise ValueError(
+            f"o tabuleiro deve ter cada peça de 0 a {especificacao.tamanho - 1} uma vez"
+        )
+
+
+def montar_registro(
+    item: ResultadoLote, numero_linha: int, identificador: object
+) -> dict:
+    """
+    Monta o registro de saída de um tabuleiro resolvido.
+
+    Args:
+        item: Resultado do tabuleiro no lote
+        numero_linha: Linha do tabuleiro na entrada
+        identificador: Id informado na entrada (ou None)
+
+    Returns:
+        Dicionário pronto para json.dumps
+    """
+    registro = {"linha": numero_linha}
+    if identificador is not None:
+        registro["id"] = identificador
+    registro["tabuleiro"] = item.estado_inicial
+
+    if item.erro is not None:
+        registro["erro"] = item.erro
+        registro["tempo_esgotado"] = item.tempo_esgotado
+
+    resultado = item.resultado
+    if resultado is None:
+        return registro
+    registro.update(
+        motivo_parada=resultado.motivo_parada,
+        solucao_encontrada=resultado.solucao_encontrada,
+        soluvel=resultado.soluvel,
+        caminho=resultado.caminho,
+        nos_expandidos=resultado.nos_expandidos,
+        profundidade_solucao=resultado.profundidade_solucao,
+        profundidade_maxima=resultado.profundidade_maxima,
+        tamanho_maximo_fronteira=resultado.tamanho_maximo_fronteira,
+        tempo_execucao=resultado.tempo_execucao,
+    )
+    if isinstance(resultado, ResultadoAnytime):
+        registro.update(
+            limite_subotimalidade=resultado.limite_subotimalidade,
+            motivo_interrupcao=resultado.motivo_interrupcao,
+        )
+    return registro
+
+
+def resolver_fluxo(
+    entrada: TextIO,
+    saida: TextIO,
+    algoritmo: str = "a_estrela",
+    metodo_heuristica: str = "manhattan",
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+    processos: Optional[int] = None,
+    tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+    tempo_limite: Optional[float] = None,
+    limite_cache: Optional[int] = None,
+    max_nos: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    Resolve todos os tabuleiros da entrada, escrevendo um registro por linha.
+
+    Args:
+        entrada: Arquivo com uma linha JSON por tabuleiro
+        saida: Arquivo onde os registros são escritos
+        algoritmo: Nome do algoritmo (uma das chaves de solucionador.ALGORITMOS)
+        metodo_heuristica: Método de heurística, usado por A* e IDA*
+        especificacao: Especificação comum aos tabuleiros (deduzida de cada
+            tabuleiro se omitida)
+        processos: Número de processos (padrão: número de CPUs)
+        tamanho_bloco: Tabuleiros enviados de uma vez a cada processo
+        tempo_limite: Tempo máximo por tabuleiro, em segundos
+        limite_cache: Orçamento em bytes do cache de soluções de cada processo
+        max_nos: Máximo de nós expandidos por tabuleiro
+
+    Returns:
+        Tupla (registros escritos, registros com erro)
+    """
+    # Linha e id dos tabuleiros em andamento, pelo índice no lote
+    em_andamento: Dict[int, Tuple[int, object]] = {}
+    escritos = 0
+    com_erro = 0
+    interativo = saida.isatty()
+
+    def escrever(registro: dict):
+        saida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        if interativo:
+            saida.flush()
+
+    def escrever_erro_leitura(numero_linha: int, mensagem: str):
+        # A entrada é lida na mesma thread que escreve os resultados
+        nonlocal escritos, com_erro
+        escrever({"linha": numero_linha, "erro": mensagem})
+        escritos += 1
+        com_erro += 1
+
+    def tabuleiros() -> Iterator[List[int]]:
+        for indice, (numero_linha, identificador, tabuleiro) in enumerate(
+            ler_tabuleiros(entrada, escrever_erro_leitura, especificacao)
+        ):
+            em_andamento[indice] = (numero_linha, identificador)
+            yield tabuleiro
+
+    for item in resolver_lote(
+        tabuleiros(),
+        algoritmo,
+        metodo_heuristica,
+        especificacao,
+        processos=processos,
+        tamanho_bloco=tamanho_bloco,
+        tempo_limite=tempo_limite,
+        limite_cache=limite_cache,
+        max_nos=max_nos,
+    ):
+        numero_linha, identificador = em_andamento.pop(item.indice)
+        escrever(montar_registro(item, numero_linha, identificador))
+        escritos += 1
+        if item.erro is not None:
+            com_erro += 1
+
+    saida.flush()
+    return escritos, com_erro
+
+
+def _especificacao_do_objetivo(
+    objetivo: List[int], largura: Optional[int]
+) -> EspecificacaoPuzzle:
+    """
+    Especificação de um objetivo informado na linha de comando.
+
+    Args:
+        objetivo: Estado objetivo
+        largura: Número de colunas (deduzido de um tabuleiro quadrado se omitido)
+
+    Returns:
+        Especificação com as dimensões e o objetivo
+
+    Raises:
+        ValueError: Se o objetivo não é uma lista de inteiros que forma um
+            tabuleiro da largura informada
+    """
+    if not _lista_de_inteiros(objetivo):
+        raise ValueError("o objetivo deve ser uma lista de inteiros")
+    if largura is None:
+        especificacao = inferir_especificacao(objetivo)
+        largura, altura = especificacao.largura, especificacao.altura
+    else:
+        if largura < 1 or not objetivo or len(objetivo) % largura:
+            raise ValueError(
+                f"{len(objetivo)} posições não formam um tabuleiro de largura {largura}"
+            )
+        altura = len(objetivo) // largura
+    return obter_especificacao(largura, altura, tuple(objetivo))
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """
+    Executa a resolução em fluxo a partir dos argumentos da linha de comando.
+
+    Args:
+        argumentos: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída: 0 se todos os tabuleiros foram resolvidos sem erro
+    """
+    parser = argparse.ArgumentParser(
+        prog="python main.py resolver",
+        description="Resolve tabuleiros lidos em JSON lines, um registro por linha.",
+    )
+    parser.add_argument(
+        "--algoritmo", choices=sorted(ALGORITMOS), default="a_estrela"
+    )
+    parser.add_argument(
+        "--heuristica", choices=sorted(FUNCOES_HEURISTICA), default="manhattan"
+    )
+    parser.add_argument(
+        "--entrada", help="Arquivo de entrada (padrão: entrada padrão)"
+    )
+    parser.add_argument("--saida", help="Arquivo de saída (padrão: saída padrão)")
+    parser.add_argument(
+        "--objetivo",
+        help="Estado objetivo como lista JSON (padrão: objetivo padrão do tamanho)",
+    )
+    parser.add_argument(
+        "--largura",
+        type=int,
+        help="Colunas do tabuleiro, para objetivos não quadrados (ex.: 3 num 3x2)",
+    )
+    parser.add_argument("--processos", type=int, help="Número de processos")
+    parser.add_argument("--bloco", type=int, default=TAMANHO_BLOCO_PADRAO)
+    parser.add_argument(
+        "--tempo-limite", type=float, help="Tempo máximo por tabuleiro, em segundos"
+    )
+    parser.add_argument(
+        "--max-nos", type=int, help="Máximo de nós expandidos por tabuleiro"
+    )
+    parser.add_argument(
+        "--cache-mb",
+        type=int,
+        default=0,
+        help="Memória do cache de soluções por processo, em MiB (0 desativa)",
+    )
+    opcoes = parser.parse_args(argumentos)
+
+    especificacao = None
+    if opcoes.objetivo:
+        try:
+            especificacao = _especificacao_do_objetivo(
+                json.loads(opcoes.objetivo), opcoes.largura
+            )
+        except ValueError as erro:
+            parser.error(f"--objetivo inválido: {erro}")
+    elif opcoes.largura is not None:
+        parser.error("--largura exige --objetivo")
+
+    entrada = open(opcoes.entrada, encoding="utf-8") if opcoes.entrada else sys.stdin
+    saida = open(opcoes.saida, "w", encoding="utf-8") if opcoes.saida else sys.stdout
+    try:
+        escritos, com_erro = resolver_fluxo(
+            entrada,
+            saida,
+            opcoes.algoritmo,
+            opcoes.heuristica,
+            especificacao,
+            processos=opcoes.processos,
+            tamanho_bloco=opcoes.bloco,
+            tempo_limite=opcoes.tempo_limite,
+            limite_cache=opcoes.cache_mb * 1024 * 1024,
+            max_nos=opcoes.max_nos,
+        )
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+
+    print(f"{escritos} registros, {com_erro} com erro", file=sys.stderr)
+    return 1 if com_erro else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
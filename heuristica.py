@@ -1,11 +1,16 @@
 """
 Funções heurísticas para o Jogo dos Oito.
 """
-from typing import List
-from estado_puzzle import EstadoPuzzle
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from especificacao import EspecificacaoPuzzle, ESPECIFICACAO_PADRAO
+from estado_puzzle import EstadoPuzzle, EstadoCompacto
+from banco_padroes import obter_heuristica_padroes
 
 
-def distancia_manhattan(estado: List[int]) -> int:
+def distancia_manhattan(
+    estado: List[int], especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO
+) -> int:
     """
     Calcula a distância de Manhattan para um estado do puzzle.
     
@@ -14,12 +19,13 @@ def distancia_manhattan(estado: List[int]) -> int:
     
     Args:
         estado: Lista representando o tabuleiro atual
+        especificacao: Dimensões e objetivo do tabuleiro
         
     Returns:
         Valor da heurística (soma das distâncias de Manhattan)
     """
-    estado_objetivo = EstadoPuzzle.ESTADO_FINAL
-    
+    largura = especificacao.largura
+    posicoes_objetivo = especificacao.posicoes_objetivo
     distancia_total = 0
     
     # Para cada posição no tabuleiro atual
@@ -28,13 +34,11 @@ def distancia_manhattan(estado: List[int]) -> int:
             continue
         
         # Encontra onde este valor deveria estar
-        indice_objetivo = estado_objetivo.index(valor)
+        indice_objetivo = posicoes_objetivo[valor]
         
         # Calcula posições (linha, coluna)
-        linha_atual = indice_atual // 3
-        coluna_atual = indice_atual % 3
-        linha_objetivo = indice_objetivo // 3
-        coluna_objetivo = indice_objetivo % 3
+        linha_atual, coluna_atual = divmod(indice_atual, largura)
+        linha_objetivo, coluna_objetivo = divmod(indice_objetivo, largura)
         
         # Distância de Manhattan: |linha_atual - linha_objetivo| + |coluna_atual - coluna_objetivo|
         distancia = abs(linha_atual - linha_objetivo) + abs(coluna_atual - coluna_objetivo)
@@ -43,7 +47,9 @@ def distancia_manhattan(estado: List[int]) -> int:
     return distancia_total
 
 
-def pecas_fora_do_lugar(estado: List[int]) -> int:
+def pecas_fora_do_lugar(
+    estado: List[int], especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO
+) -> int:
     """
     Conta quantas peças estão fora de lugar (sem contar o espaço vazio).
     
@@ -51,11 +57,12 @@ def pecas_fora_do_lugar(estado: List[int]) -> int:
     
     Args:
         estado: Lista representando o tabuleiro atual
+        especificacao: Dimensões e objetivo do tabuleiro
         
     Returns:
         Número de peças fora de lugar
     """
-    estado_objetivo = EstadoPuzzle.ESTADO_FINAL
+    estado_objetivo = especificacao.objetivo
     
     pecas_fora = 0
     for i, valor in enumerate(estado):
@@ -65,21 +72,464 @@ def pecas_fora_do_lugar(estado: List[int]) -> int:
     return pecas_fora
 
 
-def calcular_heuristica(estado: EstadoPuzzle, metodo: str = 'manhattan') -> int:
+def construir_tabela_delta(
+    distancia_peca: Callable[[int, int], int], tamanho: int
+) -> List[List[List[int]]]:
     """
-    Calcula a heurística para um estado usando o método especificado.
+    Pré-calcula a variação da heurística quando uma peça desliza.
+    
+    Serve para heurísticas que são soma de termos independentes por peça:
+    ao mover uma peça, apenas o termo dela muda.
+    
+    Args:
+        distancia_peca: Função (peca, indice) -> termo da peça naquela posição
+        tamanho: Número de posições do tabuleiro
+        
+    Returns:
+        Tabela indexada por [peca][origem][destino] com a variação da heurística
+    """
+    tabela = [[[0] * tamanho for _ in range(tamanho)] for _ in range(tamanho)]
+    for peca in range(1, tamanho):
+        for origem in range(tamanho):
+            termo_origem = distancia_peca(peca, origem)
+            for destino in range(tamanho):
+                tabela[peca][origem][destino] = (
+                    distancia_peca(peca, destino) - termo_origem
+                )
+    return tabela
+
+
+def _manhattan_peca(especificacao: EspecificacaoPuzzle, peca: int, indice: int) -> int:
+    """Distância de Manhattan de uma peça em um índice até o seu objetivo."""
+    linha, coluna = especificacao.linha_coluna(indice)
+    linha_objetivo, coluna_objetivo = especificacao.linha_coluna(
+        especificacao.posicoes_objetivo[peca]
+    )
+    return abs(linha - linha_objetivo) + abs(coluna - coluna_objetivo)
+
+
+def _peca_fora_peca(especificacao: EspecificacaoPuzzle, peca: int, indice: int) -> int:
+    """Vale 1 se a peça não está na sua posição objetivo."""
+    return 0 if especificacao.posicoes_objetivo[peca] == indice else 1
+
+
+# Termo de cada peça nos métodos que são soma de termos por peça
+TERMOS_POR_PECA = {
+    'manhattan': _manhattan_peca,
+    'pecas_fora': _peca_fora_peca,
+}
+
+# Tabelas de variação já construídas, por (método, especificação)
+_tabelas_delta: Dict[Tuple[str, EspecificacaoPuzzle], List[List[List[int]]]] = {}
+
+
+def obter_tabela_delta(
+    metodo: str, especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO
+) -> Optional[List[List[List[int]]]]:
+    """
+    Retorna a tabela de variação de um método, construída uma vez por tabuleiro.
+    
+    Args:
+        metodo: Método de heurística
+        especificacao: Dimensões e objetivo do tabuleiro
+        
+    Returns:
+        Tabela [peca][origem][destino], ou None se o método não é por peça
+    """
+    chave = (metodo, especificacao)
+    tabela = _tabelas_delta.get(chave)
+    if tabela is None:
+        termo = TERMOS_POR_PECA.get(metodo)
+        if termo is None:
+            return None
+        tabela = construir_tabela_delta(
+            lambda peca, indice: termo(especificacao, peca, indice),
+            especificacao.tamanho,
+        )
+        _tabelas_delta[chave] = tabela
+    return tabela
+
+
+def banco_padroes_aditivo(
+    estado: List[int], especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO
+) -> int:
+    """
+    Soma dos bancos de padrões disjuntos (veja banco_padroes.py).
+    
+    Admissível e bem mais informada que Manhattan; é a heurística indicada
+    para tabuleiros maiores que 3x3.
+    
+    Args:
+        estado: Lista representando o tabuleiro atual
+        especificacao: Dimensões e objetivo do tabuleiro
+        
+    Returns:
+        Valor da heurística
+    """
+    return obter_heuristica_padroes(especificacao)(estado)
+
+
+@lru_cache(maxsize=None)
+def _penalidade_conflitos(destinos: Tuple[int, ...]) -> int:
+    """
+    Movimentos extras exigidos pelos conflitos lineares de uma linha ou coluna.
+    
+    Recebe, na ordem em que aparecem, as posições objetivo (ao longo da
+    linha) das peças que já estão na sua linha objetivo. As peças fora da
+    maior subsequência crescente precisam sair da linha e voltar, o que custa
+    dois movimentos a mais cada. O resultado é memorizado por sequência.
     
     Args:
-        estado: Estado do puzzle
-        metodo: Método de heurística ('manhattan' ou 'pecas_fora')
+        destinos: Posições objetivo das peças, na ordem atual
+        
+    Returns:
+        Penalidade em movimentos (sempre par)
+    """
+    if len(destinos) < 2:
+        return 0
+    # Maior subsequência crescente, O(k^2) para k <= largura do tabuleiro
+    maiores = [1] * len(destinos)
+    for i in range(len(destinos)):
+        for j in range(i):
+            if destinos[j] < destinos[i] and maiores[j] + 1 > maiores[i]:
+                maiores[i] = maiores[j] + 1
+    return 2 * (len(destinos) - max(maiores))
+
+
+# Penalidade de cada conteúdo de linha/coluna, por especificação
+_tabelas_conflito: Dict[EspecificacaoPuzzle, Tuple[List[dict], List[dict]]] = {}
+
+
+def _obter_tabelas_conflito(
+    especificacao: EspecificacaoPuzzle,
+) -> Tuple[List[dict], List[dict]]:
+    """Tabelas (uma por linha e uma por coluna) preenchidas sob demanda."""
+    tabelas = _tabelas_conflito.get(especificacao)
+    if tabelas is None:
+        tabelas = (
+            [{} for _ in range(especificacao.altura)],
+            [{} for _ in range(especificacao.largura)],
+        )
+        _tabelas_conflito[especificacao] = tabelas
+    return tabelas
+
+
+def _penalidade_linha(
+    especificacao: EspecificacaoPuzzle, linha: int, conteudo: Tuple[int, ...]
+) -> int:
+    """Penalidade de conflitos de uma linha, consultando a tabela da linha."""
+    tabela = _obter_tabelas_conflito(especificacao)[0][linha]
+    penalidade = tabela.get(conteudo)
+    if penalidade is None:
+        linhas_objetivo = especificacao.linhas_objetivo
+        colunas_objetivo = especificacao.colunas_objetivo
+        penalidade = _penalidade_conflitos(
+            tuple(
+                colunas_objetivo[peca]
+                for peca in conteudo
+                if peca != 0 and linhas_objetivo[peca] == linha
+            )
+        )
+        tabela[conteudo] = penalidade
+    return penalidade
+
+
+def _penalidade_coluna(
+    especificacao: EspecificacaoPuzzle, coluna: int, conteudo: Tuple[int, ...]
+) -> int:
+    """Penalidade de conflitos de uma coluna, consultando a tabela da coluna."""
+    tabela = _obter_tabelas_conflito(especificacao)[1][coluna]
+    penalidade = tabela.get(conteudo)
+    if penalidade is None:
+        linhas_objetivo = especificacao.linhas_objetivo
+        colunas_objetivo = especificacao.colunas_objetivo
+        penalidade = _penalidade_conflitos(
+            tuple(
+                linhas_objetivo[peca]
+                for peca in conteudo
+                if peca != 0 and colunas_objetivo[peca] == coluna
+            )
+        )
+        tabela[conteudo] = penalidade
+    return penalidade
+
+
+def conflito_linear(
+    estado: List[int], especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO
+) -> int:
+    """
+    Distância de Manhattan somada aos conflitos lineares.
+    
+    Duas peças na sua linha (ou coluna) objetivo, mas em ordem invertida,
+    obrigam uma delas a sair da linha: isso custa dois movimentos que a
+    distância de Manhattan não conta. Os conflitos de linhas só adicionam
+    movimentos verticais e os de colunas só horizontais, então a soma
+    continua admissível.
+    
+    A penalidade de cada linha depende só do seu conteúdo, então fica
+    guardada em uma tabela por linha indexada pela tupla das peças.
+    
+    Args:
+        estado: Lista representando o tabuleiro atual
+        especificacao: Dimensões e objetivo do tabuleiro
         
     Returns:
         Valor da heurística
     """
-    if metodo == 'manhattan':
-        return distancia_manhattan(estado.tabuleiro)
-    elif metodo == 'pecas_fora':
-        return pecas_fora_do_lugar(estado.tabuleiro)
+    largura = especificacao.largura
+    total = distancia_manhattan(estado, especificacao)
+    
+    for linha in range(especificacao.altura):
+        conteudo = tuple(estado[linha * largura : (linha + 1) * largura])
+        total += _penalidade_linha(especificacao, linha, conteudo)
+    
+    for coluna in range(largura):
+        total += _penalidade_coluna(especificacao, coluna, tuple(estado[coluna::largura]))
+    
+    return total
+
+
+def variacao_conflito_linear(
+    estado: List[int],
+    especificacao: EspecificacaoPuzzle,
+    indice_peca: int,
+    indice_vazio: int,
+) -> int:
+    """
+    Variação de conflito_linear quando a peça em indice_peca desliza para o vazio.
+    
+    Um movimento vertical só muda o conteúdo de duas linhas (a ordem das
+    peças nas colunas não muda) e um horizontal só o de duas colunas, então
+    basta recalcular essas duas penalidades e somar a variação da distância
+    de Manhattan.
+    
+    Args:
+        estado: Lista representando o tabuleiro ANTES do movimento
+        especificacao: Dimensões e objetivo do tabuleiro
+        indice_peca: Índice da peça que vai deslizar
+        indice_vazio: Índice do espaço vazio
+        
+    Returns:
+        Diferença entre a heurística depois e antes do movimento
+    """
+    peca = estado[indice_peca]
+    variacao = obter_tabela_delta('manhattan', especificacao)[peca][indice_peca][indice_vazio]
+    largura = especificacao.largura
+    
+    depois = estado[:]
+    depois[indice_vazio] = peca
+    depois[indice_peca] = 0
+    
+    if abs(indice_peca - indice_vazio) == largura:
+        for linha in (indice_peca // largura, indice_vazio // largura):
+            inicio = linha * largura
+            variacao += _penalidade_linha(
+                especificacao, linha, tuple(depois[inicio : inicio + largura])
+            ) - _penalidade_linha(
+                especificacao, linha, tuple(estado[inicio : inicio + largura])
+            )
     else:
+        for coluna in (indice_peca % largura, indice_vazio % largura):
+            variacao += _penalidade_coluna(
+                especificacao, coluna, tuple(depois[coluna::largura])
+            ) - _penalidade_coluna(especificacao, coluna, tuple(estado[coluna::largura]))
+    
+    return variacao
+
+
+def construir_tabela_caminhada(
+    linhas: int, celulas_por_linha: int, linha_vazio_objetivo: int
+) -> Dict[Tuple[int, ...], int]:
+    """
+    Calcula a tabela da distância de caminhada para uma direção do tabuleiro.
+    
+    O estado abstrato é a matriz linhas x linhas em que a entrada [i][j]
+    conta as peças que estão na linha i e pertencem à linha j no objetivo.
+    Cada movimento troca o vazio com uma peça de uma linha vizinha; a busca
+    em amplitude a partir da matriz objetivo (diagonal) dá o número mínimo de
+    movimentos nessa direção. Para as colunas, basta usar a transposta.
+    
+    Args:
+        linhas: Número de linhas (ou colunas) do tabuleiro
+        celulas_por_linha: Número de posições em cada linha (ou coluna)
+        linha_vazio_objetivo: Linha (ou coluna) do vazio no objetivo
+        
+    Returns:
+        Dicionário matriz (achatada em tupla) -> número mínimo de movimentos
+    """
+    objetivo = [0] * (linhas * linhas)
+    for linha in range(linhas):
+        objetivo[linha * linhas + linha] = celulas_por_linha
+    # A linha do vazio tem uma peça a menos
+    objetivo[linha_vazio_objetivo * linhas + linha_vazio_objetivo] -= 1
+    objetivo = tuple(objetivo)
+    
+    distancias: Dict[Tuple[int, ...], int] = {objetivo: 0}
+    nivel = [(objetivo, linha_vazio_objetivo)]
+    distancia = 0
+    while nivel:
+        distancia += 1
+        proximo_nivel = []
+        for matriz, linha_vazio in nivel:
+            for linha_vizinha in (linha_vazio - 1, linha_vazio + 1):
+                if not 0 <= linha_vizinha < linhas:
+                    continue
+                for classe in range(linhas):
+                    origem = linha_vizinha * linhas + classe
+                    if matriz[origem] == 0:
+                        continue
+                    nova_matriz = list(matriz)
+                    nova_matriz[origem] -= 1
+                    nova_matriz[linha_vazio * linhas + classe] += 1
+                    nova_matriz = tuple(nova_matriz)
+                    if nova_matriz not in distancias:
+                        distancias[nova_matriz] = distancia
+                        proximo_nivel.append((nova_matriz, linha_vizinha))
+        nivel = proximo_nivel
+    
+    return distancias
+
+
+# Tabelas de distância de caminhada (linhas, colunas) já construídas
+_tabelas_caminhada: Dict[
+    EspecificacaoPuzzle, Tuple[Dict[Tuple[int, ...], int], Dict[Tuple[int, ...], int]]
+] = {}
+
+
+def distancia_caminhada(
+    estado: List[int], especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO
+) -> int:
+    """
+    Distância de caminhada (walking distance) do tabuleiro.
+    
+    Soma o mínimo de movimentos verticais, considerando só em que linha cada
+    peça está e a que linha pertence, com o mínimo de movimentos horizontais,
+    considerando o mesmo para as colunas. Como cada movimento é vertical ou
+    horizontal, a soma é admissível. Captura interações entre peças que a
+    distância de Manhattan ignora. As tabelas são construídas uma vez por
+    tabuleiro, no primeiro uso (no 5x5 a construção leva alguns minutos).
+    
+    Args:
+        estado: Lista representando o tabuleiro atual
+        especificacao: Dimensões e objetivo do tabuleiro
+        
+    Returns:
+        Valor da heurística
+    """
+    tabelas = _tabelas_caminhada.get(especificacao)
+    if tabelas is None:
+        tabelas = (
+            construir_tabela_caminhada(
+                especificacao.altura,
+                especificacao.largura,
+                especificacao.linhas_objetivo[0],
+            ),
+            construir_tabela_caminhada(
+                especificacao.largura,
+                especificacao.altura,
+                especificacao.colunas_objetivo[0],
+            ),
+        )
+        _tabelas_caminhada[especificacao] = tabelas
+    tabela_linhas, tabela_colunas = tabelas
+    
+    largura = especificacao.largura
+    altura = especificacao.altura
+    linhas_objetivo = especificacao.linhas_objetivo
+    colunas_objetivo = especificacao.colunas_objetivo
+    matriz_linhas = [0] * (altura * altura)
+    matriz_colunas = [0] * (largura * largura)
+    for indice, peca in enumerate(estado):
+        if peca != 0:
+            linha, coluna = divmod(indice, largura)
+            matriz_linhas[linha * altura + linhas_objetivo[peca]] += 1
+            matriz_colunas[coluna * largura + colunas_objetivo[peca]] += 1
+    
+    return tabela_linhas[tuple(matriz_linhas)] + tabela_colunas[tuple(matriz_colunas)]
+
+
+# Funções de heurística por método: (tabuleiro, especificação) -> valor
+FUNCOES_HEURISTICA = {
+    'manhattan': distancia_manhattan,
+    'pecas_fora': pecas_fora_do_lugar,
+    'padroes': banco_padroes_aditivo,
+    'conflito_linear': conflito_linear,
+    'caminhada': distancia_caminhada,
+}
+
+
+# Variação incremental dos métodos que não são soma de termos por peça:
+# (tabuleiro antes do movimento, especificação, índice da peça, índice do vazio)
+VARIACOES_HEURISTICA = {
+    'conflito_linear': variacao_conflito_linear,
+}
+
+
+def obter_funcao_heuristica(metodo: str):
+    """
+    Retorna a função de heurística de um método.
+    
+    Args:
+        metodo: Método de heurística (uma das chaves de FUNCOES_HEURISTICA)
+        
+    Returns:
+        Função que recebe a lista do tabuleiro e a especificação e retorna
+        o valor da heurística
+    """
+    funcao = FUNCOES_HEURISTICA.get(metodo)
+    if funcao is None:
         raise ValueError(f"Método de heurística desconhecido: {metodo}")
+    return funcao
+
+
+def calcular_heuristica(
+    estado: Union[EstadoPuzzle, EstadoCompacto],
+    metodo: str = 'manhattan',
+    heuristica_pai: Optional[int] = None,
+    indice_vazio_pai: Optional[int] = None,
+) -> int:
+    """
+    Calcula a heurística para um estado usando o método especificado.
+    
+    Se a heurística do pai e a posição do vazio no pai forem informadas e o
+    método tiver tabela de variação, o valor é obtido em O(1): a peça que
+    deslizou foi da posição do vazio no filho para a posição do vazio no pai.
+    Métodos com função em VARIACOES_HEURISTICA também são atualizados a
+    partir do pai, recalculando só as linhas afetadas pelo movimento.
+    
+    Args:
+        estado: Estado do puzzle (normal ou compactado)
+        metodo: Método de heurística (uma das chaves de FUNCOES_HEURISTICA)
+        heuristica_pai: Valor da heurística do estado pai (opcional)
+        indice_vazio_pai: Índice do espaço vazio no estado pai (opcional)
+        
+    Returns:
+        Valor da heurística
+    """
+    especificacao = estado.especificacao
+    if heuristica_pai is not None and indice_vazio_pai is not None:
+        tabela_delta = obter_tabela_delta(metodo, especificacao)
+        if tabela_delta is not None:
+            if isinstance(estado, EstadoCompacto):
+                deslocamento = indice_vazio_pai * especificacao.bits_por_peca
+                peca = (estado.codigo >> deslocamento) & especificacao.mascara_peca
+                indice_vazio = estado.indice_vazio
+            else:
+                peca = estado.tabuleiro[indice_vazio_pai]
+                indice_vazio = estado.tabuleiro.index(0)
+            return heuristica_pai + tabela_delta[peca][indice_vazio][indice_vazio_pai]
+        
+        funcao_variacao = VARIACOES_HEURISTICA.get(metodo)
+        if funcao_variacao is not None:
+            # Reconstrói o pai desfazendo o movimento numa cópia do tabuleiro
+            # do filho (em EstadoPuzzle o atributo é a lista do próprio estado)
+            tabuleiro_pai = list(estado.tabuleiro)
+            indice_vazio = tabuleiro_pai.index(0)
+            tabuleiro_pai[indice_vazio] = tabuleiro_pai[indice_vazio_pai]
+            tabuleiro_pai[indice_vazio_pai] = 0
+            return heuristica_pai + funcao_variacao(
+                tabuleiro_pai, especificacao, indice_vazio, indice_vazio_pai
+            )
+    
+    return obter_funcao_heuristica(metodo)(estado.tabuleiro, especificacao)
 
@@ -0,0 +1,184 @@
+"""
+Instrumentação das buscas: amostras periódicas entregues a um observador.
+
+Um ObservadorBusca recebe, a cada `intervalo` nós expandidos, uma
+AmostraBusca com a taxa de expansão, o tamanho da fronteira, a distribuição
+dos valores de f na fronteira, a taxa de estados repetidos, o tempo gasto
+calculando heurísticas e gerando filhos e a memória estimada. Ao fim da
+busca recebe o ResultadoBusca e uma última amostra.
+
+Sem observador as buscas não medem tempos nem montam amostras; o único
+custo que sobra é a contagem de estados repetidos, um inteiro local.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+from limites import INTERVALO_VERIFICACAO, estimar_memoria
+
+
+class AmostraBusca:
+    """Retrato de uma busca em andamento."""
+
+    def __init__(self):
+        self.nos_expandidos = 0
+        self.tempo_decorrido = 0.0
+        # Taxa de expansão desde a amostra anterior
+        self.nos_por_segundo = 0.0
+        self.tamanho_fronteira = 0
+        self.estados_guardados = 0
+        self.profundidade = 0
+        # f -> quantidade de nós na fronteira (None se a busca não a informa)
+        self.distribuicao_f: Optional[Dict[int, int]] = None
+        # Fração dos filhos gerados que já tinham sido vistos (None se a
+        # busca não detecta repetidos)
+        self.taxa_duplicados: Optional[float] = None
+        # Tempos acumulados em segundos (None se a busca não os separa)
+        self.tempo_heuristica: Optional[float] = None
+        self.tempo_geracao: Optional[float] = None
+        self.memoria_estimada = 0
+
+    def como_dicionario(self) -> dict:
+        """Campos da amostra, prontos para json.dumps ou para um sistema de métricas."""
+        dados = dict(vars(self))
+        if self.distribuicao_f is not None:
+            dados["distribuicao_f"] = {
+                str(f): quantidade for f, quantidade in sorted(self.distribuicao_f.items())
+            }
+        return dados
+
+
+class ObservadorBusca:
+    """
+    Interface dos observadores de busca.
+
+    As subclasses sobrescrevem ao_amostrar e/ou ao_concluir. Os métodos são
+    chamados na thread da busca, então devem ser rápidos.
+    """
+
+    # Nós expandidos entre duas amostras
+    intervalo = INTERVALO_VERIFICACAO
+
+    def ao_amostrar(self, amostra: AmostraBusca):
+        """Recebe uma amostra periódica."""
+
+    def ao_concluir(self, resultado, amostra: AmostraBusca):
+        """
+        Recebe o resultado da busca e a amostra final.
+
+        Args:
+            resultado: ResultadoBusca devolvido pela busca
+            amostra: Amostra no momento em que a busca parou
+        """
+
+
+class RegistroAmostras(ObservadorBusca):
+    """Observador que guarda todas as amostras em memória."""
+
+    def __init__(self, intervalo: int = INTERVALO_VERIFICACAO):
+        self.intervalo = intervalo
+        self.amostras: List[AmostraBusca] = []
+        self.final: Optional[AmostraBusca] = None
+
+    def ao_amostrar(self, amostra: AmostraBusca):
+        self.amostras.append(amostra)
+
+    def ao_concluir(self, resultado, amostra: AmostraBusca):
+        self.final = amostra
+
+
+class MedicaoBusca:
+    """Monta as amostras de uma busca e as entrega ao observador."""
+
+    def __init__(
+        self,
+        observador: ObservadorBusca,
+        memoria_guardados: Optional[Callable[[], int]] = None,
+    ):
+        """
+        Inicializa a medição no início da busca.
+
+        Args:
+            observador: Observador que recebe as amostras
+            memoria_guardados: Função que devolve os bytes de uma tabela de
+                estados compacta (veja limites.ControleParada)
+        """
+        self.observador = observador
+        self.memoria_guardados = memoria_guardados
+        self.inicio = time.perf_counter()
+        self._instante_anterior = self.inicio
+        self._nos_anterior = 0
+        self._proxima_amostra = observador.intervalo
+        # Acumuladores para buscas cujo laço é dividido em funções; as demais
+        # acumulam em variáveis locais e informam os totais em amostrar
+        self.duplicados = 0
+        self.tempo_geracao = 0.0
+
+    def amostrar(
+        self,
+        nos_expandidos: int,
+        estados_guardados: int,
+        tamanho_fronteira: int,
+        profundidade: int,
+        duplicados: Optional[int] = None,
+        tempo_heuristica: Optional[float] = None,
+        tempo_geracao: Optional[float] = None,
+        distribuicao_f: Optional[Dict[int, int]] = None,
+        resultado=None,
+    ) -> Optional[AmostraBusca]:
+        """
+        Monta uma amostra e a entrega ao observador.
+
+        As buscas chamam este método a cada verificação de limites, que pode
+        ser mais frequente que o intervalo do observador; as chamadas antes
+        do intervalo são ignoradas.
+
+        Args:
+            nos_expandidos: Nós expandidos até agora
+            estados_guardados: Estados na tabela de visitados/pais
+            tamanho_fronteira: Nós na fronteira
+            profundidade: Profundidade (ou custo g) atual
+            duplicados: Filhos descartados por já terem sido vistos
+            tempo_heuristica: Tempo acumulado no cálculo da heurística
+            tempo_geracao: Tempo acumulado na geração de filhos
+            distribuicao_f: Quantidade de nós na fronteira por valor de f
+            resultado: ResultadoBusca final; se informado, a amostra vai para
+                ao_concluir em vez de ao_amostrar
+
+        Returns:
+            A amostra entregue, ou None se ainda não era hora de amostrar
+        """
+        if resultado is None:
+            if nos_expandidos < self._proxima_amostra:
+                return None
+            self._proxima_amostra = nos_expandidos + self.observador.intervalo
+
+        agora = time.perf_counter()
+        amostra = AmostraBusca()
+        amostra.nos_expandidos = nos_expandidos
+        amostra.tempo_decorrido = agora - self.inicio
+        intervalo = agora - self._instante_anterior
+        if intervalo > 0:
+            amostra.nos_por_segundo = (nos_expandidos - self._nos_anterior) / intervalo
+        amostra.tamanho_fronteira = tamanho_fronteira
+        amostra.estados_guardados = estados_guardados
+        amostra.profundidade = profundidade
+        amostra.distribuicao_f = distribuicao_f
+        if duplicados is not None:
+            # Cada estado guardado, fora o inicial, veio de um filho novo
+            gerados = duplicados + max(estados_guardados - 1, 0)
+            amostra.taxa_duplicados = duplicados / gerados if gerados else 0.0
+        amostra.tempo_heuristica = tempo_heuristica
+        amostra.tempo_geracao = tempo_geracao
+        amostra.memoria_estimada = estimar_memoria(
+            estados_guardados,
+            tamanho_fronteira,
+            self.memoria_guardados() if self.memoria_guardados is not None else None,
+        )
+
+        self._instante_anterior = agora
+        self._nos_anterior = nos_expandidos
+        if resultado is None:
+            self.observador.ao_amostrar(amostra)
+        else:
+            self.observador.ao_concluir(resultado, amostra)
+        return amostra
@@ -1,6 +1,8 @@
 """
 Interface gráfica para o Jogo dos Oito usando tkinter.
 """
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from typing import List, Optional
@@ -8,6 +10,9 @@ from estado_puzzle import EstadoPuzzle
 from jogo_oito import JogoOito
 from busca_amplitude import buscar_solucao_amplitude, ResultadoBusca
 from busca_a_estrela import buscar_solucao_a_estrela, imprimir_resultado_a_estrela
+from busca_bidirecional import buscar_solucao_bidirecional
+from busca_ida_estrela import buscar_solucao_ida_estrela
+from limites import PARADA_CANCELADA, LimitesBusca, TokenCancelamento
 
 
 class InterfaceJogoOito:
@@ -19,6 +24,9 @@ class InterfaceJogoOito:
     # Estado final padrão (sempre o mesmo, ordenado)
     ESTADO_FINAL = [1, 2, 3, 8, 0, 4, 7, 6, 5]
     
+    # Intervalo (ms) entre as consultas ao andamento da busca em segundo plano
+    INTERVALO_VERIFICACAO = 100
+    
     def __init__(self, root: tk.Tk):
         """
         Inicializa a interface.
@@ -38,6 +46,12 @@ class InterfaceJogoOito:
         self.indice_caminho_atual = 0
         self.estados_animacao: List[List[int]] = []
         
+        # Busca em segundo plano: a thread publica mensagens na fila e a
+        # interface as consome periodicamente com root.after
+        self.thread_busca: Optional[threading.Thread] = None
+        self.fila_busca: "queue.Queue[tuple]" = queue.Queue()
+        self.token_cancelamento = TokenCancelamento()
+        
         self._criar_interface()
         self._atualizar_tabuleiro(self.estado_atual, "Estado Inicial")
     
@@ -80,19 +94,19 @@ class InterfaceJogoOito:
         self.entry_estado.grid(row=0, column=1, padx=5)
         
         # Botões
-        btn_aplicar = ttk.Button(
+        self.btn_aplicar = ttk.Button(
             frame_config,
             text="Aplicar Estado",
             command=self._aplicar_estado_customizado
         )
-        btn_aplicar.grid(row=0, column=2, padx=5)
+        self.btn_aplicar.grid(row=0, column=2, padx=5)
         
-        btn_padrao = ttk.Button(
+        self.btn_padrao = ttk.Button(
             frame_config,
             text="Usar Padrão",
             command=self._usar_estado_padrao
         )
-        btn_padrao.grid(row=0, column=3, padx=5)
+        self.btn_padrao.grid(row=0, column=3, padx=5)
         
         # Label de ajuda
         ttk.Label(
@@ -127,30 +141,48 @@ class InterfaceJogoOito:
         # Seleção de método
         ttk.Label(frame_controles, text="Método de Busca:").grid(row=0, column=0, padx=5, pady=5)
         self.var_metodo = tk.StringVar(value="A*")
-        combo_metodo = ttk.Combobox(
+        self.combo_metodo = ttk.Combobox(
             frame_controles,
             textvariable=self.var_metodo,
-            values=["A*", "Busca em Amplitude"],
+            values=["A*", "IDA*", "Busca em Amplitude", "Busca Bidirecional"],
             state="readonly",
             width=20
         )
-        combo_metodo.grid(row=0, column=1, padx=5, pady=5)
+        self.combo_metodo.grid(row=0, column=1, padx=5, pady=5)
         
         # Botão de busca
-        btn_buscar = ttk.Button(
+        self.btn_buscar = ttk.Button(
             frame_controles,
             text="Buscar Solução",
             command=self._executar_busca
         )
-        btn_buscar.grid(row=0, column=2, padx=10, pady=5)
+        self.btn_buscar.grid(row=0, column=2, padx=10, pady=5)
+        
+        # Botão de cancelamento (ativo só durante a busca)
+        self.btn_cancelar = ttk.Button(
+            frame_controles,
+            text="Cancelar",
+            command=self._cancelar_busca,
+            state=tk.DISABLED
+        )
+        self.btn_cancelar.grid(row=0, column=3, padx=5, pady=5)
         
         # Botão de reset
-        btn_reset = ttk.Button(
+        self.btn_reset = ttk.Button(
             frame_controles,
             text="Reset",
             command=self._resetar
         )
-        btn_reset.grid(row=0, column=3, padx=5, pady=5)
+        self.btn_reset.grid(row=0, column=4, padx=5, pady=5)
+        
+        # Andamento da busca em segundo plano
+        self.label_progresso = ttk.Label(
+            frame_controles,
+            text="",
+            font=("Arial", 9),
+            foreground="gray"
+        )
+        self.label_progresso.grid(row=1, column=0, columnspan=5, pady=(5, 0))
         
         # Frame de animação
         frame_animacao = ttk.LabelFrame(frame_principal, text="Visualização da Solução", padding="8")
@@ -281,39 +313,145 @@ class InterfaceJogoOito:
         self._limpar_resultados()
     
     def _executar_busca(self):
-        """Executa a busca selecionada."""
+        """Inicia a busca selecionada em uma thread, sem travar a janela."""
+        if self.thread_busca is not None:
+            return
+        
         metodo = self.var_metodo.get()
+        if metodo == "A*":
+            funcao_busca = buscar_solucao_a_estrela
+        elif metodo == "IDA*":
+            funcao_busca = buscar_solucao_ida_estrela
+        elif metodo == "Busca Bidirecional":
+            funcao_busca = buscar_solucao_bidirecional
+        else:  # Busca em Amplitude
+            funcao_busca = buscar_solucao_amplitude
         
         self.texto_resultados.delete(1.0, tk.END)
         self.texto_resultados.insert(tk.END, f"Executando busca {metodo}...\n\n")
-        self.root.update()
+        self.label_progresso.config(text="Iniciando busca...")
+        self._definir_busca_em_andamento(True)
+        
+        self.token_cancelamento = TokenCancelamento()
+        self.fila_busca = queue.Queue()
+        self.thread_busca = threading.Thread(
+            target=self._executar_busca_em_segundo_plano,
+            args=(funcao_busca, self.estado_atual[:], self.fila_busca, self.token_cancelamento),
+            daemon=True
+        )
+        self.thread_busca.start()
+        self.root.after(self.INTERVALO_VERIFICACAO, self._verificar_busca)
+    
+    def _executar_busca_em_segundo_plano(
+        self, funcao_busca, estado: List[int], fila: queue.Queue, token: TokenCancelamento
+    ):
+        """
+        Corpo da thread de busca. Não toca em nenhum widget: tudo o que a
+        interface precisa saber é publicado na fila.
+        
+        Args:
+            funcao_busca: Função de busca a executar
+            estado: Cópia do estado inicial
+            fila: Fila de mensagens para a interface
+            token: Token acionado pelo botão Cancelar
+        """
+        def progresso(nos_expandidos: int, tamanho_fronteira: int, profundidade: int):
+            fila.put(("progresso", nos_expandidos, tamanho_fronteira, profundidade))
         
         try:
-            if metodo == "A*":
-                self.resultado_busca = buscar_solucao_a_estrela(self.estado_atual)
-            else:  # Busca em Amplitude
-                self.resultado_busca = buscar_solucao_amplitude(self.estado_atual)
+            resultado = funcao_busca(
+                estado, progresso=progresso, limites=LimitesBusca(token=token)
+            )
+            fila.put(("concluida", resultado))
+        except Exception as e:
+            fila.put(("erro", str(e)))
+    
+    def _verificar_busca(self):
+        """Consome as mensagens da thread de busca (chamado via root.after)."""
+        ultimo_progresso = None
+        while True:
+            try:
+                mensagem = self.fila_busca.get_nowait()
+            except queue.Empty:
+                break
             
-            if self.resultado_busca.solucao_encontrada:
-                # Prepara animação
-                self._preparar_animacao()
-                
-                # Exibe resultados
-                self._exibir_resultados()
-                
-                messagebox.showinfo(
-                    "Sucesso",
-                    f"Solução encontrada!\n\n"
-                    f"Método: {metodo}\n"
-                    f"Movimentos: {len(self.resultado_busca.caminho)}\n"
-                    f"Nós expandidos: {self.resultado_busca.nos_expandidos}\n"
-                    f"Tempo: {self.resultado_busca.tempo_execucao:.4f}s"
-                )
+            if mensagem[0] == "progresso":
+                ultimo_progresso = mensagem
+            elif mensagem[0] == "concluida":
+                self._finalizar_busca(mensagem[1])
+                return
             else:
-                messagebox.showerror("Erro", "Solução não encontrada!")
-                
-        except Exception as e:
-            messagebox.showerror("Erro", f"Erro durante a busca:\n{str(e)}")
+                self._finalizar_busca(None)
+                messagebox.showerror("Erro", f"Erro durante a busca:\n{mensagem[1]}")
+                return
+        
+        if ultimo_progresso is not None:
+            _, nos_expandidos, tamanho_fronteira, profundidade = ultimo_progresso
+            texto = (
+                f"Nós expandidos: {nos_expandidos}  |  Fronteira: {tamanho_fronteira}"
+                f"  |  Profundidade: {profundidade}"
+            )
+            if self.token_cancelamento.cancelado:
+                texto = "Cancelando...  " + texto
+            self.label_progresso.config(text=texto)
+        
+        self.root.after(self.INTERVALO_VERIFICACAO, self._verificar_busca)
+    
+    def _cancelar_busca(self):
+        """Pede à thread de busca que pare na próxima verificação de limites."""
+        if self.thread_busca is not None:
+            self.token_cancelamento.cancelar()
+            self.label_progresso.config(text="Cancelando...")
+    
+    def _definir_busca_em_andamento(self, em_andamento: bool):
+        """Habilita/desabilita os controles enquanto uma busca está rodando."""
+        estado_controles = tk.DISABLED if em_andamento else tk.NORMAL
+        for botao in (self.btn_buscar, self.btn_reset, self.btn_aplicar, self.btn_padrao):
+            botao.config(state=estado_controles)
+        self.btn_cancelar.config(state=tk.NORMAL if em_andamento else tk.DISABLED)
+        self.combo_metodo.config(state=tk.DISABLED if em_andamento else "readonly")
+    
+    def _finalizar_busca(self, resultado: Optional[ResultadoBusca]):
+        """
+        Mostra o resultado de uma busca encerrada (concluída ou cancelada).
+        
+        Args:
+            resultado: Resultado da busca, ou None se ela terminou com erro
+        """
+        self.thread_busca = None
+        self._definir_busca_em_andamento(False)
+        self.label_progresso.config(text="")
+        if resultado is None:
+            return
+        
+        metodo = self.var_metodo.get()
+        self.resultado_busca = resultado
+        
+        if resultado.solucao_encontrada:
+            # Prepara animação
+            self._preparar_animacao()
+            
+            # Exibe resultados
+            self._exibir_resultados()
+            
+            messagebox.showinfo(
+                "Sucesso",
+                f"Solução encontrada!\n\n"
+                f"Método: {metodo}\n"
+                f"Movimentos: {len(resultado.caminho)}\n"
+                f"Nós expandidos: {resultado.nos_expandidos}\n"
+                f"Tempo: {resultado.tempo_execucao:.4f}s"
+            )
+        elif resultado.motivo_parada == PARADA_CANCELADA:
+            self._exibir_resultados()
+        elif not resultado.soluvel:
+            messagebox.showerror(
+                "Erro",
+                "Este estado não tem solução!\n\n"
+                "A paridade das inversões é diferente da do estado objetivo."
+            )
+        else:
+            messagebox.showerror("Erro", "Solução não encontrada!")
     
     def _preparar_animacao(self):
         """Prepara os estados para animação do caminho."""
@@ -404,6 +542,8 @@ class InterfaceJogoOito:
             texto += f"Caminho da solução:\n"
             texto += f"{' → '.join(resultado.caminho)}\n\n"
             texto += f"Número de movimentos: {len(resultado.caminho)}\n"
+        elif resultado.motivo_parada == PARADA_CANCELADA:
+            texto += f"✗ Busca cancelada pelo usuário\n\n"
         else:
             texto += f"✗ Solução não encontrada\n\n"
         
@@ -2,33 +2,77 @@
 Classe principal do Jogo dos Oito com lógica de movimentos.
 """
 
-from typing import List, Optional
-from estado_puzzle import EstadoPuzzle
+from typing import List, Optional, Tuple
+from especificacao import (
+    EspecificacaoPuzzle,
+    MOVIMENTOS,
+    MOVIMENTOS_OPOSTOS,
+    inferir_especificacao,
+)
+from estado_puzzle import EstadoPuzzle, EstadoCompacto
+
+
+def _contar_inversoes(sequencia: List[int]) -> int:
+    """
+    Conta as inversões de uma sequência com merge sort, em O(n log n).
+
+    Args:
+        sequencia: Lista de inteiros distintos
+
+    Returns:
+        Número de pares (i, j) com i < j e sequencia[i] > sequencia[j]
+    """
+    if len(sequencia) <= 1:
+        return 0
+
+    meio = len(sequencia) // 2
+    esquerda = sequencia[:meio]
+    direita = sequencia[meio:]
+    inversoes = _contar_inversoes(esquerda) + _contar_inversoes(direita)
+
+    # Intercala as metades já ordenadas, contando os pares invertidos
+    i = j = k = 0
+    while i < len(esquerda) and j < len(direita):
+        if esquerda[i] <= direita[j]:
+            sequencia[k] = esquerda[i]
+            i += 1
+        else:
+            sequencia[k] = direita[j]
+            j += 1
+            inversoes += len(esquerda) - i
+        k += 1
+    sequencia[k:] = esquerda[i:] + direita[j:]
+
+    return inversoes
 
 
 class JogoOito:
     """Gerencia a lógica do Jogo dos Oito."""
 
-    # Movimentos possíveis
-    MOVIMENTOS = {
-        "Cima": (-1, 0),
-        "Baixo": (1, 0),
-        "Esquerda": (0, -1),
-        "Direita": (0, 1),
-    }
+    MOVIMENTOS = MOVIMENTOS
 
-    def __init__(self, estado_inicial: List[int]):
+    def __init__(
+        self,
+        estado_inicial: List[int],
+        especificacao: Optional[EspecificacaoPuzzle] = None,
+    ):
         """
         Inicializa o jogo com um estado inicial.
 
         Args:
-            estado_inicial: Lista de 9 elementos representando o estado inicial
+            estado_inicial: Lista representando o estado inicial
+            especificacao: Dimensões e objetivo do tabuleiro (deduzidos do
+                número de posições se omitidos)
         """
         self.estado_inicial = estado_inicial[:]
+        if especificacao is None:
+            especificacao = inferir_especificacao(estado_inicial)
+        self.especificacao = especificacao
+        self.vizinhos = especificacao.vizinhos
 
     def validar_estado(self, estado: List[int]) -> bool:
         """
-        Valida se um estado é válido (9 elementos, contém 0-8, sem repetições).
+        Valida se um estado é válido (uma posição por casa, sem repetições).
 
         Args:
             estado: Lista representando o tabuleiro
@@ -36,12 +80,67 @@ class JogoOito:
         Returns:
             True se o estado é válido
         """
-        if len(estado) != 9:
+        tamanho = self.especificacao.tamanho
+        if len(estado) != tamanho:
             return False
-        if set(estado) != set(range(9)):
+        if set(estado) != set(range(tamanho)):
             return False
         return True
 
+    def exigir_estado_valido(self, estado: List[int]):
+        """
+        Garante que o estado é um tabuleiro da especificação.
+
+        As buscas chamam este método antes do teste de paridade: um tabuleiro
+        com peças repetidas pode passar nele e fazer a busca percorrer todos
+        os estados alcançáveis sem encontrar o objetivo.
+
+        Args:
+            estado: Lista representando o tabuleiro
+
+        Raises:
+            ValueError: Se o estado não é uma permutação de 0..tamanho-1
+        """
+        if not self.validar_estado(estado):
+            especificacao = self.especificacao
+            raise ValueError(
+                f"Tabuleiro inválido para {especificacao.largura}x"
+                f"{especificacao.altura}: {list(estado)}"
+            )
+
+    def eh_soluvel(self, estado: List[int]) -> bool:
+        """
+        Verifica se o estado pode alcançar o estado objetivo.
+
+        Cada posição é trocada pela posição que a sua peça (incluindo o vazio)
+        ocupa no objetivo, de modo que as inversões são medidas em relação ao
+        objetivo da especificação e não à ordem crescente. Cada movimento é
+        uma transposição e desloca o vazio uma casa, então o estado é solúvel
+        se a paridade das inversões é igual à paridade da distância do vazio
+        até a sua posição no objetivo. A regra vale para qualquer largura.
+
+        O estado deve ser válido (veja exigir_estado_valido).
+
+        Args:
+            estado: Lista representando o tabuleiro
+
+        Returns:
+            True se existe solução a partir do estado
+        """
+        especificacao = self.especificacao
+        posicoes_objetivo = especificacao.posicoes_objetivo
+        sequencia = [posicoes_objetivo[valor] for valor in estado]
+
+        linha_vazio, coluna_vazio = especificacao.linha_coluna(estado.index(0))
+        linha_objetivo, coluna_objetivo = especificacao.linha_coluna(
+            especificacao.indice_vazio_objetivo
+        )
+        distancia_vazio = abs(linha_vazio - linha_objetivo) + abs(
+            coluna_vazio - coluna_objetivo
+        )
+
+        return _contar_inversoes(sequencia) % 2 == distancia_vazio % 2
+
     def mover(self, estado: List[int], movimento: str) -> Optional[List[int]]:
         """
         Realiza um movimento no tabuleiro.
@@ -53,35 +152,24 @@ class JogoOito:
         Returns:
             Novo estado após o movimento ou None se movimento inválido
         """
-        if movimento not in self.MOVIMENTOS:
-            return None
-
-        novo_estado = estado[:]
-        linha_atual, coluna_atual = self._obter_posicao_vazia(estado)
-
-        delta_linha, delta_coluna = self.MOVIMENTOS[movimento]
-        nova_linha = linha_atual + delta_linha
-        nova_coluna = coluna_atual + delta_coluna
+        indice_vazio = estado.index(0)
 
-        # Verifica se o movimento é válido (dentro dos limites)
-        if not (0 <= nova_linha < 3 and 0 <= nova_coluna < 3):
-            return None
+        for nome, indice_troca in self.vizinhos[indice_vazio]:
+            if nome == movimento:
+                novo_estado = estado[:]
+                novo_estado[indice_vazio] = novo_estado[indice_troca]
+                novo_estado[indice_troca] = 0
+                return novo_estado
 
-        # Realiza a troca
-        indice_vazio = self._linha_coluna_para_indice(linha_atual, coluna_atual)
-        indice_troca = self._linha_coluna_para_indice(nova_linha, nova_coluna)
-
-        novo_estado[indice_vazio], novo_estado[indice_troca] = (
-            novo_estado[indice_troca],
-            novo_estado[indice_vazio],
-        )
-
-        return novo_estado
+        # Movimento desconhecido ou fora dos limites
+        return None
 
     def gerar_filhos(self, estado: EstadoPuzzle) -> List[EstadoPuzzle]:
         """
         Gera todos os estados filhos possíveis a partir de um estado.
 
+        O movimento que desfaz o movimento que gerou o estado não é gerado.
+
         Args:
             estado: Estado atual
 
@@ -89,32 +177,70 @@ class JogoOito:
             Lista de estados filhos válidos
         """
         filhos = []
+        tabuleiro = estado.tabuleiro
+        indice_vazio = tabuleiro.index(0)
+        movimento_desfeito = MOVIMENTOS_OPOSTOS.get(estado.movimento)
 
-        for movimento in self.MOVIMENTOS.keys():
-            novo_tabuleiro = self.mover(estado.tabuleiro, movimento)
+        for movimento, indice_troca in self.vizinhos[indice_vazio]:
+            if movimento == movimento_desfeito:
+                continue
 
-            if novo_tabuleiro is not None:
-                filho = EstadoPuzzle(
-                    tabuleiro=novo_tabuleiro,
-                    estado_pai=estado,
-                    movimento=movimento,
-                    profundidade=estado.profundidade + 1,
-                    custo=estado.custo + 1,
-                )
-                filhos.append(filho)
+            novo_tabuleiro = tabuleiro[:]
+            novo_tabuleiro[indice_vazio] = novo_tabuleiro[indice_troca]
+            novo_tabuleiro[indice_troca] = 0
+
+            filho = EstadoPuzzle(
+                tabuleiro=novo_tabuleiro,
+                estado_pai=estado,
+                movimento=movimento,
+                profundidade=estado.profundidade + 1,
+                custo=estado.custo + 1,
+                especificacao=self.especificacao,
+            )
+            filhos.append(filho)
 
         return filhos
 
-    def _obter_posicao_vazia(self, estado: List[int]) -> tuple:
-        """Retorna a posição (linha, coluna) do espaço vazio."""
-        indice = estado.index(0)
-        linha = indice // 3
-        coluna = indice % 3
-        return (linha, coluna)
+    def gerar_filhos_compactos(
+        self, estado: EstadoCompacto, movimento_anterior: Optional[str] = None
+    ) -> List[Tuple[str, EstadoCompacto]]:
+        """
+        Gera os filhos de um estado compactado, sem descompactar o tabuleiro.
+
+        A troca é feita diretamente no inteiro: a peça vizinha é removida da
+        sua posição e escrita na posição do espaço vazio (que vale 0).
+
+        Args:
+            estado: Estado compactado atual
+            movimento_anterior: Movimento que gerou o estado; o seu oposto
+                não é gerado
+
+        Returns:
+            Lista de pares (movimento, estado filho)
+        """
+        filhos = []
+        especificacao = self.especificacao
+        bits_por_peca = especificacao.bits_por_peca
+        mascara_peca = especificacao.mascara_peca
+        codigo = estado.codigo
+        indice_vazio = estado.indice_vazio
+        deslocamento_vazio = indice_vazio * bits_por_peca
+        movimento_desfeito = MOVIMENTOS_OPOSTOS.get(movimento_anterior)
+
+        for movimento, indice_troca in self.vizinhos[indice_vazio]:
+            if movimento == movimento_desfeito:
+                continue
 
-    def _linha_coluna_para_indice(self, linha: int, coluna: int) -> int:
-        """Converte posição (linha, coluna) para índice linear."""
-        return linha * 3 + coluna
+            deslocamento_troca = indice_troca * bits_por_peca
+            peca = (codigo >> deslocamento_troca) & mascara_peca
+            novo_codigo = (
+                codigo - (peca << deslocamento_troca) + (peca << deslocamento_vazio)
+            )
+            filhos.append(
+                (movimento, EstadoCompacto(novo_codigo, indice_troca, especificacao))
+            )
+
+        return filhos
 
     def formatar_tabuleiro(self, estado: List[int]) -> str:
         """
@@ -126,8 +252,14 @@ class JogoOito:
         Returns:
             String formatada do tabuleiro
         """
+        largura = self.especificacao.largura
+        largura_celula = len(str(self.especificacao.tamanho - 1))
         linhas = []
-        for i in range(0, 9, 3):
-            linha = estado[i : i + 3]
-            linhas.append(" | ".join(str(x) if x != 0 else " " for x in linha))
+        for i in range(0, len(estado), largura):
+            linha = estado[i : i + largura]
+            linhas.append(
+                " | ".join(
+                    (str(x) if x != 0 else " ").rjust(largura_celula) for x in linha
+                )
+            )
         return "\n".join(linhas)
@@ -0,0 +1,198 @@
+"""
+Limites de execução e cancelamento cooperativo das buscas.
+
+As buscas não são interrompidas de fora: a cada INTERVALO_VERIFICACAO nós
+expandidos elas consultam um ControleParada, que confere o número de nós, a
+memória estimada, o prazo e o token de cancelamento. Quando um limite é
+atingido a busca devolve o ResultadoBusca parcial, com o motivo da parada.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+# Nós expandidos entre duas verificações de limites e de progresso
+INTERVALO_VERIFICACAO = 1000
+
+# Motivos de parada (ResultadoBusca.motivo_parada)
+PARADA_SOLUCAO = "solucao"
+PARADA_INSOLUVEL = "insoluvel"
+PARADA_ESGOTADA = "esgotada"
+PARADA_LIMITE_NOS = "limite_nos"
+PARADA_LIMITE_MEMORIA = "limite_memoria"
+PARADA_PRAZO = "prazo"
+PARADA_CANCELADA = "cancelada"
+
+# Memória estimada por estado guardado na tabela de pais (entrada do dict e
+# chave inteira; o código do movimento é um inteiro pequeno compartilhado,
+# veja tabela_pais.py) e por nó na fronteira, medidas com tracemalloc no 3x3
+BYTES_POR_ESTADO_GUARDADO = 110
+BYTES_POR_NO_FRONTEIRA = 200
+
+# Função de progresso: (nós expandidos, tamanho da fronteira, profundidade) -> continuar?
+FuncaoProgresso = Callable[[int, int, int], Optional[bool]]
+
+
+class TokenCancelamento:
+    """Sinal de cancelamento que pode ser acionado de outra thread."""
+
+    def __init__(self):
+        self._evento = threading.Event()
+
+    def cancelar(self):
+        """Pede que as buscas que usam este token parem."""
+        self._evento.set()
+
+    @property
+    def cancelado(self) -> bool:
+        """Indica se o cancelamento foi pedido."""
+        return self._evento.is_set()
+
+
+class LimitesBusca:
+    """Limites de uma busca; qualquer um deles pode ser omitido."""
+
+    def __init__(
+        self,
+        max_nos: Optional[int] = None,
+        max_memoria: Optional[int] = None,
+        tempo_limite: Optional[float] = None,
+        prazo: Optional[float] = None,
+        token: Optional[TokenCancelamento] = None,
+        intervalo: int = INTERVALO_VERIFICACAO,
+    ):
+        """
+        Inicializa os limites.
+
+        Args:
+            max_nos: Máximo de nós expandidos
+            max_memoria: Máximo de memória estimada, em bytes
+            tempo_limite: Tempo máximo de cada busca, em segundos
+            prazo: Instante limite comum a todas as buscas (em time.monotonic())
+            token: Token de cancelamento
+            intervalo: Nós expandidos entre duas verificações
+        """
+        self.max_nos = max_nos
+        self.max_memoria = max_memoria
+        self.tempo_limite = tempo_limite
+        self.prazo = prazo
+        self.token = token
+        self.intervalo = intervalo
+
+
+class ControleParada:
+    """Verificação periódica de limites e progresso durante uma busca."""
+
+    def __init__(
+        self,
+        limites: Optional[LimitesBusca] = None,
+        progresso: Optional[FuncaoProgresso] = None,
+        intervalo_observacao: Optional[int] = None,
+        memoria_guardados: Optional[Callable[[], int]] = None,
+    ):
+        """
+        Inicializa o controle no início da busca.
+
+        Args:
+            limites: Limites da busca (opcional)
+            progresso: Função de progresso; se devolver False a busca é cancelada
+            intervalo_observacao: Intervalo pedido por um observador da busca
+                (veja instrumentacao.py); as verificações usam o menor intervalo
+            memoria_guardados: Função que devolve os bytes da tabela de estados
+                guardados, para as tabelas compactas (veja
+                conjunto_visitados.medidor_memoria); sem ela a tabela é
+                estimada em BYTES_POR_ESTADO_GUARDADO por estado
+        """
+        self.limites = limites
+        self.progresso = progresso
+        self.memoria_guardados = memoria_guardados
+
+        self.prazo = None
+        if limites is not None:
+            self.prazo = limites.prazo
+            if limites.tempo_limite is not None:
+                prazo_relativo = time.monotonic() + limites.tempo_limite
+                if self.prazo is None or prazo_relativo < self.prazo:
+                    self.prazo = prazo_relativo
+
+        self.intervalo = limites.intervalo if limites is not None else INTERVALO_VERIFICACAO
+        if intervalo_observacao is not None:
+            self.intervalo = min(self.intervalo, intervalo_observacao)
+        # Sem limites, progresso nem observador a verificação nunca acontece
+        if limites is None and progresso is None and intervalo_observacao is None:
+            self.proxima_verificacao = float("inf")
+        else:
+            self.proxima_verificacao = self._proxima(0)
+
+    def _proxima(self, nos_expandidos: int) -> int:
+        """Próxima verificação; cai exatamente no limite de nós, se houver."""
+        proxima = nos_expandidos + self.intervalo
+        if self.limites is not None and self.limites.max_nos is not None:
+            proxima = min(proxima, max(self.limites.max_nos, nos_expandidos + 1))
+        return proxima
+
+    def verificar(
+        self,
+        nos_expandidos: int,
+        estados_guardados: int,
+        tamanho_fronteira: int,
+        profundidade: int,
+    ) -> Optional[str]:
+        """
+        Confere os limites; chamado quando nos_expandidos >= proxima_verificacao.
+
+        Args:
+            nos_expandidos: Nós expandidos até agora
+            estados_guardados: Estados na tabela de visitados/pais
+            tamanho_fronteira: Nós na fronteira
+            profundidade: Profundidade (ou custo g) atual
+
+        Returns:
+            Motivo da parada, ou None se a busca deve continuar
+        """
+        self.proxima_verificacao = self._proxima(nos_expandidos)
+
+        if self.progresso is not None:
+            if self.progresso(nos_expandidos, tamanho_fronteira, profundidade) is False:
+                return PARADA_CANCELADA
+
+        limites = self.limites
+        if limites is None:
+            return None
+        if limites.token is not None and limites.token.cancelado:
+            return PARADA_CANCELADA
+        if limites.max_nos is not None and nos_expandidos >= limites.max_nos:
+            return PARADA_LIMITE_NOS
+        if limites.max_memoria is not None:
+            memoria = estimar_memoria(
+                estados_guardados,
+                tamanho_fronteira,
+                self.memoria_guardados() if self.memoria_guardados is not None else None,
+            )
+            if memoria >= limites.max_memoria:
+                return PARADA_LIMITE_MEMORIA
+        if self.prazo is not None and time.monotonic() >= self.prazo:
+            return PARADA_PRAZO
+        return None
+
+
+def estimar_memoria(
+    estados_guardados: int,
+    tamanho_fronteira: int,
+    bytes_guardados: Optional[int] = None,
+) -> int:
+    """
+    Estima a memória usada pela busca a partir do número de estados guardados.
+
+    Args:
+        estados_guardados: Estados na tabela de visitados/pais
+        tamanho_fronteira: Nós na fronteira
+        bytes_guardados: Bytes medidos da tabela de visitados/pais, quando ela
+            é compacta (substitui a estimativa por estado)
+
+    Returns:
+        Memória estimada em bytes
+    """
+    if bytes_guardados is None:
+        bytes_guardados = estados_guardados * BYTES_POR_ESTADO_GUARDADO
+    return bytes_guardados + tamanho_fronteira * BYTES_POR_NO_FRONTEIRA
@@ -0,0 +1,320 @@
+"""
+Resolução em lote de muitos tabuleiros em paralelo.
+
+Os tabuleiros são agrupados em blocos e distribuídos entre processos de um
+ProcessPoolExecutor. Cada processo prepara as tabelas do algoritmo uma única
+vez, ao iniciar. Os resultados voltam na ordem em que os blocos terminam,
+com o índice de cada tabuleiro na entrada para quem precisar reordenar.
+
+A entrada é consumida aos poucos: só um número limitado de blocos fica em
+andamento ao mesmo tempo, então a memória não cresce com o tamanho do lote.
+
+O tempo limite e o limite de nós de cada tabuleiro são verificados pela
+própria busca (veja limites.py), então funcionam em qualquer sistema.
+"""
+
+import os
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+from especificacao import EspecificacaoPuzzle, inferir_especificacao
+from busca_amplitude import ResultadoBusca
+from cache_solucoes import CacheSolucoes
+from limites import PARADA_LIMITE_NOS, PARADA_PRAZO, LimitesBusca
+from solucionador import ALGORITMOS, preparar_tabelas, resolver
+
+# Tabuleiros por bloco enviado a um processo
+TAMANHO_BLOCO_PADRAO = 64
+
+# Configuração do processo trabalhador (definida por _inicializar_trabalhador)
+_configuracao: dict = {}
+
+
+class ResultadoLote:
+    """Resultado de um tabuleiro resolvido em lote."""
+
+    def __init__(self, indice: int, estado_inicial: List[int]):
+        self.indice = indice
+        self.estado_inicial = estado_inicial
+        self.resultado: Optional[ResultadoBusca] = None
+        self.erro: Optional[str] = None
+        self.tempo_esgotado = False
+
+
+def _inicializar_trabalhador(
+    algoritmo: str,
+    metodo_heuristica: str,
+    especificacao: Optional[EspecificacaoPuzzle],
+    tempo_limite: Optional[float],
+    especificacao_tabelas: Optional[EspecificacaoPuzzle],
+    limite_cache: Optional[int],
+    max_nos: Optional[int] = None,
+):
+    """
+    Prepara um processo trabalhador antes do primeiro bloco.
+
+    Se as tabelas não podem ser abertas ou geradas (arquivo ausente ou
+    corrompido, tamanho sem bancos de padrões), o erro é guardado e volta no
+    resultado de cada tabuleiro desse tamanho; outros erros encerram o
+    processo, como qualquer falha inesperada.
+
+    Args:
+        algoritmo: Nome do algoritmo
+        metodo_heuristica: Método de heurística
+        especificacao: Especificação comum aos tabuleiros (None para deduzir)
+        tempo_limite: Tempo máximo por tabuleiro, em segundos
+        especificacao_tabelas: Especificação cujas tabelas são preparadas
+        limite_cache: Orçamento em bytes do cache de soluções do processo
+            (None desativa o cache)
+        max_nos: Máximo de nós expandidos por tabuleiro
+    """
+    _configuracao.update(
+        algoritmo=algoritmo,
+        metodo_heuristica=metodo_heuristica,
+        especificacao=especificacao,
+        tempo_limite=tempo_limite,
+        max_nos=max_nos,
+        cache=CacheSolucoes(limite_cache) if limite_cache else None,
+        especificacao_tabelas=especificacao_tabelas,
+        erro_tabelas=None,
+    )
+    if especificacao_tabelas is not None:
+        try:
+            preparar_tabelas(algoritmo, metodo_heuristica, especificacao_tabelas)
+        except (OSError, ValueError) as erro:
+            _configuracao["erro_tabelas"] = f"Falha ao preparar as tabelas: {erro}"
+
+
+def _erro_tabelas(estado_inicial: List[int]) -> Optional[str]:
+    """Erro da preparação das tabelas, se ele afeta o tabuleiro."""
+    erro = _configuracao["erro_tabelas"]
+    if erro is None or _configuracao["especificacao"] is not None:
+        return erro
+    try:
+        especificacao = inferir_especificacao(estado_inicial)
+    except ValueError:
+        return None  # O tabuleiro falha por conta própria
+    return erro if especificacao == _configuracao["especificacao_tabelas"] else None
+
+
+def _resolver_bloco(bloco: List[Tuple[int, List[int]]]) -> List[ResultadoLote]:
+    """
+    Resolve um bloco de tabuleiros no processo trabalhador.
+
+    Um erro ou limite atingido em um tabuleiro fica registrado no resultado
+    dele e não afeta os demais. Quando um limite é atingido, o resultado
+    parcial da busca também é devolvido.
+
+    Args:
+        bloco: Pares (índice na entrada, tabuleiro)
+
+    Returns:
+        Um ResultadoLote por tabuleiro do bloco
+    """
+    algoritmo = _configuracao["algoritmo"]
+    metodo_heuristica = _configuracao["metodo_heuristica"]
+    especificacao = _configuracao["especificacao"]
+    tempo_limite = _configuracao["tempo_limite"]
+    max_nos = _configuracao["max_nos"]
+    cache = _configuracao["cache"]
+
+    resultados = []
+    for indice, estado_inicial in bloco:
+        item = ResultadoLote(indice, estado_inicial)
+        item.erro = _erro_tabelas(estado_inicial)
+        if item.erro is not None:
+            resultados.append(item)
+            continue
+        limites = None
+        if tempo_limite is not None or max_nos is not None:
+            # Criados por tabuleiro: o prazo conta a partir do início da busca
+            limites = LimitesBusca(max_nos=max_nos, tempo_limite=tempo_limite)
+        try:
+            item.resultado = resolver(
+                estado_inicial,
+                algoritmo,
+                metodo_heuristica,
+                especificacao,
+                cache,
+                limites=limites,
+            )
+        except Exception:
+            item.erro = traceback.format_exc(limit=3)
+        else:
+            motivo = item.resultado.motivo_parada
+            if motivo == PARADA_PRAZO:
+                item.tempo_esgotado = True
+                item.erro = f"Tempo limite de {tempo_limite}s esgotado"
+            elif motivo == PARADA_LIMITE_NOS:
+                item.erro = f"Limite de {max_nos} nós expandidos atingido"
+        resultados.append(item)
+    return resultados
+
+
+def _falha_no_bloco(
+    bloco: List[Tuple[int, List[int]]], mensagem: str
+) -> List[ResultadoLote]:
+    """Resultados de erro para todos os tabuleiros de um bloco perdido."""
+    resultados = []
+    for indice, estado_inicial in bloco:
+        item = ResultadoLote(indice, estado_inicial)
+        item.erro = mensagem
+        resultados.append(item)
+    return resultados
+
+
+def resolver_lote(
+    estados: Iterable[List[int]],
+    algoritmo: str = "a_estrela",
+    metodo_heuristica: str = "manhattan",
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+    processos: Optional[int] = None,
+    tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+    tempo_limite: Optional[float] = None,
+    blocos_pendentes: Optional[int] = None,
+    limite_cache: Optional[int] = None,
+    max_nos: Optional[int] = None,
+) -> Iterator[ResultadoLote]:
+    """
+    Resolve muitos tabuleiros em paralelo, devolvendo os resultados aos poucos.
+
+    Os resultados saem na ordem de conclusão dos blocos; use o atributo
+    indice para relacioná-los à entrada. Se um processo trabalhador morrer,
+    os tabuleiros dos blocos perdidos voltam com erro e o restante do lote
+    segue em um novo conjunto de processos.
+
+    Args:
+        estados: Tabuleiros a resolver (consumidos sob demanda)
+        algoritmo: Nome do algoritmo (uma das chaves de solucionador.ALGORITMOS)
+        metodo_heuristica: Método de heurística, usado por A* e IDA*
+        especificacao: Especificação comum aos tabuleiros (deduzida de cada
+            tabuleiro se omitida)
+        processos: Número de processos (padrão: número de CPUs)
+        tamanho_bloco: Tabuleiros enviados de uma vez a cada processo
+        tempo_limite: Tempo máximo por tabuleiro, em segundos
+        blocos_pendentes: Máximo de blocos em andamento (padrão: 2 por processo)
+        limite_cache: Orçamento em bytes do cache de soluções de cada processo
+            (veja cache_solucoes.py; None desativa o cache)
+        max_nos: Máximo de nós expandidos por tabuleiro
+
+    Yields:
+        ResultadoLote de cada tabuleiro
+
+    Raises:
+        ValueError: Se o algoritmo não existe
+    """
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo}")
+
+    if processos is None:
+        processos = os.cpu_count() or 1
+    if blocos_pendentes is None:
+        blocos_pendentes = 2 * processos
+
+    entrada = enumerate(estados)
+    primeiro = next(entrada, None)
+    if primeiro is None:
+        return
+    entrada = chain([primeiro], entrada)
+
+    # As tabelas são preparadas para o tamanho do primeiro tabuleiro
+    especificacao_tabelas = especificacao
+    if especificacao_tabelas is None:
+        try:
+            especificacao_tabelas = inferir_especificacao(primeiro[1])
+        except ValueError:
+            pass  # O erro aparece no resultado do próprio tabuleiro
+    argumentos = (
+        algoritmo,
+        metodo_heuristica,
+        especificacao,
+        tempo_limite,
+        especificacao_tabelas,
+        limite_cache,
+        max_nos,
+    )
+
+    def novo_executor() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            processos, initializer=_inicializar_trabalhador, initargs=argumentos
+        )
+
+    executor = novo_executor()
+    pendentes = {}
+    try:
+        entrada_esgotada = False
+        while True:
+            # Mantém a janela de blocos em andamento cheia
+            while not entrada_esgotada and len(pendentes) < blocos_pendentes:
+                bloco = [
+                    (indice, list(estado))
+                    for indice, estado in islice(entrada, tamanho_bloco)
+                ]
+                if not bloco:
+                    entrada_esgotada = True
+                    break
+                pendentes[executor.submit(_resolver_bloco, bloco)] = bloco
+
+            if not pendentes:
+                break
+
+            concluidos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            processos_perdidos = False
+            for futuro in concluidos:
+                resultados, perdido = _coletar_bloco(futuro, pendentes.pop(futuro))
+                processos_perdidos = processos_perdidos or perdido
+                yield from resultados
+
+            if processos_perdidos:
+                # Os blocos restantes do conjunto quebrado terminam logo, com ou
+                # sem resultado; o restante do lote segue em novos processos
+                wait(pendentes)
+                for futuro, bloco in pendentes.items():
+                    yield from _coletar_bloco(futuro, bloco)[0]
+                pendentes.clear()
+                executor.shutdown(wait=False)
+                executor = novo_executor()
+    finally:
+        for futuro in pendentes:
+            futuro.cancel()
+        executor.shutdown(wait=True)
+
+
+def _coletar_bloco(
+    futuro: Future, bloco: List[Tuple[int, List[int]]]
+) -> Tuple[List[ResultadoLote], bool]:
+    """
+    Obtém os resultados de um bloco concluído.
+
+    Returns:
+        Resultados do bloco e se o conjunto de processos foi perdido
+    """
+    try:
+        return futuro.result(), False
+    except BrokenProcessPool:
+        return _falha_no_bloco(bloco, "Processo trabalhador encerrado"), True
+    except Exception as erro:
+        return _falha_no_bloco(bloco, repr(erro)), False
+
+
+def resolver_lote_ordenado(
+    estados: Iterable[List[int]], **opcoes
+) -> List[ResultadoLote]:
+    """
+    Resolve um lote e devolve os resultados na ordem da entrada.
+
+    Mantém todos os resultados em memória; para lotes muito grandes prefira
+    consumir resolver_lote diretamente.
+
+    Args:
+        estados: Tabuleiros a resolver
+        **opcoes: Mesmos parâmetros de resolver_lote
+
+    Returns:
+        Lista de ResultadoLote indexada como a entrada
+    """
+    resultados = list(resolver_lote(estados, **opcoes))
+    resultados.sort(key=lambda item: item.indice)
+    return resultados
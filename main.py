@@ -1,6 +1,9 @@
 """
 Arquivo principal do Jogo dos Oito.
 Menu principal com opções de execução.
+
+Para resolver tabuleiros sem o menu (JSON lines, veja fluxo.py):
+    python main.py resolver --algoritmo a_estrela < tabuleiros.jsonl
 """
 import sys
 import os
@@ -70,5 +73,8 @@ def main():
             print("\n❌ Opção inválida! Tente novamente.")
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "resolver":
+        from fluxo import main as resolver_fluxo
+        sys.exit(resolver_fluxo(sys.argv[2:]))
     main()
 
@@ -0,0 +1,405 @@
+"""
+Ranqueamento de permutações para indexar tabelas densas.
+
+Cada tabuleiro (uma permutação de 0..n-1) recebe um inteiro único entre 0 e
+n! - 1, e de volta. Há duas ordens:
+
+- Lexicográfica (código de Lehmer): usada pelas tabelas gravadas em disco e
+  pelos vetores indexados por posição, porque a ordem é estável e fácil de
+  enumerar. Também existe para permutações parciais (arranjos), que indexam
+  os bancos de padrões.
+- Myrvold-Ruskey: outra bijeção, em tempo linear sem tabelas auxiliares,
+  para quando a ordem dos índices não importa.
+
+As versões em lote operam sobre matrizes NumPy, com uma permutação por linha;
+NumPy é opcional e só é exigido por elas.
+"""
+
+import math
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+# Fatoriais pré-calculados até 25! (tabuleiro 5x5)
+FATORIAIS = [1]
+for _n in range(1, 26):
+    FATORIAIS.append(FATORIAIS[-1] * _n)
+
+# Quantidade de bits ligados de cada máscara de 16 bits: conta em O(1) quantos
+# valores menores já foram usados (até o 4x4 basta uma consulta)
+BITS_POR_CONSULTA = 16
+BITS_LIGADOS = bytes(bin(mascara).count("1") for mascara in range(1 << BITS_POR_CONSULTA))
+_MASCARA_CONSULTA = (1 << BITS_POR_CONSULTA) - 1
+
+
+def _contar_bits(mascara: int) -> int:
+    """Número de bits ligados na máscara, consultando BITS_LIGADOS."""
+    total = 0
+    while mascara:
+        total += BITS_LIGADOS[mascara & _MASCARA_CONSULTA]
+        mascara >>= BITS_POR_CONSULTA
+    return total
+
+
+def ranquear_permutacao(permutacao: Sequence[int]) -> int:
+    """
+    Calcula a posição da permutação na ordem lexicográfica (código de Lehmer).
+
+    Os valores já vistos ficam numa máscara de bits, então o número de valores
+    menores ainda livres sai de uma consulta a BITS_LIGADOS, sem percorrer o
+    resto da permutação.
+
+    Args:
+        permutacao: Lista com os valores 0..n-1, cada um uma única vez
+
+    Returns:
+        Inteiro entre 0 e n! - 1
+    """
+    n = len(permutacao)
+    posicao = 0
+    usados = 0
+    for i in range(n - 1):
+        valor = permutacao[i]
+        menores_usados = usados & ((1 << valor) - 1)
+        menores_livres = valor - (
+            BITS_LIGADOS[menores_usados]
+            if menores_usados <= _MASCARA_CONSULTA
+            else _contar_bits(menores_usados)
+        )
+        posicao += menores_livres * FATORIAIS[n - 1 - i]
+        usados |= 1 << valor
+    return posicao
+
+
+def ranquear_codigo(codigo: int, tamanho: int, bits_por_peca: int = 4) -> int:
+    """
+    Posição lexicográfica de um tabuleiro compactado, sem descompactá-lo.
+
+    Args:
+        codigo: Tabuleiro compactado (veja estado_puzzle.compactar_tabuleiro)
+        tamanho: Número de posições do tabuleiro
+        bits_por_peca: Largura de cada campo usada na compactação
+
+    Returns:
+        O mesmo valor de ranquear_permutacao(descompactar_tabuleiro(codigo))
+    """
+    mascara_peca = (1 << bits_por_peca) - 1
+    posicao = 0
+    usados = 0
+    for i in range(tamanho - 1):
+        valor = codigo & mascara_peca
+        codigo >>= bits_por_peca
+        menores_usados = usados & ((1 << valor) - 1)
+        menores_livres = valor - (
+            BITS_LIGADOS[menores_usados]
+            if menores_usados <= _MASCARA_CONSULTA
+            else _contar_bits(menores_usados)
+        )
+        posicao += menores_livres * FATORIAIS[tamanho - 1 - i]
+        usados |= 1 << valor
+    return posicao
+
+
+def desranquear_permutacao(posicao: int, n: int) -> List[int]:
+    """
+    Reconstrói a permutação a partir da sua posição lexicográfica.
+
+    Args:
+        posicao: Inteiro entre 0 e n! - 1
+        n: Número de elementos da permutação
+
+    Returns:
+        Lista com os valores 0..n-1 na ordem correspondente
+    """
+    disponiveis = list(range(n))
+    permutacao = []
+    for i in range(n - 1, -1, -1):
+        indice, posicao = divmod(posicao, FATORIAIS[i])
+        permutacao.append(disponiveis.pop(indice))
+    return permutacao
+
+
+def contar_arranjos(n: int, k: int) -> int:
+    """Número de sequências de k valores distintos escolhidos entre n: n!/(n-k)!."""
+    return FATORIAIS[n] // FATORIAIS[n - k]
+
+
+def ranquear_arranjo(arranjo: Sequence[int], n: int) -> int:
+    """
+    Calcula a posição lexicográfica de uma permutação parcial.
+
+    Usado para indexar padrões: a sequência das posições de k peças
+    escolhidas em um tabuleiro de n posições.
+
+    Args:
+        arranjo: Lista de k valores distintos entre 0 e n-1
+        n: Número de valores possíveis
+
+    Returns:
+        Inteiro entre 0 e n!/(n-k)! - 1
+    """
+    k = len(arranjo)
+    fatorial_resto = FATORIAIS[n - k]
+    posicao = 0
+    usados = 0
+    for i in range(k):
+        valor = arranjo[i]
+        # Valores menores ainda não usados pelos elementos anteriores
+        menores_usados = usados & ((1 << valor) - 1)
+        menores_livres = valor - (
+            BITS_LIGADOS[menores_usados]
+            if menores_usados <= _MASCARA_CONSULTA
+            else _contar_bits(menores_usados)
+        )
+        posicao += menores_livres * (FATORIAIS[n - 1 - i] // fatorial_resto)
+        usados |= 1 << valor
+    return posicao
+
+
+def desranquear_arranjo(posicao: int, n: int, k: int) -> List[int]:
+    """
+    Reconstrói a permutação parcial a partir da sua posição lexicográfica.
+
+    Args:
+        posicao: Inteiro entre 0 e n!/(n-k)! - 1
+        n: Número de valores possíveis
+        k: Número de elementos da permutação parcial
+
+    Returns:
+        Lista de k valores distintos entre 0 e n-1
+    """
+    disponiveis = list(range(n))
+    arranjo = []
+    for i in range(k):
+        indice, posicao = divmod(posicao, contar_arranjos(n - 1 - i, k - 1 - i))
+        arranjo.append(disponiveis.pop(indice))
+    return arranjo
+
+
+def ranquear_myrvold_ruskey(permutacao: Sequence[int], k: Optional[int] = None) -> int:
+    """
+    Calcula o índice de Myrvold-Ruskey da permutação, em tempo linear.
+
+    Com k, ranqueia só as k últimas posições: o índice fica entre 0 e
+    n!/(n-k)! - 1 e não depende da ordem dos demais valores, o que serve para
+    indexar um padrão de k peças (veja ranquear_arranjo_myrvold_ruskey).
+
+    Args:
+        permutacao: Lista com os valores 0..n-1, cada um uma única vez
+        k: Número de posições ranqueadas, a partir do fim (padrão: todas)
+
+    Returns:
+        Inteiro entre 0 e n!/(n-k)! - 1
+    """
+    n = len(permutacao)
+    if k is None:
+        k = n
+    permutacao = list(permutacao)
+    inversa = [0] * n
+    for indice, valor in enumerate(permutacao):
+        inversa[valor] = indice
+
+    posicao = 0
+    multiplicador = 1
+    for tamanho in range(n, n - k, -1):
+        ultimo = tamanho - 1
+        valor = permutacao[ultimo]
+        # Leva o valor `ultimo` para a última posição ainda não ranqueada
+        indice = inversa[ultimo]
+        permutacao[indice] = valor
+        inversa[valor] = indice
+        posicao += valor * multiplicador
+        multiplicador *= tamanho
+    return posicao
+
+
+def desranquear_myrvold_ruskey(posicao: int, n: int, k: Optional[int] = None) -> List[int]:
+    """
+    Reconstrói a permutação a partir do seu índice de Myrvold-Ruskey.
+
+    Args:
+        posicao: Inteiro entre 0 e n!/(n-k)! - 1
+        n: Número de elementos da permutação
+        k: Número de posições ranqueadas (padrão: todas); as demais posições
+            recebem os valores restantes numa ordem qualquer
+
+    Returns:
+        Lista com os valores 0..n-1
+    """
+    if k is None:
+        k = n
+    permutacao = list(range(n))
+    for tamanho in range(n, n - k, -1):
+        posicao, indice = divmod(posicao, tamanho)
+        permutacao[tamanho - 1], permutacao[indice] = (
+            permutacao[indice],
+            permutacao[tamanho - 1],
+        )
+    return permutacao
+
+
+def ranquear_arranjo_myrvold_ruskey(arranjo: Sequence[int], n: int) -> int:
+    """
+    Índice de Myrvold-Ruskey de uma permutação parcial.
+
+    O arranjo ocupa as últimas posições, de trás para frente (arranjo[0] na
+    posição n-1), e o resto recebe os valores não usados.
+
+    Args:
+        arranjo: Lista de k valores distintos entre 0 e n-1
+        n: Número de valores possíveis
+
+    Returns:
+        Inteiro entre 0 e n!/(n-k)! - 1
+    """
+    k = len(arranjo)
+    usados = set(arranjo)
+    permutacao = [valor for valor in range(n) if valor not in usados]
+    permutacao.extend(reversed(arranjo))
+    return ranquear_myrvold_ruskey(permutacao, k)
+
+
+def desranquear_arranjo_myrvold_ruskey(posicao: int, n: int, k: int) -> List[int]:
+    """
+    Reconstrói a permutação parcial a partir do seu índice de Myrvold-Ruskey.
+
+    Args:
+        posicao: Inteiro entre 0 e n!/(n-k)! - 1
+        n: Número de valores possíveis
+        k: Número de elementos da permutação parcial
+
+    Returns:
+        Lista de k valores distintos entre 0 e n-1
+    """
+    permutacao = desranquear_myrvold_ruskey(posicao, n, k)
+    return permutacao[n - 1 : n - 1 - k : -1] if k < n else permutacao[::-1]
+
+
+def _exigir_numpy():
+    """Falha com uma mensagem clara quando NumPy não está instalado."""
+    if np is None:
+        raise ImportError("As funções em lote de permutacao.py exigem NumPy")
+
+
+def _exigir_int64(n: int, k: int):
+    """Falha se as posições de k valores entre n não cabem em int64 (n! até 20!)."""
+    if math.perm(n, k) - 1 > np.iinfo(np.int64).max:
+        raise ValueError(
+            f"As posições de {k} valores entre {n} não cabem em int64; "
+            "use as funções de um tabuleiro por vez"
+        )
+
+
+def ranquear_lote(permutacoes: "np.ndarray") -> "np.ndarray":
+    """
+    Calcula a posição lexicográfica de várias permutações de uma vez.
+
+    Args:
+        permutacoes: Matriz com uma permutação de 0..n-1 por linha
+
+    Returns:
+        Vetor int64 com a posição de cada linha
+
+    Raises:
+        ImportError: Se NumPy não está instalado
+        ValueError: Se n passa de 20, quando as posições não cabem em int64
+    """
+    _exigir_numpy()
+    permutacoes = np.asarray(permutacoes)
+    quantidade, n = permutacoes.shape
+    _exigir_int64(n, n)
+    posicoes = np.zeros(quantidade, dtype=np.int64)
+    for i in range(n - 1):
+        menores_a_direita = np.count_nonzero(
+            permutacoes[:, i + 1 :] < permutacoes[:, i : i + 1], axis=1
+        )
+        posicoes += menores_a_direita * FATORIAIS[n - 1 - i]
+    return posicoes
+
+
+def _escolher_livres(
+    usados: "np.ndarray", indices: "np.ndarray"
+) -> "np.ndarray":
+    """Em cada linha, o valor livre de ordem `indice` (contando a partir de 0)."""
+    livres = ~usados
+    contagem = np.cumsum(livres, axis=1)
+    escolhidos = np.argmax(livres & (contagem == (indices + 1)[:, None]), axis=1)
+    usados[np.arange(len(escolhidos)), escolhidos] = True
+    return escolhidos
+
+
+def desranquear_lote(posicoes: "np.ndarray", n: int) -> "np.ndarray":
+    """
+    Reconstrói várias permutações a partir das suas posições lexicográficas.
+
+    Args:
+        posicoes: Vetor de inteiros entre 0 e n! - 1
+        n: Número de elementos das permutações (até 20)
+
+    Returns:
+        Matriz int8 com uma permutação por linha
+
+    Raises:
+        ImportError: Se NumPy não está instalado
+        ValueError: Se n passa de 20, quando as posições não cabem em int64
+    """
+    return desranquear_arranjos_lote(posicoes, n, n)
+
+
+def ranquear_arranjos_lote(arranjos: "np.ndarray", n: int) -> "np.ndarray":
+    """
+    Calcula a posição lexicográfica de várias permutações parciais de uma vez.
+
+    Args:
+        arranjos: Matriz com k valores distintos entre 0 e n-1 por linha
+        n: Número de valores possíveis
+
+    Returns:
+        Vetor int64 com o mesmo valor de ranquear_arranjo para cada linha
+
+    Raises:
+        ImportError: Se NumPy não está instalado
+        ValueError: Se n!/(n-k)! não cabe em int64
+    """
+    _exigir_numpy()
+    arranjos = np.asarray(arranjos)
+    quantidade, k = arranjos.shape
+    _exigir_int64(n, k)
+    posicoes = np.zeros(quantidade, dtype=np.int64)
+    for i in range(k):
+        menores_usados = np.count_nonzero(
+            arranjos[:, :i] < arranjos[:, i : i + 1], axis=1
+        )
+        menores_livres = arranjos[:, i].astype(np.int64) - menores_usados
+        posicoes += menores_livres * contar_arranjos(n - 1 - i, k - 1 - i)
+    return posicoes
+
+
+def desranquear_arranjos_lote(posicoes: "np.ndarray", n: int, k: int) -> "np.ndarray":
+    """
+    Reconstrói várias permutações parciais a partir das suas posições.
+
+    Args:
+        posicoes: Vetor de inteiros entre 0 e n!/(n-k)! - 1
+        n: Número de valores possíveis
+        k: Número de elementos de cada permutação parcial
+
+    Returns:
+        Matriz int8 com um arranjo por linha
+
+    Raises:
+        ImportError: Se NumPy não está instalado
+        ValueError: Se n!/(n-k)! não cabe em int64
+    """
+    _exigir_numpy()
+    _exigir_int64(n, k)
+    restos = np.array(posicoes, dtype=np.int64)
+    usados = np.zeros((len(restos), n), dtype=bool)
+    arranjos = np.empty((len(restos), k), dtype=np.int8)
+    for i in range(k):
+        indices, restos = np.divmod(restos, contar_arranjos(n - 1 - i, k - 1 - i))
+        arranjos[:, i] = _escolher_livres(usados, indices)
+    return arranjos
@@ -0,0 +1,383 @@
+"""
+Benchmark reprodutível dos algoritmos de busca no tabuleiro 3x3.
+
+Os tabuleiros são sorteados com uma semente fixa entre todos os estados
+solúveis, agrupados pelo tamanho da solução ótima lido da tabela de
+distâncias (0 a 30 movimentos com o objetivo padrão, que tem o vazio no
+centro; 0 a 31 quando o vazio do objetivo fica num canto). Cada combinação
+de algoritmo e heurística resolve os tabuleiros de cada faixa várias vezes,
+medidas com perf_counter_ns; o pico de memória vem de uma execução separada
+sob tracemalloc, para não distorcer os tempos.
+
+O resultado é gravado em JSON e pode ser comparado com uma execução anterior:
+    python scripts/benchmark.py --saida atual.json
+    python scripts/benchmark.py --saida novo.json --comparar atual.json
+
+Com --comparar o código de saída é 1 se alguma mediana piorou além da
+tolerância (diferenças abaixo de --piso-ms são tratadas como ruído).
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+# Adiciona o diretório pai ao path para importar os módulos principais
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from especificacao import ESPECIFICACAO_PADRAO
+from heuristica import FUNCOES_HEURISTICA
+from limites import LimitesBusca
+from permutacao import desranquear_permutacao
+from solucionador import ALGORITMOS, ALGORITMOS_INFORMADOS, preparar_tabelas, resolver
+from tabela_distancias import (
+    DISTANCIA_DESCONHECIDA,
+    carregar_tabela_distancias,
+    gerar_tabela_distancias,
+)
+
+# Versão do formato do arquivo de resultados
+VERSAO_FORMATO = 1
+
+
+def gerar_tabuleiros_por_distancia(
+    por_faixa: int, semente: int, faixas: Optional[List[int]] = None
+) -> Dict[int, List[List[int]]]:
+    """
+    Sorteia tabuleiros solúveis do 3x3 agrupados pela distância ótima.
+
+    A mesma semente sempre devolve os mesmos tabuleiros. Faixas com menos
+    estados que o pedido (0 e 30, por exemplo) devolvem todos os que existem.
+
+    Args:
+        por_faixa: Tabuleiros por faixa
+        semente: Semente do gerador de números aleatórios
+        faixas: Distâncias desejadas (padrão: todas as que existem)
+
+    Returns:
+        Dicionário distância -> lista de tabuleiros
+    """
+    tabela = carregar_tabela_distancias()
+    if tabela is None:
+        tabela = gerar_tabela_distancias()
+
+    posicoes: Dict[int, List[int]] = {}
+    for posicao in range(len(tabela)):
+        distancia = tabela[posicao]
+        if distancia != DISTANCIA_DESCONHECIDA:
+            posicoes.setdefault(distancia, []).append(posicao)
+
+    if faixas is None:
+        faixas = sorted(posicoes)
+    for distancia in faixas:
+        posicoes.setdefault(distancia, [])
+
+    gerador = random.Random(semente)
+    tamanho = ESPECIFICACAO_PADRAO.tamanho
+    tabuleiros = {}
+    for distancia in faixas:
+        escolhidas = gerador.sample(
+            posicoes[distancia], min(por_faixa, len(posicoes[distancia]))
+        )
+        tabuleiros[distancia] = [
+            desranquear_permutacao(posicao, tamanho) for posicao in escolhidas
+        ]
+    return tabuleiros
+
+
+def percentil(valores: List[int], fracao: float) -> int:
+    """Percentil pelo posto mais próximo (valores já ordenados)."""
+    return valores[max(0, math.ceil(fracao * len(valores)) - 1)]
+
+
+def medir_faixa(
+    tabuleiros: List[List[int]],
+    distancia: int,
+    algoritmo: str,
+    metodo_heuristica: str,
+    repeticoes: int,
+    tempo_limite: Optional[float],
+) -> dict:
+    """
+    Mede um algoritmo em todos os tabuleiros de uma faixa.
+
+    Cada tabuleiro é resolvido uma vez sem medição (aquecimento), depois
+    `repeticoes` vezes com perf_counter_ns e uma última vez sob tracemalloc.
+
+    Args:
+        tabuleiros: Tabuleiros da faixa
+        distancia: Tamanho da solução ótima dos tabuleiros
+        algoritmo: Nome do algoritmo
+        metodo_heuristica: Método de heurística
+        repeticoes: Execuções medidas por tabuleiro
+        tempo_limite: Tempo máximo de cada execução, em segundos
+
+    Returns:
+        Registro da faixa para o arquivo de resultados
+    """
+    tempos_ns: List[int] = []
+    nos_expandidos: List[int] = []
+    picos_memoria: List[int] = []
+    interrompidos = 0
+    nao_otimos = 0
+
+    for tabuleiro in tabuleiros:
+        def executar():
+            limites = LimitesBusca(tempo_limite=tempo_limite) if tempo_limite else None
+            return resolver(tabuleiro, algoritmo, metodo_heuristica, limites=limites)
+
+        resultado = executar()
+        if not resultado.solucao_encontrada:
+            interrompidos += 1
+            continue
+        if len(resultado.caminho) != distancia:
+            nao_otimos += 1
+        nos_expandidos.append(resultado.nos_expandidos)
+
+        for _ in range(repeticoes):
+            inicio = time.perf_counter_ns()
+            executar()
+            tempos_ns.append(time.perf_counter_ns() - inicio)
+
+        tracemalloc.start()
+        try:
+            executar()
+            picos_memoria.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    registro = {
+        "algoritmo": algoritmo,
+        "heuristica": metodo_heuristica if algoritmo in ALGORITMOS_INFORMADOS else None,
+        "distancia": distancia,
+        "tabuleiros": len(tabuleiros),
+        "interrompidos": interrompidos,
+        "nao_otimos": nao_otimos,
+        "execucoes": len(tempos_ns),
+    }
+    if tempos_ns:
+        tempos_ns.sort()
+        # Cada tabuleiro contribui com `repeticoes` tempos e os mesmos nós
+        total_nos = sum(nos_expandidos) * repeticoes
+        registro.update(
+            mediana_ns=int(statistics.median(tempos_ns)),
+            p95_ns=percentil(tempos_ns, 0.95),
+            minimo_ns=tempos_ns[0],
+            nos_expandidos_medio=statistics.mean(nos_expandidos),
+            nos_por_segundo=total_nos / (sum(tempos_ns) / 1e9) if total_nos else None,
+            pico_memoria_bytes=max(picos_memoria),
+            pico_memoria_mediano_bytes=int(statistics.median(picos_memoria)),
+        )
+    return registro
+
+
+def descrever_ambiente() -> dict:
+    """Informações da máquina e do código para identificar a execução."""
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        revisao = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=raiz,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revisao = None
+    return {
+        "python": platform.python_version(),
+        "implementacao": platform.python_implementation(),
+        "sistema": platform.platform(),
+        "processador": platform.machine(),
+        "cpus": os.cpu_count(),
+        "revisao_git": revisao,
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def chave_registro(registro: dict) -> tuple:
+    """Identifica o mesmo ponto de medição em execuções diferentes."""
+    return registro["algoritmo"], registro["heuristica"], registro["distancia"]
+
+
+def comparar(anterior: dict, atual: dict, tolerancia: float, piso_ns: int = 0) -> int:
+    """
+    Compara as medianas de duas execuções e imprime as diferenças.
+
+    Args:
+        anterior: Conteúdo do arquivo de referência
+        atual: Conteúdo da execução atual
+        tolerancia: Piora relativa aceita (0.1 = 10%)
+        piso_ns: Diferença absoluta abaixo da qual a variação é ignorada
+
+    Returns:
+        Número de pontos em que a mediana piorou além da tolerância
+    """
+    referencias = {
+        chave_registro(registro): registro
+        for registro in anterior["resultados"]
+        if "mediana_ns" in registro
+    }
+    if anterior.get("semente") != atual.get("semente"):
+        print("⚠ As execuções usam sementes diferentes; os tabuleiros não são os mesmos.")
+
+    print(f"\n{'Algoritmo':<20} {'Heurística':<16} {'Dist':>4} {'Antes (ms)':>11} {'Agora (ms)':>11} {'Razão':>7}")
+    print("-" * 68)
+    pioras = 0
+    for registro in atual["resultados"]:
+        referencia = referencias.get(chave_registro(registro))
+        if referencia is None or "mediana_ns" not in registro:
+            continue
+        razao = registro["mediana_ns"] / referencia["mediana_ns"]
+        significativa = abs(registro["mediana_ns"] - referencia["mediana_ns"]) >= piso_ns
+        marca = ""
+        if significativa and razao > 1 + tolerancia:
+            pioras += 1
+            marca = "  ✗ piorou"
+        elif significativa and razao < 1 - tolerancia:
+            marca = "  ✓ melhorou"
+        print(
+            f"{registro['algoritmo']:<20} {registro['heuristica'] or '-':<16} "
+            f"{registro['distancia']:>4} {referencia['mediana_ns'] / 1e6:>11.3f} "
+            f"{registro['mediana_ns'] / 1e6:>11.3f} {razao:>7.2f}{marca}"
+        )
+    return pioras
+
+
+def ler_faixas(texto: str) -> List[int]:
+    """Converte "0-31" ou "10,20,25-28" na lista de distâncias."""
+    faixas = []
+    for parte in texto.split(","):
+        if "-" in parte:
+            inicio, fim = (int(valor) for valor in parte.split("-"))
+            faixas.extend(range(inicio, fim + 1))
+        else:
+            faixas.append(int(parte))
+    return faixas
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """
+    Executa o benchmark a partir dos argumentos da linha de comando.
+
+    Returns:
+        Código de saída: 1 se a comparação encontrou pioras, 0 caso contrário
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--algoritmos",
+        default="a_estrela,ida_estrela,bidirecional",
+        help=f"Lista separada por vírgulas entre: {', '.join(sorted(ALGORITMOS))}",
+    )
+    parser.add_argument(
+        "--heuristicas",
+        default="manhattan,conflito_linear",
+        help=f"Lista separada por vírgulas entre: {', '.join(sorted(FUNCOES_HEURISTICA))}",
+    )
+    parser.add_argument(
+        "--faixas", help='Distâncias, como "0-30" ou "20,25-28" (padrão: todas)'
+    )
+    parser.add_argument("--por-faixa", type=int, default=5, help="Tabuleiros por faixa")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Execuções medidas por tabuleiro")
+    parser.add_argument("--semente", type=int, default=2024)
+    parser.add_argument(
+        "--tempo-limite", type=float, help="Tempo máximo de cada execução, em segundos"
+    )
+    parser.add_argument("--saida", default="benchmark.json", help="Arquivo JSON de resultados")
+    parser.add_argument("--comparar", help="Arquivo JSON de uma execução anterior")
+    parser.add_argument(
+        "--tolerancia", type=float, default=0.1, help="Piora relativa aceita na comparação"
+    )
+    parser.add_argument(
+        "--piso-ms",
+        type=float,
+        default=0.05,
+        help="Diferença de mediana, em ms, abaixo da qual a comparação ignora a variação",
+    )
+    opcoes = parser.parse_args(argumentos)
+
+    algoritmos = opcoes.algoritmos.split(",")
+    heuristicas = opcoes.heuristicas.split(",")
+    for algoritmo in algoritmos:
+        if algoritmo not in ALGORITMOS:
+            parser.error(f"algoritmo desconhecido: {algoritmo}")
+    for metodo in heuristicas:
+        if metodo not in FUNCOES_HEURISTICA:
+            parser.error(f"heurística desconhecida: {metodo}")
+
+    faixas = ler_faixas(opcoes.faixas) if opcoes.faixas else None
+    tabuleiros = gerar_tabuleiros_por_distancia(opcoes.por_faixa, opcoes.semente, faixas)
+    for distancia, lista in tabuleiros.items():
+        if not lista:
+            print(f"⚠ Nenhum tabuleiro a distância {distancia} do objetivo")
+
+    combinacoes = []
+    for algoritmo in algoritmos:
+        if algoritmo in ALGORITMOS_INFORMADOS:
+            combinacoes.extend((algoritmo, metodo) for metodo in heuristicas)
+        else:
+            combinacoes.append((algoritmo, heuristicas[0]))
+
+    print(f"{'Algoritmo':<20} {'Heurística':<16} {'Dist':>4} {'Mediana (ms)':>13} {'p95 (ms)':>10} {'Nós/s':>10} {'Memória (KiB)':>14}")
+    print("-" * 88)
+    resultados = []
+    for algoritmo, metodo in combinacoes:
+        preparar_tabelas(algoritmo, metodo, ESPECIFICACAO_PADRAO)
+        for distancia in tabuleiros:
+            registro = medir_faixa(
+                tabuleiros[distancia],
+                distancia,
+                algoritmo,
+                metodo,
+                opcoes.repeticoes,
+                opcoes.tempo_limite,
+            )
+            resultados.append(registro)
+            if "mediana_ns" in registro:
+                nos_por_segundo = registro["nos_por_segundo"]
+                print(
+                    f"{algoritmo:<20} {registro['heuristica'] or '-':<16} {distancia:>4} "
+                    f"{registro['mediana_ns'] / 1e6:>13.3f} {registro['p95_ns'] / 1e6:>10.3f} "
+                    f"{nos_por_segundo or 0:>10.0f} "
+                    f"{registro['pico_memoria_bytes'] / 1024:>14.1f}"
+                )
+            if registro["interrompidos"] or registro["nao_otimos"]:
+                print(
+                    f"  ⚠ {registro['interrompidos']} sem solução no tempo limite, "
+                    f"{registro['nao_otimos']} com solução não ótima"
+                )
+
+    dados = {
+        "versao": VERSAO_FORMATO,
+        "semente": opcoes.semente,
+        "por_faixa": opcoes.por_faixa,
+        "repeticoes": opcoes.repeticoes,
+        "tempo_limite": opcoes.tempo_limite,
+        "ambiente": descrever_ambiente(),
+        "resultados": resultados,
+    }
+    with open(opcoes.saida, "w", encoding="utf-8") as arquivo:
+        json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+    print(f"\n✓ Resultados gravados em {opcoes.saida}")
+
+    if opcoes.comparar:
+        with open(opcoes.comparar, encoding="utf-8") as arquivo:
+            anterior = json.load(arquivo)
+        pioras = comparar(
+            anterior, dados, opcoes.tolerancia, int(opcoes.piso_ms * 1e6)
+        )
+        if pioras:
+            print(f"\n✗ {pioras} medições pioraram mais de {opcoes.tolerancia:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
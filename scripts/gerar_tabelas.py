@@ -0,0 +1,56 @@
+"""
+Script para gerar as tabelas pré-calculadas usadas pelas buscas.
+
+Sem argumentos gera as tabelas do 3x3. Tamanhos maiores podem ser pedidos
+na linha de comando, por exemplo:
+    python scripts/gerar_tabelas.py 4x4
+"""
+import sys
+import os
+import time
+
+# Adiciona o diretório pai ao path para importar os módulos principais
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from especificacao import EspecificacaoPuzzle, obter_especificacao
+from banco_padroes import (
+    PARTICOES_PADRAO,
+    caminho_banco_padroes,
+    gerar_banco_padroes,
+    salvar_banco_padroes,
+)
+from tabela_distancias import (
+    CAMINHO_TABELA_PADRAO,
+    gerar_tabela_distancias,
+    salvar_tabela_distancias,
+)
+
+
+def gerar_distancias_3x3():
+    """Gera e grava a tabela de distâncias exatas do tabuleiro 3x3."""
+    print("Gerando tabela de distâncias do 3x3...")
+    inicio = time.time()
+    tabela = gerar_tabela_distancias()
+    salvar_tabela_distancias(tabela)
+    print(f"✓ {CAMINHO_TABELA_PADRAO} ({len(tabela)} bytes, {time.time() - inicio:.1f}s)")
+
+
+def gerar_bancos_padroes(especificacao: EspecificacaoPuzzle):
+    """Gera e grava os bancos de padrões da partição padrão do tabuleiro."""
+    largura, altura = especificacao.largura, especificacao.altura
+    for padrao in PARTICOES_PADRAO[(largura, altura)]:
+        print(f"Gerando banco de padrões {largura}x{altura} para as peças {padrao}...")
+        inicio = time.time()
+        tabela = gerar_banco_padroes(padrao, especificacao)
+        salvar_banco_padroes(tabela, padrao, especificacao)
+        caminho = caminho_banco_padroes(padrao, especificacao)
+        print(f"✓ {caminho} ({len(tabela)} bytes, {time.time() - inicio:.1f}s)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 1:
+        gerar_distancias_3x3()
+        gerar_bancos_padroes(obter_especificacao(3, 3))
+    for argumento in sys.argv[1:]:
+        largura, altura = (int(valor) for valor in argumento.lower().split("x"))
+        gerar_bancos_padroes(obter_especificacao(largura, altura))
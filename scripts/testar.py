@@ -11,6 +11,8 @@ from estado_puzzle import EstadoPuzzle
 from jogo_oito import JogoOito
 from busca_amplitude import buscar_solucao_amplitude, imprimir_resultado
 from busca_a_estrela import buscar_solucao_a_estrela, imprimir_resultado_a_estrela
+from busca_bidirecional import buscar_solucao_bidirecional, imprimir_resultado_bidirecional
+from busca_ida_estrela import buscar_solucao_ida_estrela, imprimir_resultado_ida_estrela
 
 
 def formatar_tabuleiro(estado: list) -> str:
@@ -61,6 +63,30 @@ def testar_buscas():
         print(" → ".join(resultado_astar.caminho))
         print(f"\nTotal de movimentos: {len(resultado_astar.caminho)}")
     
+    print("\n" + "="*60)
+    print("TESTE 3: BUSCA EM AMPLITUDE BIDIRECIONAL")
+    print("="*60 + "\n")
+    
+    resultado_bidirecional = buscar_solucao_bidirecional(estado_inicial)
+    imprimir_resultado_bidirecional(resultado_bidirecional)
+    
+    if resultado_bidirecional.solucao_encontrada:
+        print("\n📊 Caminho da solução:")
+        print(" → ".join(resultado_bidirecional.caminho))
+        print(f"\nTotal de movimentos: {len(resultado_bidirecional.caminho)}")
+    
+    print("\n" + "="*60)
+    print("TESTE 4: BUSCA IDA* (A-ESTRELA COM APROFUNDAMENTO ITERATIVO)")
+    print("="*60 + "\n")
+    
+    resultado_ida = buscar_solucao_ida_estrela(estado_inicial, metodo_heuristica='manhattan')
+    imprimir_resultado_ida_estrela(resultado_ida, metodo_heuristica='manhattan')
+    
+    if resultado_ida.solucao_encontrada:
+        print("\n📊 Caminho da solução:")
+        print(" → ".join(resultado_ida.caminho))
+        print(f"\nTotal de movimentos: {len(resultado_ida.caminho)}")
+    
     print("\n" + "="*60)
     print("COMPARAÇÃO DOS MÉTODOS")
     print("="*60)
@@ -68,6 +94,8 @@ def testar_buscas():
     print("-"*70)
     print(f"{'Busca em Amplitude':<25} {resultado_bfs.nos_expandidos:<20} {resultado_bfs.tempo_execucao:<15.6f} {len(resultado_bfs.caminho) if resultado_bfs.solucao_encontrada else 'N/A':<10}")
     print(f"{'A* (Manhattan)':<25} {resultado_astar.nos_expandidos:<20} {resultado_astar.tempo_execucao:<15.6f} {len(resultado_astar.caminho) if resultado_astar.solucao_encontrada else 'N/A':<10}")
+    print(f"{'IDA* (Manhattan)':<25} {resultado_ida.nos_expandidos:<20} {resultado_ida.tempo_execucao:<15.6f} {len(resultado_ida.caminho) if resultado_ida.solucao_encontrada else 'N/A':<10}")
+    print(f"{'Amplitude Bidirecional':<25} {resultado_bidirecional.nos_expandidos:<20} {resultado_bidirecional.tempo_execucao:<15.6f} {len(resultado_bidirecional.caminho) if resultado_bidirecional.solucao_encontrada else 'N/A':<10}")
     
     print("\n" + "="*60)
     print("✅ TESTES CONCLUÍDOS!")
@@ -0,0 +1,104 @@
+"""
+Confere a otimalidade de um algoritmo contra a busca em amplitude.
+
+Sorteia tabuleiros solúveis do 3x3 (a mesma semente sempre gera os mesmos),
+resolve cada um com o algoritmo escolhido e com a referência e compara o
+número de movimentos. Termina com código 1 se alguma solução não for ótima.
+
+Uso:
+    python scripts/verificar_otimalidade.py --algoritmo a_estrela --heuristica manhattan
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import List, Optional
+
+# Adiciona o diretório pai ao path para importar os módulos principais
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from especificacao import ESPECIFICACAO_PADRAO
+from heuristica import FUNCOES_HEURISTICA
+from jogo_oito import JogoOito
+from solucionador import ALGORITMOS, SolucaoNaoOtima, verificar_otimalidade
+
+
+def sortear_tabuleiros(quantidade: int, semente: int) -> List[List[int]]:
+    """
+    Sorteia tabuleiros solúveis do 3x3.
+
+    Args:
+        quantidade: Número de tabuleiros
+        semente: Semente do gerador de números aleatórios
+
+    Returns:
+        Lista de tabuleiros
+    """
+    gerador = random.Random(semente)
+    jogo = JogoOito(ESPECIFICACAO_PADRAO.objetivo, ESPECIFICACAO_PADRAO)
+    tabuleiros = []
+    while len(tabuleiros) < quantidade:
+        tabuleiro = list(range(ESPECIFICACAO_PADRAO.tamanho))
+        gerador.shuffle(tabuleiro)
+        if jogo.eh_soluvel(tabuleiro):
+            tabuleiros.append(tabuleiro)
+    return tabuleiros
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """
+    Executa a verificação a partir dos argumentos da linha de comando.
+
+    Args:
+        argumentos: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída: 0 se todas as soluções são ótimas
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--algoritmo", choices=sorted(ALGORITMOS), default="a_estrela"
+    )
+    parser.add_argument(
+        "--heuristica",
+        choices=sorted(FUNCOES_HEURISTICA),
+        action="append",
+        help="Heurística verificada (pode repetir; padrão: todas)",
+    )
+    parser.add_argument(
+        "--referencia", choices=sorted(ALGORITMOS), default="amplitude"
+    )
+    parser.add_argument("--quantidade", type=int, default=50)
+    parser.add_argument("--semente", type=int, default=0)
+    opcoes = parser.parse_args(argumentos)
+
+    heuristicas = opcoes.heuristica or sorted(FUNCOES_HEURISTICA)
+    tabuleiros = sortear_tabuleiros(opcoes.quantidade, opcoes.semente)
+
+    falhas = 0
+    for heuristica in heuristicas:
+        falhas_heuristica = 0
+        for tabuleiro in tabuleiros:
+            try:
+                verificar_otimalidade(
+                    tabuleiro,
+                    opcoes.algoritmo,
+                    heuristica,
+                    ESPECIFICACAO_PADRAO,
+                    opcoes.referencia,
+                )
+            except SolucaoNaoOtima as erro:
+                print(f"FALHA: {erro}")
+                falhas_heuristica += 1
+        print(
+            f"{opcoes.algoritmo} ({heuristica}): "
+            f"{len(tabuleiros) - falhas_heuristica}/{len(tabuleiros)} ótimas"
+        )
+        falhas += falhas_heuristica
+
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
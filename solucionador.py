@@ -0,0 +1,328 @@
+"""
+Ponto de entrada único para resolver um tabuleiro com qualquer algoritmo.
+
+Os algoritmos ficam registrados em ALGORITMOS pelo nome, todos com a mesma
+assinatura, para que o processamento em lote e a linha de comando possam
+escolher o motor por uma string.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+from especificacao import EspecificacaoPuzzle, ESPECIFICACAO_PADRAO, inferir_especificacao
+from cache_solucoes import CacheSolucoes
+from jogo_oito import JogoOito
+from instrumentacao import ObservadorBusca
+from limites import PARADA_INSOLUVEL, PARADA_SOLUCAO, LimitesBusca
+from heuristica import obter_funcao_heuristica, obter_tabela_delta
+from busca_amplitude import ResultadoBusca, buscar_solucao_amplitude
+from busca_amplitude_vetorizada import (
+    NUMPY_DISPONIVEL,
+    LIMITE_POSICOES,
+    buscar_solucao_amplitude_vetorizada,
+    construir_tabela_transicoes,
+)
+from busca_a_estrela import buscar_solucao_a_estrela
+from busca_ara_estrela import ResultadoAnytime, buscar_solucao_ara_estrela
+from busca_bidirecional import buscar_solucao_bidirecional
+from busca_ida_estrela import buscar_solucao_ida_estrela
+from tabela_distancias import buscar_solucao_tabela, carregar_tabela_distancias
+
+
+def _resolver_amplitude(
+    estado_inicial: List[int],
+    metodo_heuristica: str,
+    especificacao: Optional[EspecificacaoPuzzle],
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+) -> ResultadoBusca:
+    """Busca em amplitude (ignora a heurística)."""
+    return buscar_solucao_amplitude(
+        estado_inicial, especificacao, limites=limites, observador=observador
+    )
+
+
+def _resolver_amplitude_vetorizada(
+    estado_inicial: List[int],
+    metodo_heuristica: str,
+    especificacao: Optional[EspecificacaoPuzzle],
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+) -> ResultadoBusca:
+    """Busca em amplitude vetorizada com NumPy (ignora a heurística)."""
+    return buscar_solucao_amplitude_vetorizada(
+        estado_inicial, especificacao, limites=limites, observador=observador
+    )
+
+
+# Peso da heurística no algoritmo "a_estrela_ponderado"
+PESO_PONDERADO_PADRAO = 2
+
+
+def _resolver_a_estrela_ponderado(
+    estado_inicial: List[int],
+    metodo_heuristica: str,
+    especificacao: Optional[EspecificacaoPuzzle],
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+) -> ResultadoBusca:
+    """A* ponderado: solução no máximo PESO_PONDERADO_PADRAO vezes a ótima."""
+    return buscar_solucao_a_estrela(
+        estado_inicial,
+        metodo_heuristica,
+        especificacao,
+        limites=limites,
+        observador=observador,
+        peso=PESO_PONDERADO_PADRAO,
+    )
+
+
+def _resolver_ara_estrela(
+    estado_inicial: List[int],
+    metodo_heuristica: str,
+    especificacao: Optional[EspecificacaoPuzzle],
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+) -> ResultadoBusca:
+    """ARA*: melhora a solução até provar que é ótima ou atingir um limite."""
+    return buscar_solucao_ara_estrela(
+        estado_inicial,
+        metodo_heuristica,
+        especificacao,
+        limites=limites,
+        observador=observador,
+    )
+
+
+def _resolver_bidirecional(
+    estado_inicial: List[int],
+    metodo_heuristica: str,
+    especificacao: Optional[EspecificacaoPuzzle],
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+) -> ResultadoBusca:
+    """Busca em amplitude bidirecional (ignora a heurística)."""
+    return buscar_solucao_bidirecional(
+        estado_inicial, especificacao, limites=limites, observador=observador
+    )
+
+
+def _resolver_tabela(
+    estado_inicial: List[int],
+    metodo_heuristica: str,
+    especificacao: Optional[EspecificacaoPuzzle],
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+) -> ResultadoBusca:
+    """Consulta a tabela de distâncias do 3x3 (A* nos demais casos)."""
+    return buscar_solucao_tabela(
+        estado_inicial,
+        limites=limites,
+        observador=observador,
+        metodo_heuristica=metodo_heuristica,
+        especificacao=especificacao,
+    )
+
+
+# Algoritmos disponíveis: nome -> função (estado, heurística, especificação),
+# que também aceita os limites e o observador da busca pelo nome
+ALGORITMOS: Dict[str, Callable[..., ResultadoBusca]] = {
+    "amplitude": _resolver_amplitude,
+    "amplitude_vetorizada": _resolver_amplitude_vetorizada,
+    "a_estrela": buscar_solucao_a_estrela,
+    "a_estrela_ponderado": _resolver_a_estrela_ponderado,
+    "ara_estrela": _resolver_ara_estrela,
+    "ida_estrela": buscar_solucao_ida_estrela,
+    "bidirecional": _resolver_bidirecional,
+    "tabela": _resolver_tabela,
+}
+
+
+# Algoritmos que usam a heurística
+ALGORITMOS_INFORMADOS = ("a_estrela", "a_estrela_ponderado", "ara_estrela", "ida_estrela")
+
+
+def _solucao_otima(algoritmo: str, resultado: ResultadoBusca) -> bool:
+    """Indica se a solução do resultado é comprovadamente a mais curta."""
+    if algoritmo == "a_estrela_ponderado":
+        return False
+    if isinstance(resultado, ResultadoAnytime):
+        return resultado.limite_subotimalidade <= 1
+    return True
+
+
+def resolver(
+    estado_inicial: List[int],
+    algoritmo: str = "a_estrela",
+    metodo_heuristica: str = "manhattan",
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+    cache: Optional[CacheSolucoes] = None,
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+) -> ResultadoBusca:
+    """
+    Resolve um tabuleiro com o algoritmo escolhido pelo nome.
+
+    Com um cache, tabuleiros que estão em algum caminho já resolvido são
+    respondidos sem busca (nos_expandidos fica 0), e cada solução nova é
+    guardada nele. O tabuleiro é validado antes da consulta, como nas
+    buscas: o código compacto de um tabuleiro inválido pode coincidir com o
+    de um tabuleiro guardado.
+
+    Args:
+        estado_inicial: Estado inicial do tabuleiro
+        algoritmo: Nome do algoritmo (uma das chaves de ALGORITMOS)
+        metodo_heuristica: Método de heurística, usado por A* e IDA*
+        especificacao: Dimensões e objetivo do tabuleiro (deduzida do
+            tamanho do tabuleiro se omitida)
+        cache: Cache de soluções consultado antes da busca (opcional)
+        limites: Limites de nós, memória e tempo da busca (veja limites.py)
+        observador: Recebe amostras periódicas da busca (veja instrumentacao.py)
+
+    Returns:
+        ResultadoBusca com informações da busca
+
+    Raises:
+        ValueError: Se o algoritmo não existe ou o tabuleiro é inválido
+    """
+    funcao = ALGORITMOS.get(algoritmo)
+    if funcao is None:
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo}")
+    if cache is None:
+        return funcao(
+            estado_inicial,
+            metodo_heuristica,
+            especificacao,
+            limites=limites,
+            observador=observador,
+        )
+
+    inicio_tempo = time.time()
+    especificacao_cache = especificacao or inferir_especificacao(estado_inicial)
+    jogo = JogoOito(estado_inicial, especificacao_cache)
+    jogo.exigir_estado_valido(estado_inicial)
+    caminho = None
+    # Tabuleiros insolúveis nunca estão no cache; a busca devolve o resultado
+    if jogo.eh_soluvel(estado_inicial):
+        caminho = cache.buscar(estado_inicial, especificacao_cache)
+    if caminho is not None:
+        resultado = ResultadoBusca()
+        resultado.solucao_encontrada = True
+        resultado.caminho = caminho
+        resultado.profundidade_solucao = len(caminho)
+        resultado.motivo_parada = PARADA_SOLUCAO
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
+
+    resultado = funcao(
+        estado_inicial,
+        metodo_heuristica,
+        especificacao,
+        limites=limites,
+        observador=observador,
+    )
+    # Soluções subótimas não entram no cache, que responde a todos os algoritmos
+    if resultado.solucao_encontrada and _solucao_otima(algoritmo, resultado):
+        cache.guardar(estado_inicial, resultado.caminho, especificacao_cache)
+    return resultado
+
+
+class SolucaoNaoOtima(Exception):
+    """Solução que não confere com a da busca de referência."""
+
+
+def verificar_otimalidade(
+    estado_inicial: List[int],
+    algoritmo: str = "a_estrela",
+    metodo_heuristica: str = "manhattan",
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+    referencia: str = "amplitude",
+    limites: Optional[LimitesBusca] = None,
+) -> ResultadoBusca:
+    """
+    Resolve o tabuleiro e confere a solução com uma busca de referência.
+
+    O caminho devolvido é aplicado movimento a movimento e precisa chegar ao
+    objetivo com o mesmo número de movimentos da referência (a busca em
+    amplitude, que é ótima por construção).
+
+    Args:
+        estado_inicial: Estado inicial do tabuleiro
+        algoritmo: Algoritmo verificado (uma das chaves de ALGORITMOS)
+        metodo_heuristica: Método de heurística, usado por A* e IDA*
+        especificacao: Dimensões e objetivo do tabuleiro
+        referencia: Algoritmo de referência, que deve ser ótimo
+        limites: Limites da busca verificada (a referência roda sem limites)
+
+    Returns:
+        ResultadoBusca do algoritmo verificado
+
+    Raises:
+        SolucaoNaoOtima: Se o caminho é inválido, não chega ao objetivo ou é
+            mais longo que o da referência, ou se só uma das buscas achou solução
+        ValueError: Se algum dos algoritmos não existe
+    """
+    resultado = resolver(
+        estado_inicial, algoritmo, metodo_heuristica, especificacao, limites=limites
+    )
+    if resultado.motivo_parada not in (PARADA_SOLUCAO, PARADA_INSOLUVEL):
+        # Busca interrompida: não há solução a verificar
+        return resultado
+
+    esperado = resolver(estado_inicial, referencia, metodo_heuristica, especificacao)
+    if resultado.solucao_encontrada != esperado.solucao_encontrada:
+        raise SolucaoNaoOtima(
+            f"{algoritmo} {'achou' if resultado.solucao_encontrada else 'não achou'} "
+            f"solução para {estado_inicial}, {referencia} "
+            f"{'achou' if esperado.solucao_encontrada else 'não achou'}"
+        )
+    if not resultado.solucao_encontrada:
+        return resultado
+
+    jogo = JogoOito(estado_inicial, especificacao)
+    estado = estado_inicial
+    for numero, movimento in enumerate(resultado.caminho, start=1):
+        estado = jogo.mover(estado, movimento)
+        if estado is None:
+            raise SolucaoNaoOtima(
+                f"{algoritmo}: movimento {numero} ({movimento}) inválido "
+                f"no caminho de {estado_inicial}"
+            )
+    if list(estado) != list(jogo.especificacao.objetivo):
+        raise SolucaoNaoOtima(
+            f"{algoritmo}: o caminho de {estado_inicial} termina em {estado}, "
+            "não no objetivo"
+        )
+    if len(resultado.caminho) != len(esperado.caminho):
+        raise SolucaoNaoOtima(
+            f"{algoritmo}: {len(resultado.caminho)} movimentos para "
+            f"{estado_inicial}, {referencia} encontrou {len(esperado.caminho)}"
+        )
+    return resultado
+
+
+def preparar_tabelas(
+    algoritmo: str = "a_estrela",
+    metodo_heuristica: str = "manhattan",
+    especificacao: EspecificacaoPuzzle = ESPECIFICACAO_PADRAO,
+):
+    """
+    Constrói ou abre as tabelas que o algoritmo vai consultar.
+
+    Chamar antes da primeira busca tira da medição o custo de montar as
+    tabelas de heurística, os bancos de padrões e a tabela de distâncias.
+
+    Args:
+        algoritmo: Nome do algoritmo (uma das chaves de ALGORITMOS)
+        metodo_heuristica: Método de heurística, usado por A* e IDA*
+        especificacao: Dimensões e objetivo do tabuleiro
+    """
+    if algoritmo == "tabela" and especificacao == ESPECIFICACAO_PADRAO:
+        carregar_tabela_distancias()
+    elif algoritmo == "amplitude_vetorizada":
+        if NUMPY_DISPONIVEL and especificacao.tamanho <= LIMITE_POSICOES:
+            construir_tabela_transicoes(especificacao.largura, especificacao.altura)
+    elif algoritmo in ALGORITMOS_INFORMADOS or algoritmo == "tabela":
+        obter_tabela_delta(metodo_heuristica, especificacao)
+        obter_funcao_heuristica(metodo_heuristica)(
+            especificacao.objetivo, especificacao
+        )
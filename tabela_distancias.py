@@ -0,0 +1,186 @@
+"""
+Tabela de distâncias exatas para todos os estados do tabuleiro 3x3.
+
+A tabela é gerada uma única vez por uma busca em amplitude reversa a partir
+do estado objetivo e guardada em disco como um vetor de bytes indexado pela
+posição (código de Lehmer) do tabuleiro. Com ela a solução ótima é obtida
+descendo as distâncias, sem nenhuma busca.
+
+O arquivo é aberto com mmap (veja armazenamento.py) na primeira consulta.
+Se ele não existir, a solução é calculada com A*. Para gerar o arquivo:
+    python scripts/gerar_tabelas.py
+"""
+
+import os
+import time
+from typing import List, Optional, Union
+from especificacao import ESPECIFICACAO_PADRAO, EspecificacaoPuzzle, inferir_especificacao
+from estado_puzzle import EstadoCompacto
+from jogo_oito import JogoOito
+from permutacao import FATORIAIS, ranquear_codigo, ranquear_permutacao
+from conjunto_visitados import ConjuntoBits
+from armazenamento import TabelaMapeada, abrir_tabela, escrever_tabela
+from instrumentacao import ObservadorBusca
+from limites import PARADA_INSOLUVEL, PARADA_SOLUCAO, LimitesBusca
+from busca_amplitude import ResultadoBusca
+from busca_a_estrela import buscar_solucao_a_estrela
+
+# Valor gravado para estados que não alcançam o objetivo
+DISTANCIA_DESCONHECIDA = 255
+
+# Arquivo padrão da tabela
+CAMINHO_TABELA_PADRAO = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "dados", "distancias_3x3.bin"
+)
+
+
+def gerar_tabela_distancias() -> bytearray:
+    """
+    Calcula a distância até o objetivo de cada um dos 9! tabuleiros.
+
+    Faz uma busca em amplitude a partir do objetivo padrão; como os movimentos
+    são reversíveis, a profundidade de cada estado é a sua distância exata
+    até o objetivo. Os estados insolúveis ficam com DISTANCIA_DESCONHECIDA.
+
+    Returns:
+        Vetor de 9! bytes indexado pela posição do tabuleiro
+    """
+    especificacao = ESPECIFICACAO_PADRAO
+    tabela = bytearray([DISTANCIA_DESCONHECIDA]) * FATORIAIS[especificacao.tamanho]
+
+    jogo = JogoOito(especificacao.objetivo, especificacao)
+    objetivo = EstadoCompacto.de_tabuleiro(especificacao.objetivo, especificacao)
+    # 1 bit por permutação (45 KB) em vez de um set com 181.440 códigos; cada
+    # filho é ranqueado uma vez, para o conjunto e para a tabela
+    visitados = ConjuntoBits(especificacao)
+    posicao = ranquear_codigo(objetivo.codigo, especificacao.tamanho)
+    visitados.adicionar_posicao(posicao)
+    tabela[posicao] = 0
+    nivel = [objetivo]
+    distancia = 1
+
+    while nivel:
+        proximo_nivel = []
+        for estado in nivel:
+            for _, filho in jogo.gerar_filhos_compactos(estado):
+                posicao = ranquear_codigo(filho.codigo, especificacao.tamanho)
+                if visitados.adicionar_posicao(posicao):
+                    tabela[posicao] = distancia
+                    proximo_nivel.append(filho)
+        nivel = proximo_nivel
+        distancia += 1
+
+    return tabela
+
+
+def salvar_tabela_distancias(
+    tabela: bytearray, caminho_arquivo: str = CAMINHO_TABELA_PADRAO
+):
+    """
+    Grava a tabela de distâncias em disco, com o cabeçalho versionado.
+
+    Args:
+        tabela: Tabela gerada por gerar_tabela_distancias
+        caminho_arquivo: Arquivo de destino
+    """
+    escrever_tabela(caminho_arquivo, tabela, 3, 3, ESPECIFICACAO_PADRAO.objetivo)
+
+
+def carregar_tabela_distancias(
+    caminho_arquivo: str = CAMINHO_TABELA_PADRAO,
+) -> Optional[TabelaMapeada]:
+    """
+    Abre a tabela de distâncias gravada em disco, mapeada em memória.
+
+    Args:
+        caminho_arquivo: Arquivo da tabela
+
+    Returns:
+        Tabela de distâncias, ou None se o arquivo não existe
+    """
+    return abrir_tabela(caminho_arquivo, 3, 3, ESPECIFICACAO_PADRAO.objetivo)
+
+
+def buscar_solucao_tabela(
+    estado_inicial: List[int],
+    tabela: Optional[Union[bytearray, TabelaMapeada]] = None,
+    limites: Optional[LimitesBusca] = None,
+    observador: Optional[ObservadorBusca] = None,
+    metodo_heuristica: str = "manhattan",
+    especificacao: Optional[EspecificacaoPuzzle] = None,
+) -> ResultadoBusca:
+    """
+    Encontra a solução ótima consultando a tabela de distâncias.
+
+    A partir do estado inicial, escolhe a cada passo o vizinho cuja
+    distância é uma unidade menor, até chegar ao objetivo. A tabela só cobre
+    o 3x3 com o objetivo padrão; para outros tabuleiros, ou se a tabela não
+    for informada e o arquivo padrão não existir, resolve com A* usando a
+    heurística informada.
+
+    Args:
+        estado_inicial: Estado inicial do tabuleiro
+        tabela: Tabela de distâncias (usa o arquivo padrão se omitida)
+        limites: Limites repassados ao A* quando ele é usado; a consulta à
+            tabela expande no máximo 31 nós e não é interrompida
+        observador: Observador repassado ao A* quando ele é usado
+        metodo_heuristica: Heurística do A* quando ele é usado
+        especificacao: Dimensões e objetivo do tabuleiro (deduzida do
+            tamanho do tabuleiro se omitida)
+
+    Returns:
+        ResultadoBusca com informações da busca
+
+    Raises:
+        ValueError: Se o tabuleiro não é uma permutação de 0..n-1
+    """
+    if especificacao is None:
+        especificacao = inferir_especificacao(estado_inicial)
+    if tabela is None and especificacao == ESPECIFICACAO_PADRAO:
+        tabela = carregar_tabela_distancias()
+    if tabela is None or especificacao != ESPECIFICACAO_PADRAO:
+        return buscar_solucao_a_estrela(
+            estado_inicial,
+            metodo_heuristica,
+            especificacao,
+            limites=limites,
+            observador=observador,
+        )
+
+    resultado = ResultadoBusca()
+    inicio_tempo = time.time()
+
+    jogo = JogoOito(estado_inicial, ESPECIFICACAO_PADRAO)
+    jogo.exigir_estado_valido(estado_inicial)
+    tabuleiro = estado_inicial[:]
+    distancia = tabela[ranquear_permutacao(tabuleiro)]
+
+    if distancia == DISTANCIA_DESCONHECIDA:
+        resultado.soluvel = False
+        resultado.motivo_parada = PARADA_INSOLUVEL
+        resultado.tempo_execucao = time.time() - inicio_tempo
+        return resultado
+
+    resultado.profundidade_maxima = distancia
+    resultado.tamanho_maximo_fronteira = 1
+    indice_vazio = tabuleiro.index(0)
+
+    while distancia > 0:
+        resultado.nos_expandidos += 1
+        for movimento, indice_troca in jogo.vizinhos[indice_vazio]:
+            tabuleiro[indice_vazio] = tabuleiro[indice_troca]
+            tabuleiro[indice_troca] = 0
+            if tabela[ranquear_permutacao(tabuleiro)] == distancia - 1:
+                resultado.caminho.append(movimento)
+                indice_vazio = indice_troca
+                distancia -= 1
+                break
+            # Desfaz a troca e tenta o próximo vizinho
+            tabuleiro[indice_troca] = tabuleiro[indice_vazio]
+            tabuleiro[indice_vazio] = 0
+
+    resultado.solucao_encontrada = True
+    resultado.profundidade_solucao = len(resultado.caminho)
+    resultado.motivo_parada = PARADA_SOLUCAO
+    resultado.tempo_execucao = time.time() - inicio_tempo
+    return resultado
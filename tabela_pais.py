@@ -0,0 +1,121 @@
+"""
+Tabela de pais compartilhada pelas buscas que guardam os estados visitados.
+
+Cada estado visitado é guardado pelo seu código compactado, apontando só para
+o código do movimento (um inteiro de 0 a 3) que o gerou. O pai não precisa
+ser guardado: ele é obtido desfazendo o movimento no próprio código. Como os
+inteiros pequenos são compartilhados pelo Python, cada entrada custa apenas a
+chave e o espaço no dicionário, sem uma tupla por estado.
+
+O dicionário pode ser trocado por uma das tabelas compactas de
+conjunto_visitados.py, que aceitam as mesmas operações.
+
+Buscas que também precisam do menor custo conhecido de cada estado (o A*)
+guardam (custo << BITS_MOVIMENTO) | código do movimento no mesmo dicionário.
+
+O caminho é reconstruído em tempo linear, do estado final até a raiz.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from especificacao import MOVIMENTOS, MOVIMENTOS_OPOSTOS, EspecificacaoPuzzle
+from conjunto_visitados import TabelaPais
+
+# Movimento de cada código (o código é a posição em MOVIMENTOS)
+MOVIMENTOS_POR_CODIGO: Tuple[str, ...] = tuple(MOVIMENTOS)
+
+# Código de cada movimento
+CODIGOS_MOVIMENTO: Dict[str, int] = {
+    movimento: codigo for codigo, movimento in enumerate(MOVIMENTOS_POR_CODIGO)
+}
+
+# Código gravado para a raiz da busca, que não tem pai
+SEM_MOVIMENTO = len(MOVIMENTOS_POR_CODIGO)
+
+# Bits baixos da entrada ocupados pelo código do movimento
+BITS_MOVIMENTO = 3
+MASCARA_MOVIMENTO = (1 << BITS_MOVIMENTO) - 1
+
+# Movimento de cada código, com None para a raiz: NOMES_MOVIMENTO[pais[codigo]]
+# é o movimento anterior que as buscas passam a gerar_filhos_compactos
+NOMES_MOVIMENTO: Tuple[Optional[str], ...] = MOVIMENTOS_POR_CODIGO + (None,)
+
+
+def reconstruir_caminho(
+    pais: TabelaPais,
+    codigo_final: int,
+    indice_vazio_final: int,
+    especificacao: EspecificacaoPuzzle,
+) -> List[str]:
+    """
+    Reconstrói o caminho da raiz da busca até um estado da tabela de pais.
+
+    A cada passo o movimento que gerou o estado é desfeito no código
+    compactado, trocando o espaço vazio de volta com a peça que ele deslocou.
+
+    Args:
+        pais: Tabela código do estado -> código do movimento que o gerou
+            (nos bits baixos, veja BITS_MOVIMENTO)
+        codigo_final: Código compactado do último estado do caminho
+        indice_vazio_final: Posição do espaço vazio nesse estado
+        especificacao: Dimensões do tabuleiro
+
+    Returns:
+        Lista de movimentos da raiz até o estado final
+    """
+    bits_por_peca = especificacao.bits_por_peca
+    mascara_peca = especificacao.mascara_peca
+    largura = especificacao.largura
+    deslocamentos_vazio = [
+        delta_linha * largura + delta_coluna
+        for delta_linha, delta_coluna in MOVIMENTOS.values()
+    ]
+
+    caminho = []
+    codigo = codigo_final
+    indice_vazio = indice_vazio_final
+    codigo_movimento = pais[codigo] & MASCARA_MOVIMENTO
+
+    while codigo_movimento != SEM_MOVIMENTO:
+        caminho.append(MOVIMENTOS_POR_CODIGO[codigo_movimento])
+
+        # No pai o vazio estava na posição de onde ele saiu com o movimento
+        indice_pai = indice_vazio - deslocamentos_vazio[codigo_movimento]
+        deslocamento_pai = indice_pai * bits_por_peca
+        peca = (codigo >> deslocamento_pai) & mascara_peca
+        codigo = (
+            codigo
+            - (peca << deslocamento_pai)
+            + (peca << (indice_vazio * bits_por_peca))
+        )
+        indice_vazio = indice_pai
+        codigo_movimento = pais[codigo] & MASCARA_MOVIMENTO
+
+    caminho.reverse()
+    return caminho
+
+
+def reconstruir_caminho_ate_raiz(
+    pais: TabelaPais,
+    codigo_inicial: int,
+    indice_vazio_inicial: int,
+    especificacao: EspecificacaoPuzzle,
+) -> List[str]:
+    """
+    Caminho de um estado até a raiz da busca, desfazendo cada movimento.
+
+    Usado no lado do objetivo da busca bidirecional, cuja raiz é o objetivo.
+
+    Args:
+        pais: Tabela código do estado -> código do movimento que o gerou
+        codigo_inicial: Código compactado do estado de partida
+        indice_vazio_inicial: Posição do espaço vazio nesse estado
+        especificacao: Dimensões do tabuleiro
+
+    Returns:
+        Lista de movimentos do estado de partida até a raiz
+    """
+    caminho = reconstruir_caminho(
+        pais, codigo_inicial, indice_vazio_inicial, especificacao
+    )
+    caminho.reverse()
+    return [MOVIMENTOS_OPOSTOS[movimento] for movimento in caminho]
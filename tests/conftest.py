@@ -0,0 +1,47 @@
+"""
+Configuração dos testes: os módulos do projeto ficam na raiz do repositório.
+
+As funções auxiliares daqui são importadas pelos testes (from conftest import ...).
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from especificacao import ESPECIFICACAO_PADRAO  # noqa: E402
+from jogo_oito import JogoOito  # noqa: E402
+
+
+def tabuleiros_soluveis(quantidade, semente, especificacao=ESPECIFICACAO_PADRAO):
+    """Tabuleiros solúveis sorteados com uma semente fixa."""
+    gerador = random.Random(semente)
+    jogo = JogoOito(especificacao.objetivo, especificacao)
+    tabuleiros = []
+    while len(tabuleiros) < quantidade:
+        tabuleiro = list(range(especificacao.tamanho))
+        gerador.shuffle(tabuleiro)
+        if jogo.eh_soluvel(tabuleiro):
+            tabuleiros.append(tabuleiro)
+    return tabuleiros
+
+
+def chega_ao_objetivo(tabuleiro, caminho, especificacao=ESPECIFICACAO_PADRAO):
+    """Se os movimentos do caminho são válidos e terminam no objetivo."""
+    jogo = JogoOito(tabuleiro, especificacao)
+    for movimento in caminho:
+        tabuleiro = jogo.mover(tabuleiro, movimento)
+        if tabuleiro is None:
+            return False
+    return tabuleiro == list(especificacao.objetivo)
+
+
+@pytest.fixture(scope="session")
+def distancias():
+    """Distância exata de cada tabuleiro 3x3 até o objetivo, pela posição."""
+    from tabela_distancias import gerar_tabela_distancias
+
+    return gerar_tabela_distancias()
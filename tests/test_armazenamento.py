@@ -0,0 +1,103 @@
+"""Testes do formato em disco das tabelas pré-calculadas."""
+
+import struct
+
+import pytest
+
+import armazenamento
+from armazenamento import (
+    _FORMATO_CABECALHO,
+    _TAMANHO_CABECALHO,
+    MAGICO,
+    TabelaMapeada,
+    abrir_tabela,
+    escrever_tabela,
+    fechar_tabelas,
+)
+
+OBJETIVO = [1, 2, 3, 8, 0, 4, 7, 6, 5]
+DADOS = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def arquivo(tmp_path):
+    caminho = tmp_path / "tabela.bin"
+    escrever_tabela(str(caminho), DADOS, 3, 3, OBJETIVO, b"meta")
+    yield caminho
+    fechar_tabelas()
+
+
+def _reescrever(caminho, deslocamento, conteudo):
+    dados = bytearray(caminho.read_bytes())
+    dados[deslocamento : deslocamento + len(conteudo)] = conteudo
+    caminho.write_bytes(bytes(dados))
+
+
+def test_ida_e_volta(arquivo):
+    tabela = TabelaMapeada(str(arquivo))
+    try:
+        assert (tabela.largura, tabela.altura) == (3, 3)
+        assert tabela.objetivo == OBJETIVO
+        assert bytes(tabela.metadados) == b"meta"
+        assert len(tabela) == len(DADOS)
+        assert [tabela[indice] for indice in range(len(DADOS))] == list(DADOS)
+    finally:
+        tabela.fechar()
+
+
+def test_abrir_tabela_reaproveita_o_mapeamento(arquivo):
+    primeira = abrir_tabela(str(arquivo), 3, 3, OBJETIVO)
+    assert abrir_tabela(str(arquivo), 3, 3, OBJETIVO) is primeira
+
+
+def test_arquivo_inexistente(tmp_path):
+    assert abrir_tabela(str(tmp_path / "nao_existe.bin"), 3, 3, OBJETIVO) is None
+
+
+def test_dados_corrompidos_sao_rejeitados(arquivo):
+    ultimo = arquivo.stat().st_size - 1
+    _reescrever(arquivo, ultimo, bytes([arquivo.read_bytes()[ultimo] ^ 1]))
+    with pytest.raises(ValueError, match="Checksum"):
+        TabelaMapeada(str(arquivo))
+    # Sem verificação o arquivo abre (o CRC custa uma leitura completa)
+    TabelaMapeada(str(arquivo), verificar=False).fechar()
+
+
+def test_versao_diferente_e_rejeitada(arquivo):
+    _reescrever(arquivo, len(MAGICO), struct.pack("<H", armazenamento.VERSAO_FORMATO + 1))
+    with pytest.raises(ValueError, match="versão"):
+        TabelaMapeada(str(arquivo))
+
+
+def test_magico_errado_e_rejeitado(arquivo):
+    _reescrever(arquivo, 0, b"XXXXXXXX")
+    with pytest.raises(ValueError):
+        TabelaMapeada(str(arquivo))
+
+
+@pytest.mark.parametrize("tamanho", [0, _TAMANHO_CABECALHO - 1, _TAMANHO_CABECALHO + 20])
+def test_arquivo_truncado_e_rejeitado(arquivo, tamanho):
+    arquivo.write_bytes(arquivo.read_bytes()[:tamanho])
+    with pytest.raises(ValueError):
+        TabelaMapeada(str(arquivo))
+
+
+def test_tabela_de_outro_tabuleiro_e_rejeitada(arquivo):
+    with pytest.raises(ValueError, match="outro tabuleiro"):
+        abrir_tabela(str(arquivo), 3, 3, list(range(1, 9)) + [0])
+    with pytest.raises(ValueError, match="outro tabuleiro"):
+        abrir_tabela(str(arquivo), 4, 4, list(range(16)))
+
+
+def test_cabecalho_tem_o_formato_documentado(arquivo):
+    magico, versao, largura, altura, metadados, dados, _ = struct.unpack_from(
+        _FORMATO_CABECALHO, arquivo.read_bytes()
+    )
+    assert (magico, versao, largura, altura, metadados, dados) == (
+        MAGICO,
+        armazenamento.VERSAO_FORMATO,
+        3,
+        3,
+        4,
+        len(DADOS),
+    )
@@ -0,0 +1,100 @@
+"""Testes do ARA* e do A* ponderado."""
+
+import pytest
+
+import heuristica
+from conftest import tabuleiros_soluveis
+from busca_a_estrela import buscar_solucao_a_estrela
+from busca_ara_estrela import buscar_solucao_ara_estrela
+from instrumentacao import ObservadorBusca
+from limites import PARADA_CANCELADA, PARADA_LIMITE_NOS, PARADA_SOLUCAO, LimitesBusca
+from permutacao import ranquear_permutacao
+
+
+class _VerificarSempre(ObservadorBusca):
+    """Faz a busca consultar os limites a cada nó expandido."""
+
+    intervalo = 1
+
+
+@pytest.mark.parametrize("tabuleiro", tabuleiros_soluveis(8, semente=5))
+def test_ara_estrela_termina_com_a_solucao_otima(tabuleiro, distancias):
+    otimo = distancias[ranquear_permutacao(tabuleiro)]
+    resultado = buscar_solucao_ara_estrela(tabuleiro)
+
+    assert resultado.motivo_parada == PARADA_SOLUCAO
+    assert resultado.profundidade_solucao == otimo
+    assert resultado.limite_subotimalidade == 1.0
+    for melhoria in resultado.melhorias:
+        assert len(melhoria.caminho) <= melhoria.limite_subotimalidade * otimo + 1e-9
+
+
+@pytest.mark.parametrize(
+    "tabuleiro, peso, metodo",
+    [
+        ([7, 0, 1, 6, 2, 5, 3, 8, 4], 2, "manhattan"),
+        ([7, 0, 1, 6, 2, 5, 3, 8, 4], 10, "manhattan"),
+        ([0, 3, 1, 7, 2, 6, 8, 5, 4], 5, "pecas_fora"),
+    ],
+)
+def test_melhorias_encurtam_o_caminho(tabuleiro, peso, metodo):
+    # Nestes tabuleiros um ancestral do objetivo melhora depois que o
+    # objetivo entra na tabela de pais
+    resultado = buscar_solucao_ara_estrela(
+        tabuleiro, metodo, peso_inicial=peso, decremento=0.5
+    )
+    comprimentos = [len(melhoria.caminho) for melhoria in resultado.melhorias]
+    assert comprimentos == sorted(set(comprimentos), reverse=True)
+    assert resultado.profundidade_solucao == len(resultado.caminho) == comprimentos[-1]
+
+
+@pytest.mark.parametrize("peso", [2, 1.5])
+@pytest.mark.parametrize("tabuleiro", tabuleiros_soluveis(8, semente=6))
+def test_a_estrela_ponderado_respeita_o_peso(tabuleiro, peso, distancias):
+    otimo = distancias[ranquear_permutacao(tabuleiro)]
+    resultado = buscar_solucao_a_estrela(tabuleiro, peso=peso)
+    assert otimo <= resultado.profundidade_solucao <= peso * otimo
+
+
+def test_interrupcao_na_primeira_rodada_guarda_a_solucao(monkeypatch):
+    # Com h = 0 todos os estados de profundidade 4 têm f = 4 e continuam
+    # sendo expandidos depois que o objetivo (profundidade 5) é gerado
+    monkeypatch.setitem(heuristica.FUNCOES_HEURISTICA, "zero", lambda tabuleiro, _: 0)
+    tabuleiro = [2, 8, 3, 1, 6, 4, 7, 0, 5]
+
+    completo = buscar_solucao_ara_estrela(tabuleiro, "zero")
+    fim_primeira_rodada = completo.melhorias[0].nos_expandidos
+
+    interrompidos = [
+        buscar_solucao_ara_estrela(
+            tabuleiro,
+            "zero",
+            limites=LimitesBusca(max_nos=max_nos),
+            observador=_VerificarSempre(),
+        )
+        for max_nos in range(1, fim_primeira_rodada)
+    ]
+    com_solucao = [resultado for resultado in interrompidos if resultado.solucao_encontrada]
+
+    assert com_solucao
+    for resultado in com_solucao:
+        assert resultado.motivo_parada == PARADA_SOLUCAO
+        assert resultado.motivo_interrupcao == PARADA_LIMITE_NOS
+        assert resultado.profundidade_solucao == 5
+        assert resultado.limite_subotimalidade * 4 >= 5
+        assert len(resultado.melhorias) == 1
+
+
+def test_progresso_cancela_a_busca():
+    chamadas = []
+
+    def progresso(nos_expandidos, tamanho_fronteira, profundidade):
+        chamadas.append(nos_expandidos)
+        return False
+
+    resultado = buscar_solucao_ara_estrela(
+        [5, 6, 7, 4, 0, 8, 3, 2, 1], progresso=progresso, peso_inicial=1
+    )
+    assert chamadas
+    assert not resultado.solucao_encontrada
+    assert resultado.motivo_parada == PARADA_CANCELADA
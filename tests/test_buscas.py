@@ -0,0 +1,79 @@
+"""Testes de otimalidade das buscas contra a busca em amplitude."""
+
+import pytest
+
+from conftest import chega_ao_objetivo, tabuleiros_soluveis
+from busca_a_estrela import buscar_solucao_a_estrela
+from busca_amplitude import buscar_solucao_amplitude
+from cache_solucoes import CacheSolucoes
+from especificacao import ESPECIFICACAO_PADRAO, obter_especificacao
+from heuristica import FUNCOES_HEURISTICA
+from limites import PARADA_INSOLUVEL, PARADA_SOLUCAO
+from permutacao import ranquear_permutacao
+from solucionador import ALGORITMOS, resolver
+
+# Algoritmos que garantem o caminho mais curto
+ALGORITMOS_OTIMOS = sorted(set(ALGORITMOS) - {"a_estrela_ponderado"})
+
+
+TABULEIROS = tabuleiros_soluveis(6, semente=11)
+
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS_OTIMOS)
+def test_algoritmos_encontram_o_caminho_mais_curto(algoritmo, distancias):
+    for tabuleiro in TABULEIROS:
+        resultado = resolver(tabuleiro, algoritmo, "manhattan")
+        assert resultado.motivo_parada == PARADA_SOLUCAO
+        assert len(resultado.caminho) == distancias[ranquear_permutacao(tabuleiro)]
+        assert resultado.profundidade_solucao == len(resultado.caminho)
+        assert chega_ao_objetivo(tabuleiro, resultado.caminho)
+
+
+@pytest.mark.parametrize("metodo", sorted(FUNCOES_HEURISTICA))
+def test_a_estrela_otimo_com_cada_heuristica(metodo, distancias):
+    for tabuleiro in TABULEIROS:
+        resultado = buscar_solucao_a_estrela(tabuleiro, metodo)
+        assert len(resultado.caminho) == distancias[ranquear_permutacao(tabuleiro)]
+        assert chega_ao_objetivo(tabuleiro, resultado.caminho)
+
+
+@pytest.mark.parametrize("opcoes", [{"fila": "heap"}, {"visitados": "compacto"}])
+def test_a_estrela_otimo_com_outras_estruturas(opcoes, distancias):
+    for tabuleiro in TABULEIROS:
+        resultado = buscar_solucao_a_estrela(tabuleiro, **opcoes)
+        assert len(resultado.caminho) == distancias[ranquear_permutacao(tabuleiro)]
+
+
+def test_a_estrela_igual_a_amplitude_em_tabuleiro_nao_quadrado():
+    especificacao = obter_especificacao(3, 2)
+    for tabuleiro in tabuleiros_soluveis(10, 12, especificacao):
+        referencia = buscar_solucao_amplitude(tabuleiro, especificacao)
+        resultado = buscar_solucao_a_estrela(tabuleiro, "conflito_linear", especificacao)
+        assert len(resultado.caminho) == referencia.profundidade_solucao
+        assert chega_ao_objetivo(tabuleiro, resultado.caminho, especificacao)
+
+
+@pytest.mark.parametrize("algoritmo", sorted(ALGORITMOS))
+def test_algoritmos_rejeitam_insoluvel_sem_expandir(algoritmo):
+    resultado = resolver([2, 1, 3, 8, 0, 4, 7, 6, 5], algoritmo)
+    assert not resultado.soluvel
+    assert resultado.motivo_parada == PARADA_INSOLUVEL
+    assert resultado.nos_expandidos == 0
+
+
+@pytest.mark.parametrize("algoritmo", sorted(ALGORITMOS))
+def test_algoritmos_no_objetivo(algoritmo):
+    resultado = resolver(list(ESPECIFICACAO_PADRAO.objetivo), algoritmo)
+    assert resultado.solucao_encontrada
+    assert resultado.caminho == []
+
+
+def test_cache_nao_responde_tabuleiro_invalido():
+    cache = CacheSolucoes(1024 * 1024)
+    assert resolver([2, 8, 3, 1, 6, 4, 7, 0, 5], cache=cache).solucao_encontrada
+    assert resolver([2, 8, 3, 1, 6, 4, 7, 0, 5], cache=cache).nos_expandidos == 0
+    # 130 = 2 | (8 << 4): o código compacto é o do tabuleiro acima
+    with pytest.raises(ValueError):
+        resolver([130, 0, 3, 1, 6, 4, 7, 0, 5], cache=cache)
+    insoluvel = resolver([2, 1, 3, 8, 0, 4, 7, 6, 5], cache=cache)
+    assert insoluvel.motivo_parada == PARADA_INSOLUVEL
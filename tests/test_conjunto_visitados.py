@@ -0,0 +1,98 @@
+"""Testes das tabelas compactas de estados visitados."""
+
+import random
+
+import pytest
+
+from busca_amplitude import buscar_solucao_amplitude
+from conjunto_visitados import (
+    TIPO_DENSO,
+    TIPO_ENDERECAMENTO,
+    VALOR_MAXIMO_PADRAO,
+    ConjuntoBits,
+    criar_tabela_pais,
+    medidor_memoria,
+)
+from especificacao import ESPECIFICACAO_PADRAO, obter_especificacao
+from estado_puzzle import compactar_tabuleiro
+from limites import PARADA_LIMITE_MEMORIA, PARADA_SOLUCAO, LimitesBusca
+
+
+def _codigos(especificacao, quantidade, semente):
+    gerador = random.Random(semente)
+    codigos = set()
+    while len(codigos) < quantidade:
+        tabuleiro = list(range(especificacao.tamanho))
+        gerador.shuffle(tabuleiro)
+        codigos.add(compactar_tabuleiro(tabuleiro, especificacao.bits_por_peca))
+    return list(codigos)
+
+
+@pytest.mark.parametrize(
+    "tipo, dimensoes", [(TIPO_DENSO, (3, 3)), (TIPO_ENDERECAMENTO, (3, 3)), (TIPO_ENDERECAMENTO, (4, 4))]
+)
+def test_tabela_compacta_se_comporta_como_dicionario(tipo, dimensoes):
+    especificacao = obter_especificacao(*dimensoes)
+    tabela = criar_tabela_pais(especificacao, tipo)
+    referencia = {}
+    gerador = random.Random(1)
+
+    codigos = _codigos(especificacao, 5000, semente=2)
+    for codigo in codigos:
+        valor = gerador.randrange(0xFFFE)
+        tabela[codigo] = valor
+        referencia[codigo] = valor
+    for codigo in codigos[::3]:
+        tabela[codigo] = referencia[codigo] = 7
+
+    assert len(tabela) == len(referencia)
+    for codigo, valor in referencia.items():
+        assert codigo in tabela
+        assert tabela[codigo] == valor
+    ausente = _codigos(especificacao, 1, semente=99)[0]
+    if ausente not in referencia:
+        assert ausente not in tabela
+        assert tabela.get(ausente) is None
+        with pytest.raises(KeyError):
+            tabela[ausente]
+
+
+@pytest.mark.parametrize("tipo", [TIPO_DENSO, TIPO_ENDERECAMENTO])
+def test_valor_acima_do_maximo_e_rejeitado(tipo):
+    tabela = criar_tabela_pais(ESPECIFICACAO_PADRAO, tipo)
+    codigo = ESPECIFICACAO_PADRAO.codigo_objetivo
+    tabela[codigo] = VALOR_MAXIMO_PADRAO
+    assert tabela[codigo] == VALOR_MAXIMO_PADRAO
+    with pytest.raises(ValueError):
+        tabela[codigo] = VALOR_MAXIMO_PADRAO + 1
+    assert tabela[codigo] == VALOR_MAXIMO_PADRAO
+
+
+def test_conjunto_bits():
+    conjunto = ConjuntoBits(ESPECIFICACAO_PADRAO)
+    codigos = _codigos(ESPECIFICACAO_PADRAO, 2000, semente=3)
+    assert all(conjunto.adicionar(codigo) for codigo in codigos)
+    assert not any(conjunto.adicionar(codigo) for codigo in codigos)
+    assert len(conjunto) == len(codigos)
+    assert all(codigo in conjunto for codigo in codigos)
+    assert conjunto.memoria == (362880 + 7) // 8
+
+
+def test_medidor_memoria():
+    assert medidor_memoria({}) is None
+    tabela = criar_tabela_pais(ESPECIFICACAO_PADRAO, TIPO_DENSO, valor_maximo=200)
+    assert medidor_memoria(tabela)() == 362880
+
+
+def test_limite_de_memoria_usa_a_memoria_da_tabela_compacta():
+    tabuleiro = [5, 6, 7, 4, 0, 8, 3, 2, 1]
+    limites = LimitesBusca(max_memoria=8 * 1024 * 1024)
+
+    # O dicionário passa do limite: cerca de 110 bytes por estado
+    assert buscar_solucao_amplitude(tabuleiro, limites=limites).motivo_parada == (
+        PARADA_LIMITE_MEMORIA
+    )
+    # O vetor denso ocupa 362.880 bytes, independente dos estados guardados
+    resultado = buscar_solucao_amplitude(tabuleiro, limites=limites, visitados="compacto")
+    assert resultado.motivo_parada == PARADA_SOLUCAO
+    assert resultado.profundidade_solucao == 30
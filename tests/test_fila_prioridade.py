@@ -0,0 +1,76 @@
+"""Testes das filas de prioridade da fronteira."""
+
+import random
+
+import pytest
+
+from fila_prioridade import FilaBaldes, FilaHeap, criar_fila
+
+
+def test_baldes_menor_f_e_maior_g_primeiro():
+    fila = FilaBaldes()
+    for f, g, item in [(5, 1, "a"), (3, 0, "b"), (5, 4, "c"), (3, 2, "d"), (4, 1, "e")]:
+        fila.inserir(f, g, item)
+    retirados = [fila.retirar() for _ in range(len(fila))]
+    assert retirados == [(3, 2, "d"), (3, 0, "b"), (4, 1, "e"), (5, 4, "c"), (5, 1, "a")]
+
+
+def test_baldes_mesmo_f_e_g_sai_o_ultimo_inserido():
+    fila = FilaBaldes()
+    for item in "abc":
+        fila.inserir(2, 1, item)
+    assert [fila.retirar()[2] for _ in range(3)] == ["c", "b", "a"]
+
+
+def test_baldes_aceita_f_abaixo_do_minimo_atual():
+    fila = FilaBaldes()
+    fila.inserir(6, 0, "a")
+    assert fila.retirar() == (6, 0, "a")
+    fila.inserir(8, 0, "b")
+    fila.inserir(4, 0, "c")
+    assert fila.retirar() == (4, 0, "c")
+    assert fila.retirar() == (8, 0, "b")
+
+
+def test_baldes_e_heap_retiram_a_mesma_sequencia_de_f():
+    gerador = random.Random(3)
+    baldes, heap = FilaBaldes(), FilaHeap()
+    f_baldes, f_heap = [], []
+    for _ in range(2000):
+        if gerador.random() < 0.6 or not baldes:
+            g = gerador.randrange(20)
+            f = g + gerador.randrange(10)
+            baldes.inserir(f, g, None)
+            heap.inserir(f, g, None)
+        else:
+            f_baldes.append(baldes.retirar()[0])
+            f_heap.append(heap.retirar()[0])
+        assert len(baldes) == len(heap)
+    while baldes:
+        f_baldes.append(baldes.retirar()[0])
+        f_heap.append(heap.retirar()[0])
+    assert f_baldes == f_heap
+
+
+def test_heap_mesmo_f_na_ordem_de_insercao():
+    fila = FilaHeap()
+    fila.inserir(1.5, 0, "a")
+    fila.inserir(1.5, 3, "b")
+    fila.inserir(0.5, 1, "c")
+    assert [fila.retirar() for _ in range(3)] == [(0.5, 1, "c"), (1.5, 0, "a"), (1.5, 3, "b")]
+
+
+@pytest.mark.parametrize("classe", [FilaBaldes, FilaHeap])
+def test_retirar_de_fila_vazia(classe):
+    fila = classe()
+    fila.inserir(1, 0, "a")
+    fila.retirar()
+    with pytest.raises(IndexError):
+        fila.retirar()
+
+
+def test_criar_fila():
+    assert isinstance(criar_fila(), FilaBaldes)
+    assert isinstance(criar_fila("heap"), FilaHeap)
+    with pytest.raises(ValueError):
+        criar_fila("fibonacci")
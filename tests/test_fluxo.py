@@ -0,0 +1,72 @@
+"""Testes da leitura de tabuleiros da linha de comando em JSON lines."""
+
+import io
+import json
+
+import pytest
+
+from especificacao import obter_especificacao
+from fluxo import _especificacao_do_objetivo, ler_tabuleiros, resolver_fluxo
+
+LINHAS_INVALIDAS = [
+    "[1, 2, 3, 8, 0, 4, 7, 6, 6]",  # peça repetida
+    "[0, 1, 2, 3, 4, 5, 6, 7, 99]",  # peça fora do intervalo
+    "[1, 2, 3]",  # número de posições que não é quadrado
+    "[1, 2, 3, 8, 0, 4, 7, 6, 5.0]",  # valor que não é inteiro
+    "[true, false, 2, 3]",  # booleanos, que o Python trata como 1 e 0
+    '{"id": 1}',  # sem tabuleiro
+    "nao e json",
+]
+
+
+def _ler(texto, especificacao=None):
+    erros = {}
+    lidos = list(ler_tabuleiros(io.StringIO(texto), erros.__setitem__, especificacao))
+    return lidos, erros
+
+
+def test_linhas_validas_sao_lidas():
+    lidos, erros = _ler(
+        '[2, 8, 3, 1, 6, 4, 7, 0, 5]\n\n{"id": "a", "tabuleiro": [1, 2, 3, 0]}\n'
+    )
+    assert erros == {}
+    assert lidos == [
+        (1, None, [2, 8, 3, 1, 6, 4, 7, 0, 5]),
+        (3, "a", [1, 2, 3, 0]),
+    ]
+
+
+@pytest.mark.parametrize("linha", LINHAS_INVALIDAS)
+def test_linha_malformada_vira_erro(linha):
+    lidos, erros = _ler(linha + "\n")
+    assert lidos == []
+    assert list(erros) == [1]
+
+
+def test_tamanho_diferente_da_especificacao_vira_erro():
+    especificacao = obter_especificacao(3, 2, (1, 2, 3, 4, 5, 0))
+    lidos, erros = _ler("[1, 2, 3, 4, 0, 5]\n[1, 2, 3, 8, 0, 4, 7, 6, 5]\n", especificacao)
+    assert [linha for linha, _, _ in lidos] == [1]
+    assert list(erros) == [2]
+
+
+def test_objetivo_nao_quadrado_usa_a_largura():
+    especificacao = _especificacao_do_objetivo([1, 2, 3, 4, 5, 0], 3)
+    assert (especificacao.largura, especificacao.altura) == (3, 2)
+    with pytest.raises(ValueError):
+        _especificacao_do_objetivo([1, 2, 3, 4, 5, 0], 4)
+    with pytest.raises(ValueError):
+        _especificacao_do_objetivo([1, 2, 3, 4, 5, 0], None)
+    with pytest.raises(ValueError):
+        _especificacao_do_objetivo([True, 2, 3, False], None)
+
+
+def test_erros_de_leitura_saem_na_ordem_da_entrada():
+    entrada = io.StringIO("".join(linha + "\n" for linha in LINHAS_INVALIDAS))
+    saida = io.StringIO()
+    escritos, com_erro = resolver_fluxo(entrada, saida, processos=1)
+    registros = [json.loads(linha) for linha in saida.getvalue().splitlines()]
+    assert escritos == com_erro == len(LINHAS_INVALIDAS)
+    assert [registro["linha"] for registro in registros] == list(
+        range(1, len(LINHAS_INVALIDAS) + 1)
+    )
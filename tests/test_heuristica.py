@@ -0,0 +1,83 @@
+"""Testes do cálculo incremental das heurísticas."""
+
+import random
+
+import pytest
+
+from especificacao import ESPECIFICACAO_PADRAO, obter_especificacao
+from estado_puzzle import EstadoCompacto, EstadoPuzzle
+from heuristica import calcular_heuristica
+from jogo_oito import JogoOito
+
+METODOS_INCREMENTAIS = ("manhattan", "pecas_fora", "conflito_linear", "caminhada")
+
+
+def _tabuleiros_aleatorios(especificacao, quantidade, semente):
+    """Tabuleiros alcançáveis a partir do objetivo por passeios aleatórios."""
+    gerador = random.Random(semente)
+    jogo = JogoOito(especificacao.objetivo, especificacao)
+    tabuleiros = []
+    for _ in range(quantidade):
+        tabuleiro = list(especificacao.objetivo)
+        for _ in range(gerador.randint(1, 40)):
+            indice_vazio = tabuleiro.index(0)
+            movimento, _ = gerador.choice(jogo.vizinhos[indice_vazio])
+            tabuleiro = jogo.mover(tabuleiro, movimento)
+        tabuleiros.append(tabuleiro)
+    return tabuleiros
+
+
+def test_conflito_linear_incremental_nao_altera_tabuleiro_filho():
+    pai = [1, 2, 3, 8, 0, 4, 7, 6, 5]
+    estado = EstadoPuzzle([1, 2, 3, 8, 6, 4, 7, 0, 5])
+    chave = hash(estado)
+
+    valor = calcular_heuristica(
+        estado, "conflito_linear", calcular_heuristica(EstadoPuzzle(pai), "conflito_linear"), 4
+    )
+
+    assert estado.tabuleiro == [1, 2, 3, 8, 6, 4, 7, 0, 5]
+    assert hash(estado) == chave
+    assert valor == calcular_heuristica(
+        EstadoPuzzle([1, 2, 3, 8, 6, 4, 7, 0, 5]), "conflito_linear"
+    )
+
+
+@pytest.mark.parametrize("metodo", METODOS_INCREMENTAIS)
+@pytest.mark.parametrize("dimensoes", [(3, 3), (4, 4), (3, 2)])
+def test_incremental_igual_ao_calculo_completo(metodo, dimensoes):
+    especificacao = obter_especificacao(*dimensoes)
+    jogo = JogoOito(especificacao.objetivo, especificacao)
+
+    for tabuleiro in _tabuleiros_aleatorios(especificacao, 30, semente=hash(dimensoes)):
+        pai = EstadoPuzzle(tabuleiro, especificacao=especificacao)
+        heuristica_pai = calcular_heuristica(pai, metodo)
+        indice_vazio_pai = tabuleiro.index(0)
+
+        for filho in jogo.gerar_filhos(pai):
+            original = list(filho.tabuleiro)
+            completo = calcular_heuristica(
+                EstadoPuzzle(original, especificacao=especificacao), metodo
+            )
+
+            assert (
+                calcular_heuristica(filho, metodo, heuristica_pai, indice_vazio_pai)
+                == completo
+            )
+            assert filho.tabuleiro == original
+
+            compacto = EstadoCompacto.de_tabuleiro(original, especificacao)
+            codigo = compacto.codigo
+            assert (
+                calcular_heuristica(compacto, metodo, heuristica_pai, indice_vazio_pai)
+                == completo
+            )
+            assert compacto.codigo == codigo
+
+
+def test_calculo_completo_nao_altera_o_tabuleiro():
+    tabuleiro = [2, 8, 3, 1, 6, 4, 7, 0, 5]
+    estado = EstadoPuzzle(tabuleiro, especificacao=ESPECIFICACAO_PADRAO)
+    for metodo in METODOS_INCREMENTAIS:
+        calcular_heuristica(estado, metodo)
+        assert estado.tabuleiro == tabuleiro
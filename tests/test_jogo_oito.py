@@ -0,0 +1,85 @@
+"""Testes da validação e do teste de solubilidade dos tabuleiros."""
+
+import itertools
+import math
+from collections import deque
+
+import pytest
+
+from busca_a_estrela import buscar_solucao_a_estrela
+from busca_amplitude import buscar_solucao_amplitude
+from busca_amplitude_vetorizada import buscar_solucao_amplitude_vetorizada
+from busca_ara_estrela import buscar_solucao_ara_estrela
+from busca_bidirecional import buscar_solucao_bidirecional
+from busca_ida_estrela import buscar_solucao_ida_estrela
+from especificacao import obter_especificacao
+from jogo_oito import JogoOito
+from tabela_distancias import buscar_solucao_tabela
+
+TABULEIROS_INVALIDOS = [
+    [1, 2, 3, 8, 0, 4, 7, 6, 6],  # peça repetida (paridade passa)
+    [0, 1, 2, 3, 4, 5, 6, 7, 99],  # peça fora do intervalo
+    [1, 2, 3, 8, 0, 4, 7, 6],  # tamanho errado para 3x3
+    [1, 1, 3, 8, 0, 4, 7, 6, 5],
+]
+
+BUSCAS = [
+    buscar_solucao_amplitude,
+    buscar_solucao_amplitude_vetorizada,
+    buscar_solucao_a_estrela,
+    buscar_solucao_ara_estrela,
+    buscar_solucao_bidirecional,
+    buscar_solucao_ida_estrela,
+]
+
+
+def _alcancaveis(especificacao):
+    """Todos os tabuleiros alcançáveis a partir do objetivo (busca em amplitude)."""
+    jogo = JogoOito(especificacao.objetivo, especificacao)
+    inicio = tuple(especificacao.objetivo)
+    vistos = {inicio}
+    fila = deque([inicio])
+    while fila:
+        tabuleiro = fila.popleft()
+        indice_vazio = tabuleiro.index(0)
+        for _, indice_troca in jogo.vizinhos[indice_vazio]:
+            filho = list(tabuleiro)
+            filho[indice_vazio] = filho[indice_troca]
+            filho[indice_troca] = 0
+            filho = tuple(filho)
+            if filho not in vistos:
+                vistos.add(filho)
+                fila.append(filho)
+    return vistos
+
+
+@pytest.mark.parametrize("dimensoes", [(3, 2), (2, 3), (3, 3)])
+def test_eh_soluvel_igual_a_alcancabilidade(dimensoes):
+    especificacao = obter_especificacao(*dimensoes)
+    jogo = JogoOito(especificacao.objetivo, especificacao)
+    alcancaveis = _alcancaveis(especificacao)
+
+    # Exatamente metade das permutações é alcançável
+    assert len(alcancaveis) * 2 == math.factorial(especificacao.tamanho)
+    for permutacao in itertools.permutations(range(especificacao.tamanho)):
+        assert jogo.eh_soluvel(list(permutacao)) == (permutacao in alcancaveis)
+
+
+def test_validar_estado():
+    jogo = JogoOito([1, 2, 3, 8, 0, 4, 7, 6, 5])
+    assert jogo.validar_estado([1, 2, 3, 8, 0, 4, 7, 6, 5])
+    for tabuleiro in TABULEIROS_INVALIDOS:
+        assert not jogo.validar_estado(tabuleiro)
+        with pytest.raises(ValueError):
+            jogo.exigir_estado_valido(tabuleiro)
+
+
+@pytest.mark.parametrize("busca", BUSCAS + [buscar_solucao_tabela])
+@pytest.mark.parametrize("tabuleiro", TABULEIROS_INVALIDOS)
+def test_buscas_rejeitam_tabuleiro_invalido(busca, tabuleiro):
+    especificacao = obter_especificacao(3, 3)
+    with pytest.raises(ValueError):
+        if busca is buscar_solucao_tabela:
+            busca(tabuleiro)
+        else:
+            busca(tabuleiro, especificacao=especificacao)
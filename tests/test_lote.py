@@ -0,0 +1,33 @@
+"""Testes da preparação dos processos trabalhadores do lote."""
+
+import pytest
+
+import lote
+from especificacao import ESPECIFICACAO_PADRAO
+
+
+def _preparar_com_falha(monkeypatch, erro):
+    def preparar_tabelas(*argumentos):
+        raise erro
+
+    monkeypatch.setattr(lote, "_configuracao", {})
+    monkeypatch.setattr(lote, "preparar_tabelas", preparar_tabelas)
+    lote._inicializar_trabalhador(
+        "a_estrela", "manhattan", None, None, ESPECIFICACAO_PADRAO, None
+    )
+
+
+def test_tabela_ausente_volta_no_resultado_dos_tabuleiros_afetados(monkeypatch):
+    _preparar_com_falha(monkeypatch, FileNotFoundError("banco.bin"))
+    tres, dois = lote._resolver_bloco(
+        [(0, [2, 8, 3, 1, 6, 4, 7, 0, 5]), (1, [1, 2, 0, 3])]
+    )
+    assert tres.resultado is None
+    assert "banco.bin" in tres.erro
+    assert dois.erro is None
+    assert dois.resultado.solucao_encontrada
+
+
+def test_erro_inesperado_na_preparacao_nao_e_escondido(monkeypatch):
+    with pytest.raises(RuntimeError):
+        _preparar_com_falha(monkeypatch, RuntimeError("defeito"))
@@ -0,0 +1,117 @@
+"""Testes do ranqueamento de permutações e arranjos."""
+
+import itertools
+import random
+
+import pytest
+
+from estado_puzzle import compactar_tabuleiro
+from permutacao import (
+    FATORIAIS,
+    contar_arranjos,
+    desranquear_arranjo,
+    desranquear_arranjo_myrvold_ruskey,
+    desranquear_myrvold_ruskey,
+    desranquear_permutacao,
+    ranquear_arranjo,
+    ranquear_arranjo_myrvold_ruskey,
+    ranquear_codigo,
+    ranquear_myrvold_ruskey,
+    ranquear_permutacao,
+)
+
+
+@pytest.mark.parametrize("n", [1, 2, 4, 6])
+def test_posicao_lexicografica_de_todas_as_permutacoes(n):
+    for esperado, permutacao in enumerate(itertools.permutations(range(n))):
+        assert ranquear_permutacao(permutacao) == esperado
+        assert desranquear_permutacao(esperado, n) == list(permutacao)
+
+
+@pytest.mark.parametrize("n", [9, 12, 16])
+def test_ida_e_volta_em_permutacoes_grandes(n):
+    gerador = random.Random(n)
+    for _ in range(200):
+        permutacao = list(range(n))
+        gerador.shuffle(permutacao)
+        posicao = ranquear_permutacao(permutacao)
+        assert 0 <= posicao < FATORIAIS[n]
+        assert desranquear_permutacao(posicao, n) == permutacao
+        codigo = compactar_tabuleiro(permutacao, max(4, (n - 1).bit_length()))
+        assert ranquear_codigo(codigo, n, max(4, (n - 1).bit_length())) == posicao
+
+
+@pytest.mark.parametrize("n, k", [(5, 2), (6, 3), (9, 4), (7, 7)])
+def test_arranjos_sao_uma_bijecao(n, k):
+    posicoes = set()
+    for arranjo in itertools.permutations(range(n), k):
+        posicao = ranquear_arranjo(arranjo, n)
+        assert desranquear_arranjo(posicao, n, k) == list(arranjo)
+        posicoes.add(posicao)
+    assert posicoes == set(range(contar_arranjos(n, k)))
+
+
+@pytest.mark.parametrize("n", [1, 3, 6])
+def test_myrvold_ruskey_e_uma_bijecao(n):
+    posicoes = set()
+    for permutacao in itertools.permutations(range(n)):
+        posicao = ranquear_myrvold_ruskey(permutacao)
+        assert desranquear_myrvold_ruskey(posicao, n) == list(permutacao)
+        posicoes.add(posicao)
+    assert posicoes == set(range(FATORIAIS[n]))
+
+
+@pytest.mark.parametrize("n, k", [(6, 2), (7, 3), (9, 5)])
+def test_arranjos_myrvold_ruskey_sao_uma_bijecao(n, k):
+    posicoes = set()
+    for arranjo in itertools.permutations(range(n), k):
+        posicao = ranquear_arranjo_myrvold_ruskey(arranjo, n)
+        assert desranquear_arranjo_myrvold_ruskey(posicao, n, k) == list(arranjo)
+        posicoes.add(posicao)
+    assert posicoes == set(range(contar_arranjos(n, k)))
+
+
+class TestLote:
+    """Funções em lote, comparadas com as versões de um item (exigem NumPy)."""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        self.np = pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("n", [4, 9, 16, 20])
+    def test_ranquear_e_desranquear_lote(self, n):
+        from permutacao import desranquear_lote, ranquear_lote
+
+        gerador = random.Random(n)
+        linhas = []
+        for _ in range(300):
+            permutacao = list(range(n))
+            gerador.shuffle(permutacao)
+            linhas.append(permutacao)
+        matriz = self.np.array(linhas)
+
+        posicoes = ranquear_lote(matriz)
+        assert posicoes.tolist() == [ranquear_permutacao(linha) for linha in linhas]
+        assert desranquear_lote(posicoes, n).tolist() == linhas
+
+    def test_lote_rejeita_posicoes_fora_do_int64(self):
+        from permutacao import desranquear_lote, ranquear_arranjos_lote, ranquear_lote
+
+        with pytest.raises(ValueError):
+            ranquear_lote(self.np.array([list(range(21))]))
+        with pytest.raises(ValueError):
+            desranquear_lote(self.np.array([0]), 25)
+        with pytest.raises(ValueError):
+            ranquear_arranjos_lote(self.np.array([list(range(21))]), 25)
+
+    @pytest.mark.parametrize("n, k", [(9, 4), (16, 6)])
+    def test_ranquear_e_desranquear_arranjos_lote(self, n, k):
+        from permutacao import desranquear_arranjos_lote, ranquear_arranjos_lote
+
+        gerador = random.Random(n * k)
+        linhas = [gerador.sample(range(n), k) for _ in range(300)]
+        matriz = self.np.array(linhas)
+
+        posicoes = ranquear_arranjos_lote(matriz, n)
+        assert posicoes.tolist() == [ranquear_arranjo(linha, n) for linha in linhas]
+        assert desranquear_arranjos_lote(posicoes, n, k).tolist() == linhas
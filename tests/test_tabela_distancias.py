@@ -0,0 +1,32 @@
+"""Testes da solução pela tabela de distâncias do 3x3."""
+
+from conftest import chega_ao_objetivo, tabuleiros_soluveis
+from busca_amplitude import buscar_solucao_amplitude
+from especificacao import obter_especificacao
+from solucionador import resolver
+from tabela_distancias import buscar_solucao_tabela
+
+
+def test_tabela_da_o_caminho_mais_curto(distancias):
+    for tabuleiro in tabuleiros_soluveis(20, semente=3):
+        resultado = buscar_solucao_tabela(tabuleiro, distancias)
+        referencia = buscar_solucao_amplitude(tabuleiro)
+        assert len(resultado.caminho) == referencia.profundidade_solucao
+        assert chega_ao_objetivo(tabuleiro, resultado.caminho)
+
+
+def test_tabela_marca_insoluvel(distancias):
+    resultado = buscar_solucao_tabela([2, 1, 3, 8, 0, 4, 7, 6, 5], distancias)
+    assert not resultado.soluvel
+
+
+def test_outros_tabuleiros_usam_a_estrela_com_a_heuristica_pedida():
+    especificacao = obter_especificacao(4, 4)
+    tabuleiro = list(especificacao.objetivo)
+    tabuleiro[14], tabuleiro[15] = 0, tabuleiro[14]
+
+    # Não depende dos bancos de padrões do 4x4, que podem não ter sido gerados
+    for com_especificacao in (None, especificacao):
+        resultado = resolver(tabuleiro, "tabela", "manhattan", com_especificacao)
+        assert len(resultado.caminho) == 1
+        assert chega_ao_objetivo(tabuleiro, resultado.caminho, especificacao)